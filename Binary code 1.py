@@ -8,6 +8,7 @@ via any medium, is strictly prohibited.
 """
 from manim import *
 import numpy as np
+from matra_meru import matra_beats, matra_count, matra_uddishta
 
 class Scene2_TheLoneliness(ThreeDScene):
     def construct(self):
@@ -66,6 +67,18 @@ class Scene2_TheLoneliness(ThreeDScene):
 
         self.play(Write(num_1), Write(num_2), Write(num_3))
         self.play(FadeIn(labels))
+
+        # Matra-Meru: kul beats, aur itne beats ke patterns mein Na-Ta-To ki row
+        pattern = "LGG"
+        beats = matra_beats(pattern)
+        matra_info = Text(
+            "%s = %d Matra  |  Row %d of %d" % (
+                " + ".join("2" if c == "G" else "1" for c in pattern),
+                beats, matra_uddishta(pattern), matra_count(beats)
+            ),
+            font_size=24, color=WHITE
+        ).next_to(labels, DOWN, buff=0.4)
+        self.play(FadeIn(matra_info, shift=UP * 0.2))
         self.wait(2)
 
         # --- PART 3: THE SNAKE (BHUJANGA PRAYATA) IN 3D ---
@@ -73,7 +86,7 @@ class Scene2_TheLoneliness(ThreeDScene):
         self.move_camera(phi=60 * DEGREES, theta=-45 * DEGREES, zoom=0.8, run_time=2)
         
         # Move current 2D elements to the top left to make space
-        flat_group = VGroup(syllables, beats_group, num_1, num_2, num_3, labels)
+        flat_group = VGroup(syllables, beats_group, num_1, num_2, num_3, labels, matra_info)
         self.play(flat_group.animate.to_corner(UL).scale(0.6))
 
         # Create the Sine Wave (The Snake Motion)
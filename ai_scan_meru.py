@@ -7,6 +7,10 @@ Unauthorized copying, modification, distribution, or use of this file,
 via any medium, is strictly prohibited.
 """
 from manim import *
+from meru_engine import meru_rows, meru_find
+from meru_mod import meru_mod_mobject
+from glyph_cache import cached_text
+from timeline import Timeline
 import numpy as np
 import random
 
@@ -20,14 +24,7 @@ class AIScanMeru(ThreeDScene):
 
         # --- 2. GENERATE MERU PRASTARA DATA ---
         num_rows = 11
-        meru_data = []
-        for n in range(num_rows):
-            row = [1]
-            if meru_data:
-                last_row = meru_data[-1]
-                row.extend([sum(pair) for pair in zip(last_row, last_row[1:])])
-                row.append(1)
-            meru_data.append(row)
+        meru_data = list(meru_rows(num_rows))
 
         # --- 3. BUILD HOLOGRAPHIC NUMBERS & SCAN BOXES ---
         mountain_rows = VGroup()
@@ -43,7 +40,7 @@ class AIScanMeru(ThreeDScene):
                 
                 # Sharp Sci-Fi Text
                 txt_color = WHITE if val == 1 else "#00FFFF" # Neon Cyan
-                num = Text(str(val), font="Consolas", font_size=32, color=txt_color, weight=BOLD)
+                num = cached_text(str(val), font="Consolas", font_size=32, color=txt_color, weight=BOLD)
                 num.move_to(np.array([x_pos, y_pos, 0]))
                 row_group.add(num)
             
@@ -110,10 +107,16 @@ class AIScanMeru(ThreeDScene):
 
         # --- 7. THE HIGH-TECH AI SCAN (RANDOM TRANSPARENT BOXES) ---
         # "ki hazaron lines mein se yeh kaunsi row ka hai?"
+        target_value = 120
+        hits = meru_find(target_value, num_rows=num_rows) # Asli (row, position) jahan yeh number hai
+        target_row = hits[0][0]
+
         scan_colors = ["#FF00FF", "#FFFF00", "#00FF00", "#0088FF"] # Pink, Yellow, Neon Green, Blue
         
         # Fast rapid-fire random scans to simulate AI searching
+        # Saare flashes ek Timeline mein: 36 chhote play ki jagah ek hi play
         num_scans = 18 # How many rapid scans
+        scan = Timeline()
         for _ in range(num_scans):
             # Pick a random row (excluding the very top '1' for better visual effect)
             rand_idx = random.randint(1, num_rows - 1)
@@ -121,17 +124,28 @@ class AIScanMeru(ThreeDScene):
             target_box = scan_boxes[rand_idx]
             
             # Flash the box ON
-            self.play(
-                target_box.animate.set_color(rand_color).set_stroke(rand_color, 4).set_fill(rand_color, 0.4).set_opacity(1),
-                run_time=0.08, # Extremely fast!
-                rate_func=linear
+            scan.key(
+                target_box,
+                lambda m: m.set_color(rand_color).set_stroke(rand_color, 4).set_fill(rand_color, 0.4).set_opacity(1),
+                0.08 # Extremely fast!
             )
             # Flash the box OFF
-            self.play(
-                target_box.animate.set_opacity(0),
-                run_time=0.08,
-                rate_func=linear
-            )
+            scan.key(target_box, lambda m: m.set_opacity(0), 0.08)
+
+        self.play(scan.compile())
+
+        # --- 8. LOCK-ON: SCAN LANDS ON THE TRUE ROW ---
+        lock_color = "#00FF00"
+        self.play(
+            scan_boxes[target_row].animate.set_color(lock_color).set_stroke(lock_color, 4).set_fill(lock_color, 0.4).set_opacity(1),
+            *[Indicate(mountain_rows[n][k], color=lock_color, scale_factor=1.4) for n, k in hits],
+            run_time=0.8
+        )
+
+        # --- 9. ZOOM OUT: HAZARON ROWS ---
+        # Text mountain ki jagah 1024 rows ki ek image (C(n, k) mod 2)
+        raster = meru_mod_mobject(1024, p=2, colors=("#00FFFF",), height=7)
+        self.play(FadeOut(full_mountain), FadeIn(raster, scale=0.1), run_time=1.5)
 
-        # --- 8. FINAL HOLD ---
+        # --- 10. FINAL HOLD ---
         self.wait(2)
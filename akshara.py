@@ -0,0 +1,180 @@
+"""
+Project:  Binary Decode / code Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize). All Rights Reserved.
+
+This code is proprietary and confidential. 
+Unauthorized copying, modification, distribution, or use of this file, 
+via any medium, is strictly prohibited.
+"""
+import re
+import unicodedata
+
+# --- Akshara Segmentation + Laghu / Guru ---
+# Shloka ki line do (Devanagari ya IAST), wapas milte hain akshar aur unka
+# L/G pattern:
+#   laghu_guru("न तातो न माता न बन्धुर्न दाता")
+#   -> ["न", "ता", "तो", "न", "मा", "ता", "न", "ब", "न्धु", "र्न", "दा", "ता"], "LGGLGGLGGLGG"
+#
+# Guru (G) ke niyam:
+#   1. Deergha swar (आ ई ऊ ॠ ॡ ए ऐ ओ औ)
+#   2. Anusvara ya visarga ke saath (ं ः), chandrabindu nahi
+#   3. Agle akshar ki shuruaat mein samyukta vyanjan (conjunct), word ke paar bhi
+#   4. Word ke ant ka halant vyanjan isi akshar ko band kare
+# Baaki sab Laghu (L).
+
+LAGHU = "L"
+GURU = "G"
+
+# ---------------------------------------------------------
+# DEVANAGARI GRAPHEME TABLES
+# ---------------------------------------------------------
+_CONSONANT = "क-हक़-य़ॸ-ॿ"
+_NUKTA = "़"
+_VIRAMA = "्"
+_INDEP_VOWEL = "ऄ-औॠॡ"
+_MATRA = "ा-ौॎॏॢॣ"
+_MODIFIER = "ऀ-ः"
+
+_LONG_VOWELS = set("आईऊॠॡएऐओऔ" "ाीूॄॣेैोौ")
+
+_DEVA_CHAR = re.compile("[ऀ-ॿ]")
+_DEVA_AKSHARA = re.compile(
+    "(?P<onset>(?:[{c}]{n}?{v})*[{c}]{n}?)(?P<vowel>[{m}]|{v})?(?P<mods>[{x}]*)"
+    "|(?P<indep>[{i}])(?P<imods>[{x}]*)".format(
+        c=_CONSONANT, n=_NUKTA, v=_VIRAMA, m=_MATRA, x=_MODIFIER, i=_INDEP_VOWEL
+    )
+)
+
+# ---------------------------------------------------------
+# IAST TABLES
+# ---------------------------------------------------------
+_IAST_VOWELS = ["ai", "au", "ā", "ī", "ū", "ṝ", "ḹ", "e", "o", "a", "i", "u", "ṛ", "ḷ"]
+_IAST_LONG = {"ā", "ī", "ū", "ṝ", "ḹ", "e", "ai", "o", "au"}
+_IAST_CONSONANTS = [
+    "kh", "gh", "ch", "jh", "ṭh", "ḍh", "th", "dh", "ph", "bh",
+    "k", "g", "ṅ", "c", "j", "ñ", "ṭ", "ḍ", "ṇ", "t", "d", "n", "p", "b", "m",
+    "y", "r", "l", "v", "ś", "ṣ", "s", "h",
+]
+_IAST_HEAVY_MODIFIERS = {"ṃ", "ṁ", "ḥ"}
+_IAST_TOKEN = re.compile(
+    "(?P<vowel>{v})|(?P<cons>{c})|(?P<mod>[ṃṁḥ])|(?P<gap>[^a-zāīūṛṝḷḹṅñṭḍṇśṣṃṁḥ]+)".format(
+        v="|".join(_IAST_VOWELS), c="|".join(_IAST_CONSONANTS)
+    )
+)
+
+
+class _Syllable:
+    __slots__ = ("start", "end", "onset", "long", "heavy_coda")
+
+    def __init__(self, start, end, onset, long, heavy_coda):
+        self.start = start
+        self.end = end
+        self.onset = onset  # akshar ke shuru mein kitne vyanjan
+        self.long = long
+        self.heavy_coda = heavy_coda
+
+
+def _close_previous(syllables, start, end):
+    # Word-final halant vyanjan pichhle akshar mein judta hai aur use band karta hai
+    if syllables:
+        prev = syllables[-1]
+        prev.end = end
+        prev.heavy_coda = True
+        return True
+    return False
+
+
+def _scan_devanagari(line):
+    syllables = []
+    pending = None  # Line ki shuruaat ka akela halant, agle akshar se judega
+    for m in _DEVA_AKSHARA.finditer(line):
+        if m.group("indep"):
+            mods = m.group("imods")
+            syl = _Syllable(m.start(), m.end(), 0, m.group("indep") in _LONG_VOWELS,
+                            "ं" in mods or "ः" in mods)
+        else:
+            onset = m.group("onset")
+            vowel = m.group("vowel")
+            if vowel == _VIRAMA and not m.group("mods"):
+                # Poora cluster halant par khatam: koi swar nahi
+                if not _close_previous(syllables, m.start(), m.end()):
+                    pending = m.start()
+                continue
+            mods = m.group("mods")
+            # Onset = C(्C)*, isliye vyanjan ginti = virama + 1
+            syl = _Syllable(m.start(), m.end(), onset.count(_VIRAMA) + 1,
+                            vowel in _LONG_VOWELS,
+                            "ं" in mods or "ः" in mods)
+        if pending is not None:
+            syl.start = pending
+            pending = None
+        syllables.append(syl)
+    return syllables
+
+
+def _scan_iast(line):
+    syllables = []
+    onset_start = None
+    onset = 0
+    for m in _IAST_TOKEN.finditer(line):
+        kind = m.lastgroup
+        if kind == "cons":
+            if onset == 0:
+                onset_start = m.start()
+            onset += 1
+        elif kind == "vowel":
+            start = onset_start if onset else m.start()
+            syllables.append(_Syllable(start, m.end(), onset, m.group() in _IAST_LONG, False))
+            onset = 0
+        elif kind == "mod":
+            if syllables:
+                syllables[-1].end = m.end()
+                syllables[-1].heavy_coda = syllables[-1].heavy_coda or m.group() in _IAST_HEAVY_MODIFIERS
+        elif kind == "gap" and onset:
+            # Word ke ant ke vyanjan (bina swar) pichhle akshar ko band karte hain
+            if _close_previous(syllables, onset_start, m.start()):
+                onset = 0
+    if onset:
+        _close_previous(syllables, onset_start, len(line))
+    return syllables
+
+
+def _weights(syllables, last_guru):
+    pattern = []
+    for i, syl in enumerate(syllables):
+        nxt = syllables[i + 1] if i + 1 < len(syllables) else None
+        heavy = syl.long or syl.heavy_coda or (nxt is not None and nxt.onset >= 2)
+        if nxt is None and last_guru:
+            heavy = True  # Pada ke ant ka akshar vikalp se Guru
+        pattern.append(GURU if heavy else LAGHU)
+    return "".join(pattern)
+
+
+def _scan(line):
+    line = unicodedata.normalize("NFC", line)
+    if _DEVA_CHAR.search(line):
+        return line, _scan_devanagari(line)
+    line = line.lower()
+    return line, _scan_iast(line)
+
+
+def split_aksharas(line):
+    """Akshara boundaries as ``(akshara, start, end)`` offsets into the NFC line."""
+    line, syllables = _scan(line)
+    return [(line[s.start:s.end].strip(), s.start, s.end) for s in syllables]
+
+
+def laghu_guru(line, last_guru=False):
+    """Aksharas of one line and their weights as an ``"LGG..."`` string.
+
+    With ``last_guru`` the final akshara of the line counts as Guru, the
+    optional pada-end rule.
+    """
+    line, syllables = _scan(line)
+    aksharas = [line[s.start:s.end].strip() for s in syllables]
+    return aksharas, _weights(syllables, last_guru)
+
+
+def scan_verse(text, last_guru=False):
+    """:func:`laghu_guru` for every non-empty line of a verse."""
+    return [laghu_guru(line, last_guru) for line in text.splitlines() if line.strip()]
@@ -7,7 +7,10 @@ Unauthorized copying, modification, distribution, or use of this file,
 via any medium, is strictly prohibited.
 """
 from manim import *
-import random
+from font_resolver import best_font
+from instanced_cubes import InstancedCubes, FadeInInstances
+from particle_system import ParticleSystem, sample_outline, drag
+from sections import checkpoint
 import numpy as np
 
 class BhavaniDivineFixed(ThreeDScene):
@@ -24,16 +27,13 @@ class BhavaniDivineFixed(ThreeDScene):
         PINK_NEON = "#FF007F" 
 
         # --- FONT ---
-        hindi_font = "Nirmala UI"
-        try:
-            test = Text("अ", font=hindi_font)
-            font_to_use = hindi_font
-        except:
-            font_to_use = "sans-serif"
+        # Resolver ek baar fontconfig se poochta hai, jawab disk par cached
+        font_to_use = best_font("devanagari")
 
         # ==========================================
         # PART 1: THE DIVINE CHANT
         # ==========================================
+        checkpoint(self, "PART 1")
         
         lines = [
             "न तातो न माता न बन्धुर्न दाता",
@@ -68,6 +68,7 @@ class BhavaniDivineFixed(ThreeDScene):
         # ==========================================
         # PART 2: THE ISOLATION
         # ==========================================
+        checkpoint(self, "PART 2")
 
         target_bhavani = Text("भवानि", font=font_to_use, font_size=36)
         target_bhavani.set_color_by_gradient(GOLD_1, GOLD_2)
@@ -96,19 +97,20 @@ class BhavaniDivineFixed(ThreeDScene):
         # ==========================================
         # PART 3: EXPLOSION & BINARY
         # ==========================================
+        checkpoint(self, "PART 3")
 
-        particles = VGroup()
-        for _ in range(200):
-            p = Dot(radius=0.04, color=GOLD_2)
-            p.move_to(target_bhavani.get_center() + [random.uniform(-2, 2), random.uniform(-0.8, 0.8), 0])
-            particles.add(p)
+        # 20k particles seedha "भवानि" ki outline se, bahar ki taraf udte hue
+        particles = ParticleSystem.from_outline(target_bhavani, 20000, colors=GOLD_2, sizes=2, seed=7)
+        burst = particles.positions - target_bhavani.get_center()
+        spread = np.random.default_rng(7).normal(0, 0.4, burst.shape) * [1, 1, 0]
+        particles.set_velocities(burst * 3 + spread)
+        particles.add_force(drag(4.0))  # ease_out jaisa: tez nikle, phir tham jaaye
 
-        # FIX: Used standard rate function here
-        self.play(
-            ReplacementTransform(target_bhavani, particles),
-            run_time=0.8,
-            rate_func=rate_functions.ease_out_expo 
-        )
+        self.remove(target_bhavani)
+        self.add(particles)
+        particles.start_simulation()
+        self.wait(0.8)
+        particles.stop_simulation()
 
         self.play(
             particles.animate.scale(1.5).rotate(PI/2),
@@ -120,11 +122,18 @@ class BhavaniDivineFixed(ThreeDScene):
         binary_zero = Text("0", font_size=80, color=PINK_NEON).move_to(RIGHT)
         binary_group = VGroup(binary_one, binary_zero)
         
+        # Aadhe particles "1" ki outline par, aadhe "0" par
+        half = len(particles) // 2
+        targets = np.vstack([
+            sample_outline(binary_one, half, seed=1),
+            sample_outline(binary_zero, len(particles) - half, seed=2),
+        ])
+        colors = [CYAN_NEON] * half + [PINK_NEON] * (len(particles) - half)
         self.play(
-            ReplacementTransform(particles[:100], binary_one),
-            ReplacementTransform(particles[100:], binary_zero),
+            particles.animate.set_positions(targets).set_colors(colors),
             run_time=1.5
         )
+        self.play(FadeIn(binary_group), FadeOut(particles), run_time=0.5)
         
         lbl = Text("Binary Pattern", font_size=24, color=GRAY).next_to(binary_group, DOWN)
         self.play(FadeIn(lbl))
@@ -133,38 +142,32 @@ class BhavaniDivineFixed(ThreeDScene):
         # ==========================================
         # PART 4: MERU PRASTAAR (3D PYRAMID)
         # ==========================================
+        checkpoint(self, "PART 4")
         
         self.play(FadeOut(binary_group), FadeOut(lbl))
 
         self.move_camera(phi=60 * DEGREES, theta=-45 * DEGREES, run_time=2)
 
-        pyramid_group = VGroup()
         rows = 5
         block_size = 1.0
+        positions = []
         
         for r in range(rows):
             for c in range(r + 1):
-                block = Cube(side_length=block_size)
-                block.set_color(GOLD_3) 
-                block.set_stroke(color=GOLD_1, width=2) 
-                block.set_gloss(1.0) 
-                
                 x_pos = (c - r / 2) * (block_size + 0.1)
                 y_pos = -r * (block_size + 0.1) + 2 
-                
-                block.move_to([x_pos, y_pos, 0])
-                pyramid_group.add(block)
+                positions.append([x_pos, y_pos, 0])
+
+        pyramid_group = InstancedCubes(
+            positions, side_length=block_size, colors=GOLD_3, opacities=0.75,
+            stroke_colors=GOLD_1, stroke_width=2, stroke_opacity=1, gloss=1.0
+        )
 
         # Blocks fall from sky
         self.play(
-            LaggedStart(
-                *[
-                    FadeIn(b, shift=UP * 5) 
-                    for b in pyramid_group
-                ],
-                lag_ratio=0.1
-            ),
-            run_time=4
+            FadeInInstances(pyramid_group, shift=UP * 5, lag_ratio=0.1),
+            run_time=4,
+            rate_func=linear  # LaggedStart ka default
         )
         
         self.play(
@@ -7,7 +7,11 @@ Unauthorized copying, modification, distribution, or use of this file,
 via any medium, is strictly prohibited.
 """
 from manim import *
+from font_resolver import best_font
 import numpy as np
+from akshara import laghu_guru
+from starfield import Starfield
+from ring_trail import RingTrail
 
 class BhujangaTrailCinematic(ThreeDScene):
     def construct(self):
@@ -21,18 +25,11 @@ class BhujangaTrailCinematic(ThreeDScene):
         TEXT_GOLD = "#FFD700"
 
         # --- FONT ---
-        hindi_font = "Nirmala UI"
-        try:
-            test = Text("अ", font=hindi_font)
-            font_to_use = hindi_font
-        except:
-            font_to_use = "sans-serif"
-
-        # Syllables Data
-        syllables = [
-            "न", "ता", "तो", "न", "मा", "ता", 
-            "न", "ब", "न्धु", "र्न", "दा", "ता"
-        ]
+        # Resolver ek baar fontconfig se poochta hai, jawab disk par cached
+        font_to_use = best_font("devanagari")
+
+        # Syllables Data (shloka ki line se akshar)
+        syllables, _ = laghu_guru("न तातो न माता न बन्धुर्न दाता")
 
         # ==========================================
         # 1. 3D CAMERA SETUP
@@ -41,15 +38,11 @@ class BhujangaTrailCinematic(ThreeDScene):
         self.set_camera_orientation(phi=55 * DEGREES, theta=-20 * DEGREES)
 
         # Background Stars (Depth ke liye)
-        stars = VGroup()
-        for _ in range(50):
-            s = Dot(radius=0.02, color=GRAY).move_to([
-                np.random.uniform(-7, 7),
-                np.random.uniform(-4, 4),
-                -1 # Background mein peeche
-            ])
-            stars.add(s)
-        self.add(stars)
+        stars = Starfield(
+            50, center=[0, 0, -1], extent=[7, 4, 0], # Background mein peeche
+            size_range=(5, 5), opacity_range=(1, 1), colors=GRAY
+        )
+        stars.bake(self)
 
         # ==========================================
         # 2. SNAKE HEAD & TRAIL SETUP
@@ -74,20 +67,20 @@ class BhujangaTrailCinematic(ThreeDScene):
         # MOVEMENT UPDATER
         snake_head.add_updater(lambda m: m.move_to(get_snake_path(tracker.get_value())))
 
-        # THE GLOWING TRAIL (TracedPath)
+        # THE GLOWING TRAIL (Ring buffer, poori crawl capacity ke andar)
         # Outer thick orange trail
-        trail_outer = TracedPath(
+        trail_outer = RingTrail(
             head.get_center,
+            capacity=512,
             stroke_width=16,
-            stroke_color=TRAIL_OUTER,
-            dissipating_time=None
+            stroke_color=TRAIL_OUTER
         )
         # Inner thin yellow trail (for neon look)
-        trail_inner = TracedPath(
+        trail_inner = RingTrail(
             head.get_center,
+            capacity=512,
             stroke_width=6,
-            stroke_color=TRAIL_CORE,
-            dissipating_time=None
+            stroke_color=TRAIL_CORE
         )
         
         self.add(trail_outer, trail_inner)
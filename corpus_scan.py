@@ -0,0 +1,192 @@
+"""
+Project:  Binary Decode / code Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize). All Rights Reserved.
+
+This code is proprietary and confidential. 
+Unauthorized copying, modification, distribution, or use of this file, 
+via any medium, is strictly prohibited.
+"""
+import argparse
+import json
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from akshara import laghu_guru
+from lg_codec import MAX_PACKED, from_text
+from vritta_index import METER_NAMES, identify
+
+# --- Corpus Scanner ---
+# Poora granth (badi text file) mmap se padho, verse boundaries par
+# tukde karo, har tukda ek worker process mein akshar + L/G + meter nikale.
+# Output ek folder mein columnar binary files hain (har line ek record):
+#   offsets.u8   line ka byte offset (uint64)
+#   lengths.u1   aksharon ki ginti (uint8, 255 = bahut lambi line)
+#   patterns.u8  packed L/G pattern (uint64, lg_codec convention)
+#   meters.i2    METER_NAMES mein index (int16, -1 = pehchana nahi)
+#   meta.json    column dtypes, meter names aur meter-wise ginti
+#
+#   python corpus_scan.py bhagavad_gita.txt -o gita_scan --workers 8
+
+COLUMNS = {
+    "offsets": np.uint64,
+    "lengths": np.uint8,
+    "patterns": np.uint64,
+    "meters": np.int16,
+}
+TOO_LONG = 255
+
+
+def _verse_boundaries(data, size, target):
+    # Har tukda ~target bytes ka, par verse ke beech mein nahi katega:
+    # khaali line ya "॥" wali line ke baad hi kaato, warna kam se kam line ke ant par
+    cuts = [0]
+    while cuts[-1] < size:
+        pos = cuts[-1] + target
+        if pos >= size:
+            cuts.append(size)
+            break
+        window = min(size, pos + target)
+        end = data.find(b"\n\n", pos, window)
+        danda = data.find("॥".encode("utf-8"), pos, window)
+        if danda != -1 and (end == -1 or danda < end):
+            end = data.find(b"\n", danda, window)
+        if end == -1:
+            end = data.find(b"\n", pos)
+        cuts.append(size if end == -1 else end + 1)
+    return list(zip(cuts[:-1], cuts[1:]))
+
+
+def _identify_lines(bits, lengths):
+    ids = np.full(bits.shape, -1, dtype=np.int16)
+    ok = lengths <= 32
+    ids[ok] = identify(bits[ok], lengths[ok])
+
+    # Kai granth ek line mein do pada likhte hain: dono aadhe ek hi meter ke hon to wahi label
+    half = lengths // 2
+    split = (ids < 0) & (lengths % 2 == 0) & (half >= 1) & (half <= 32)
+    if np.any(split):
+        h = half[split].astype(np.uint64)
+        low = bits[split] & ((np.uint64(1) << h) - np.uint64(1))
+        high = bits[split] >> h
+        first = identify(low, half[split])
+        second = identify(high, half[split])
+        ids[split] = np.where(first == second, first, -1)
+    return ids
+
+
+def scan_chunk(path, start, end, last_guru=False):
+    """Scan bytes ``start .. end`` of ``path``; returns the four column arrays."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        raw = data[start:end]
+
+    offsets, lengths, patterns = [], [], []
+    pos = start
+    for line in raw.split(b"\n"):
+        text = line.decode("utf-8", errors="replace")
+        if text.strip():
+            _, weights = laghu_guru(text, last_guru)
+            if weights:
+                offsets.append(pos)
+                if len(weights) <= MAX_PACKED:
+                    lengths.append(len(weights))
+                    patterns.append(int(from_text(weights)))
+                else:
+                    lengths.append(TOO_LONG)
+                    patterns.append(0)
+        pos += len(line) + 1
+
+    bits = np.array(patterns, dtype=np.uint64)
+    lens = np.array(lengths, dtype=np.int64)
+    meters = _identify_lines(bits, lens) if len(bits) else np.empty(0, dtype=np.int16)
+    return (
+        np.array(offsets, dtype=np.uint64),
+        lens.astype(np.uint8),
+        bits,
+        meters,
+    )
+
+
+def scan_corpus(path, out_dir, workers=None, chunk_bytes=4 << 20, last_guru=False):
+    """Scan a whole text file into ``out_dir``; returns the meter counts."""
+    size = os.path.getsize(path)
+    os.makedirs(out_dir, exist_ok=True)
+    with open(path, "rb") as f:
+        if size == 0:
+            ranges = []
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                ranges = _verse_boundaries(data, size, chunk_bytes)
+
+    counts = np.zeros(len(METER_NAMES) + 1, dtype=np.int64)  # aakhri slot = unknown
+    total = 0
+    files = {name: open(os.path.join(out_dir, name + "." + np.dtype(dt).str[1:]), "wb") for name, dt in COLUMNS.items()}
+    try:
+        workers = workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Ek saath sirf kuch tukde hawa mein, taaki memory bounded rahe
+            in_flight = []
+            ranges = iter(ranges)
+            for _ in range(2 * workers):
+                r = next(ranges, None)
+                if r is not None:
+                    in_flight.append(pool.submit(scan_chunk, path, r[0], r[1], last_guru))
+            while in_flight:
+                columns = in_flight.pop(0).result()
+                r = next(ranges, None)
+                if r is not None:
+                    in_flight.append(pool.submit(scan_chunk, path, r[0], r[1], last_guru))
+                for (name, dt), col in zip(COLUMNS.items(), columns):
+                    files[name].write(col.astype(dt).tobytes())
+                meters = columns[3]
+                counts += np.bincount(np.where(meters < 0, len(METER_NAMES), meters), minlength=len(counts))
+                total += len(meters)
+    finally:
+        for f in files.values():
+            f.close()
+
+    stats = {name: int(c) for name, c in zip(METER_NAMES, counts) if c}
+    stats["unknown"] = int(counts[-1])
+    meta = {
+        "source": os.path.abspath(path),
+        "lines": total,
+        "columns": {name: np.dtype(dt).str for name, dt in COLUMNS.items()},
+        "pattern_convention": "L = 1, first syllable = bit 0",
+        "meter_names": METER_NAMES,
+        "meter_counts": stats,
+    }
+    with open(os.path.join(out_dir, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2, ensure_ascii=False)
+    return stats
+
+
+def load_scan(out_dir):
+    """Read a scan folder back as a dict of numpy arrays (memory-mapped)."""
+    with open(os.path.join(out_dir, "meta.json"), encoding="utf-8") as f:
+        meta = json.load(f)
+    return {
+        name: np.memmap(os.path.join(out_dir, name + "." + np.dtype(dt).str[1:]), dtype=dt, mode="r")
+        if meta["lines"] else np.empty(0, dtype=dt)
+        for name, dt in meta["columns"].items()
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scan a Sanskrit text for L/G patterns and meters.")
+    parser.add_argument("source", help="UTF-8 text file (Devanagari or IAST)")
+    parser.add_argument("-o", "--out", required=True, help="output folder for the columnar scan")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--chunk-mb", type=float, default=4.0, help="approximate bytes per worker task, in MB")
+    parser.add_argument("--last-guru", action="store_true", help="count every line's last akshara as Guru")
+    args = parser.parse_args(argv)
+
+    stats = scan_corpus(args.source, args.out, args.workers, int(args.chunk_mb * (1 << 20)), args.last_guru)
+    width = max(len(name) for name in stats)
+    for name, count in sorted(stats.items(), key=lambda kv: -kv[1]):
+        print("%-*s %d" % (width, name, count))
+
+
+if __name__ == "__main__":
+    main()
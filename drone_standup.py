@@ -7,8 +7,20 @@ Unauthorized copying, modification, distribution, or use of this file,
 via any medium, is strictly prohibited.
 """
 from manim import *
+from prastaar_table import PrastaarTable
+from glyph_cache import cached_text
+import render_fingerprint
 
 class UltimateDroneTable(ThreeDScene):
+    def setup(self):
+        super().setup()
+        # Bada mobject tree: manim ke JSON hash ki jagah tez Merkle fingerprint (sirf is render mein)
+        render_fingerprint.install()
+
+    def tear_down(self):
+        render_fingerprint.uninstall()
+        super().tear_down()
+
     def construct(self):
         # --- 1. SETUP: PURE BLACK VOID ---
         self.camera.background_color = "#000000"
@@ -17,18 +29,17 @@ class UltimateDroneTable(ThreeDScene):
         self.set_camera_orientation(phi=35 * DEGREES, theta=-135 * DEGREES, zoom=0.6)
 
         # --- 2. DATA SETUP ---
+        # 5 aksharon ki Prastaar ki pehli 11 rows, chaaron columns table se
+        table = PrastaarTable(5)
+        shown = slice(0, 11)
         rows_data = [
-            ["1",  "G G G G G", "0 0 0 0 0", "0 0 0 0 0"],
-            ["2",  "L G G G G", "1 0 0 0 0", "0 0 0 0 1"],
-            ["3",  "G L G G G", "0 1 0 0 0", "0 0 0 1 0"],
-            ["4",  "L L G G G", "1 1 0 0 0", "0 0 0 1 1"],
-            ["5",  "G G L G G", "0 0 1 0 0", "0 0 1 0 0"],
-            ["6",  "L G L G G", "1 0 1 0 0", "0 0 1 0 1"],
-            ["7",  "G L L G G", "0 1 1 0 0", "0 0 1 1 0"],
-            ["8",  "L L L G G", "1 1 1 0 0", "0 0 1 1 1"],
-            ["9",  "G G G L G", "0 0 0 1 0", "0 1 0 0 0"],
-            ["10", "L G G L G", "1 0 0 1 0", "0 1 0 0 1"],
-            ["11", "G L G L G", "0 1 0 1 0", "0 1 0 1 0"]
+            [str(num), str(gl), str(pingala), str(modern)]
+            for num, gl, pingala, modern in zip(
+                table.row_numbers(shown),
+                table.text(shown),
+                table.pingala_binary(shown),
+                table.mirror_binary(shown),
+            )
         ]
 
         # Font sizes reduced by 3 points to stay inside the screen
@@ -59,12 +70,12 @@ class UltimateDroneTable(ThreeDScene):
         for i, row in enumerate(rows_data):
             y = y_start - 0.8 - (i * y_step) 
             
-            c1 = Text(row[0], font_size=f_size, color=GREY).move_to(RIGHT * x_cols[0] + UP * y)
-            c2 = Text(row[1], font="Consolas", font_size=f_size, color="#FF6600", weight=BOLD).move_to(RIGHT * x_cols[1] + UP * y)
-            c3 = Text(row[2], font="Consolas", font_size=f_size, color=WHITE, weight=BOLD).move_to(RIGHT * x_cols[2] + UP * y)
+            c1 = cached_text(row[0], font_size=f_size, color=GREY).move_to(RIGHT * x_cols[0] + UP * y)
+            c2 = cached_text(row[1], font="Consolas", font_size=f_size, color="#FF6600", weight=BOLD).move_to(RIGHT * x_cols[1] + UP * y)
+            c3 = cached_text(row[2], font="Consolas", font_size=f_size, color=WHITE, weight=BOLD).move_to(RIGHT * x_cols[2] + UP * y)
             base_elements.add(c1, c2, c3)
 
-            c4 = Text(row[3], font="Consolas", font_size=f_size, color="#00FFFF", weight=BOLD).move_to(RIGHT * x_cols[3] + UP * y)
+            c4 = cached_text(row[3], font="Consolas", font_size=f_size, color="#00FFFF", weight=BOLD).move_to(RIGHT * x_cols[3] + UP * y)
             reveal_elements.add(c4)
 
         # Center all data perfectly
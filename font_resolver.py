@@ -0,0 +1,185 @@
+"""
+Project:  Binary Decode / code Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize). All Rights Reserved.
+
+This code is proprietary and confidential. 
+Unauthorized copying, modification, distribution, or use of this file, 
+via any medium, is strictly prohibited.
+"""
+import json
+import os
+import shutil
+import subprocess
+import warnings
+
+# --- Font Resolver ---
+# Pehle har scene Text("अ", font="Nirmala UI") bana kar try/except se font
+# jaanchti thi. Pango missing font par error deta hi nahi (chupchaap koi aur
+# font le leta hai), isliye woh probe kabhi fail nahi hota tha.
+# Yahan fontconfig se ek baar poocha jaata hai ki kaunse fonts us script ko
+# sach mein support karte hain, aur jawab disk par cache ho jaata hai:
+#   best_font("devanagari")  -> "Nirmala UI" / "Noto Sans Devanagari" / ...
+# Cache tab tak valid hai jab tak system ke font folders badle nahi.
+
+GENERIC_FONT = "sans-serif"
+
+# Har script ke liye pasand ke fonts (pehla mila to wahi), aur fontconfig ka lang code
+SCRIPTS = {
+    "devanagari": ("hi", [
+        "Nirmala UI",
+        "Noto Sans Devanagari",
+        "Noto Serif Devanagari",
+        "Kohinoor Devanagari",
+        "Devanagari Sangam MN",
+        "Mangal",
+        "Lohit Devanagari",
+        "Gargi",
+        "FreeSans",
+    ]),
+    "latin": ("en", [
+        "Georgia",
+        "Verdana",
+        "DejaVu Sans",
+        "Liberation Sans",
+        "Noto Sans",
+    ]),
+}
+
+CACHE_PATH = os.environ.get(
+    "MATHRIZE_FONT_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "mathrize", "fonts.json"),
+)
+
+_FONT_DIRS = [
+    "/usr/share/fonts",
+    "/usr/local/share/fonts",
+    "~/.local/share/fonts",
+    "~/.fonts",
+    "/Library/Fonts",
+    "~/Library/Fonts",
+    "/System/Library/Fonts",
+    os.path.join(os.environ.get("WINDIR", "C:\\Windows"), "Fonts"),
+]
+
+_resolved = None
+_warned = set()
+
+
+def _fonts_signature():
+    # Font folders (sub-folders samet) ke mtime: naya font install hua to cache
+    # apne aap purana. Font aksar /usr/share/fonts/truetype/noto jaise andar ke
+    # folder mein aata hai, jisse sirf usi folder ka mtime badalta hai.
+    sig = []
+    for d in _FONT_DIRS:
+        path = os.path.expanduser(d)
+        if not os.path.isdir(path):
+            continue
+        count = 0
+        newest = 0.0
+        for root, _, _ in os.walk(path):
+            try:
+                newest = max(newest, os.stat(root).st_mtime)
+            except OSError:
+                continue
+            count += 1
+        sig.append([path, count, newest])
+    return sig
+
+
+def _fc_families(lang=None):
+    # fontconfig: ":lang=hi" sirf unhi fonts ko deta hai jinme us script ke glyph hain
+    if shutil.which("fc-list") is None:
+        return None
+    pattern = ":lang=%s" % lang if lang else ":"
+    try:
+        out = subprocess.run(["fc-list", pattern, "family"], capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    families = set()
+    for line in out.splitlines():
+        families.update(name.strip() for name in line.split(",") if name.strip())
+    return families
+
+
+def _installed_families():
+    # fontconfig na ho (Windows) to Pango ki apni list, script check ke bina
+    try:
+        import manimpango
+    except ImportError:
+        return set()
+    return set(manimpango.list_fonts())
+
+
+def _scan():
+    fallback = None
+    chains = {}
+    for script, (lang, preferred) in SCRIPTS.items():
+        families = _fc_families(lang)
+        if families is None:
+            if fallback is None:
+                fallback = _installed_families()
+            families = fallback
+        chains[script] = [name for name in preferred if name in families]
+        # Pasand wala koi nahi, par script ka koi aur font hai to woh bhi chalega
+        if not chains[script] and families is not fallback:
+            chains[script] = sorted(families)[:1]
+    return chains
+
+
+def _load():
+    try:
+        with open(CACHE_PATH, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get("signature") != _fonts_signature() or set(data.get("chains", {})) != set(SCRIPTS):
+        return None
+    return data["chains"]
+
+
+def _save(chains):
+    try:
+        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+        with open(CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump({"signature": _fonts_signature(), "chains": chains}, f, indent=2, ensure_ascii=False)
+    except OSError:
+        pass  # Read-only home: har process ek baar scan kar lega
+
+
+def _chains():
+    global _resolved
+    if _resolved is None:
+        _resolved = _load()
+        if _resolved is None:
+            _resolved = _scan()
+            _save(_resolved)
+    return _resolved
+
+
+def refresh():
+    """Forget the cached answer and rescan the installed fonts."""
+    global _resolved
+    _resolved = _scan()
+    _save(_resolved)
+    _warned.clear()
+
+
+def font_chain(script="devanagari"):
+    """Installed fonts for ``script`` in preference order, ending in the generic family."""
+    if script not in SCRIPTS:
+        raise ValueError("Unknown script %r, expected one of %s" % (script, sorted(SCRIPTS)))
+    return _chains()[script] + [GENERIC_FONT]
+
+
+def has_script_font(script="devanagari"):
+    """Whether a real font for ``script`` is installed (not just the generic fallback)."""
+    return len(font_chain(script)) > 1
+
+
+def best_font(script="devanagari"):
+    """The best installed font family for ``script``; warns once when only the generic one is left."""
+    chain = font_chain(script)
+    if len(chain) == 1 and script not in _warned:
+        _warned.add(script)
+        warnings.warn("No %s font installed, falling back to %r" % (script, GENERIC_FONT))
+    return chain[0]
@@ -0,0 +1,74 @@
+"""
+Project:  Binary Decode / code Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize). All Rights Reserved.
+
+This code is proprietary and confidential. 
+Unauthorized copying, modification, distribution, or use of this file, 
+via any medium, is strictly prohibited.
+"""
+from collections import OrderedDict, namedtuple
+
+from manim import Text
+
+# --- Glyph Cache ---
+# Har khaane ka Text(str(val), ...) font shaping, SVG parsing aur Bezier
+# conversion dobara karta hai, jabki "1", "L", "G" hazaar baar wahi hain.
+# Yahan har (string, font, weight, size, color) ka Text sirf EK baar banta
+# hai; baaki sab uski copy hain (copy sirf points copy karti hai).
+#   cached_text(str(val), font="Consolas", font_size=32, color=WHITE, weight=BOLD)
+# Poore process mein ek hi cache, LRU eviction ke saath.
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class GlyphCache:
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._prototypes = OrderedDict()
+
+    def text(self, text, font=None, weight=None, font_size=None, color=None, **kwargs):
+        """A fresh copy of ``Text(text, ...)``; only arguments actually given reach ``Text``."""
+        key = (
+            text, font, weight, font_size,
+            None if color is None else str(color),
+            tuple(sorted((k, repr(v)) for k, v in kwargs.items())),
+        )
+        prototype = self._prototypes.get(key)
+        if prototype is None:
+            self.misses += 1
+            given = {"font": font, "weight": weight, "font_size": font_size, "color": color}
+            kwargs.update({k: v for k, v in given.items() if v is not None})
+            prototype = Text(text, **kwargs)
+            self._prototypes[key] = prototype
+            if len(self._prototypes) > self.maxsize:
+                self._prototypes.popitem(last=False)
+        else:
+            self.hits += 1
+            self._prototypes.move_to_end(key)
+        return prototype.copy()
+
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._prototypes))
+
+    def clear(self):
+        self._prototypes.clear()
+        self.hits = self.misses = 0
+
+
+_cache = GlyphCache()
+
+
+def cached_text(text, font=None, weight=None, font_size=None, color=None, **kwargs):
+    """Drop-in for ``Text(...)`` backed by the shared process-wide cache."""
+    return _cache.text(text, font, weight, font_size, color, **kwargs)
+
+
+def cache_info():
+    """Hits, misses, maxsize and current size of the shared cache."""
+    return _cache.info()
+
+
+def cache_clear():
+    _cache.clear()
@@ -0,0 +1,223 @@
+"""
+Project:  Binary Decode / code Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize). All Rights Reserved.
+
+This code is proprietary and confidential. 
+Unauthorized copying, modification, distribution, or use of this file, 
+via any medium, is strictly prohibited.
+"""
+import math
+
+import numpy as np
+
+from lg_codec import MAX_PACKED, to_text
+
+# --- k-Guru Patterns: Meru ke ek khaane ki poori list ---
+# Meru ka khaana (n, k) = C(n, k) = n aksharon ke wo patterns jinme theek k
+# Guru hain. Patterns lg_codec convention mein packed hain (L = 1, pehla
+# akshar = bit 0), isliye Guru wale bits = ~pattern.
+#
+# Order colex hai: Guru positions ka bitmask chhote se bade ki taraf, yaani
+# Gosper's hack ka order. Rank (0 se) combinatorial number system se nikalta hai:
+#   Guru positions c1 < c2 < ... < ck  ->  rank = C(c1, 1) + C(c2, 2) + ... + C(ck, k)
+# C(6, 1) ke liye: G L L L L L, L G L L L L, ... L L L L L G
+#
+# Table kuch store nahi karti; C(30, 15) ke 155 million patterns bhi sirf
+# maange gaye page jitne bante hain.
+
+
+def _check_cell(length, gurus):
+    if length < 1:
+        raise ValueError("Pattern length must be at least 1, got %r" % (length,))
+    if not 0 <= gurus <= length:
+        raise ValueError("Guru count must lie in 0..%d, got %r" % (length, gurus))
+
+
+def _comb_table(length, gurus):
+    # table[i, c] = C(c, i), har i ke liye c mein badhta hua (searchsorted ke liye)
+    table = np.zeros((gurus + 1, length), dtype=np.int64)
+    for i in range(gurus + 1):
+        for c in range(i, length):
+            table[i, c] = math.comb(c, i)
+    return table
+
+
+def _full(length):
+    return (1 << length) - 1
+
+
+# ---------------------------------------------------------
+# SCALAR: koi bhi length (Python ints)
+# ---------------------------------------------------------
+def first_pattern(length, gurus):
+    """Rank 0 of the cell: the Gurus packed into the first ``gurus`` syllables."""
+    _check_cell(length, gurus)
+    return _full(length) ^ ((1 << gurus) - 1)
+
+
+def next_pattern(pattern, length):
+    """The next pattern with the same Guru count (Gosper's hack), ``None`` after the last."""
+    g = _full(length) & ~int(pattern)
+    if g == 0:
+        return None
+    c = g & -g
+    r = g + c
+    g = (((r ^ g) >> 2) // c) | r
+    if g >> length:
+        return None
+    return _full(length) ^ g
+
+
+def rank(pattern, length):
+    """Colex rank (0-based) of one packed pattern among those with its Guru count."""
+    g = _full(length) & ~int(pattern)
+    out = 0
+    i = 0
+    for pos in range(length):
+        if (g >> pos) & 1:
+            i += 1
+            out += math.comb(pos, i)
+    return out
+
+
+def unrank(index, length, gurus):
+    """Packed pattern at colex rank ``index`` (0-based) of the cell ``(length, gurus)``."""
+    _check_cell(length, gurus)
+    index = int(index)
+    if not 0 <= index < math.comb(length, gurus):
+        raise ValueError("Rank must lie in 0..C(%d, %d) - 1" % (length, gurus))
+    g = 0
+    hi = length
+    for i in range(gurus, 0, -1):
+        # Sabse bada c < hi jiske liye C(c, i) <= index
+        lo = i - 1
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if math.comb(mid, i) <= index:
+                lo = mid
+            else:
+                hi = mid
+        g |= 1 << lo
+        index -= math.comb(lo, i)
+        hi = lo
+    return _full(length) ^ g
+
+
+# ---------------------------------------------------------
+# BATCH: numpy (63 aksharon tak)
+# ---------------------------------------------------------
+def unrank_batch(indices, length, gurus):
+    """Vectorized :func:`unrank`: uint64 patterns for an array of ranks."""
+    _check_cell(length, gurus)
+    if length > MAX_PACKED:
+        idx = np.asarray(indices, dtype=object)
+        out = np.empty(idx.shape, dtype=object)
+        for pos, val in np.ndenumerate(idx):
+            out[pos] = unrank(val, length, gurus)
+        return out
+
+    r = np.array(indices, dtype=np.int64)
+    if np.any(r < 0) or np.any(r >= math.comb(length, gurus)):
+        raise ValueError("Rank must lie in 0..C(%d, %d) - 1" % (length, gurus))
+    table = _comb_table(length, gurus)
+    g = np.zeros(r.shape, dtype=np.uint64)
+    for i in range(gurus, 0, -1):
+        c = np.searchsorted(table[i], r, side="right") - 1
+        g |= np.uint64(1) << c.astype(np.uint64)
+        r -= table[i, c]
+    return np.uint64(_full(length)) ^ g
+
+
+def rank_batch(patterns, length):
+    """Vectorized :func:`rank` for an array of packed patterns."""
+    if length > MAX_PACKED:
+        bits = np.asarray(patterns, dtype=object)
+        out = np.empty(bits.shape, dtype=object)
+        for pos, val in np.ndenumerate(bits):
+            out[pos] = rank(val, length)
+        return out
+
+    g = ~np.asarray(patterns, dtype=np.uint64) & np.uint64(_full(length))
+    table = _comb_table(length + 1, length)
+    out = np.zeros(g.shape, dtype=np.int64)
+    seen = np.zeros(g.shape, dtype=np.int64)
+    for pos in range(length):
+        bit = ((g >> np.uint64(pos)) & np.uint64(1)).astype(np.int64)
+        seen += bit
+        out += bit * table[seen, pos]
+    return out
+
+
+# ---------------------------------------------------------
+# LAZY PAGED CELL
+# ---------------------------------------------------------
+class GuruPatterns:
+    def __init__(self, length, gurus, page_size=1 << 16):
+        _check_cell(length, gurus)
+        self.length = length
+        self.gurus = gurus
+        self.size = math.comb(length, gurus)
+        self.page_size = page_size
+
+    def __len__(self):
+        return self.size
+
+    def _packed(self, key):
+        if isinstance(key, slice):
+            # Chune gaye ranks hisaab se (range lazy hai), koi list nahi
+            ranks = range(*key.indices(self.size))
+            if self.length <= MAX_PACKED:
+                return unrank_batch(np.arange(ranks.start, ranks.stop, ranks.step, dtype=np.int64),
+                                    self.length, self.gurus)
+            if ranks.step != 1 or not ranks:
+                # Ulta / strided: Gosper sirf aage jaata hai, to har chuna rank seedha unrank
+                out = np.empty(len(ranks), dtype=object)
+                for i, index in enumerate(ranks):
+                    out[i] = unrank(index, self.length, self.gurus)
+                return out
+            # Lambe patterns: pehla unrank, baaki Gosper se agla-agla
+            out = np.empty(len(ranks), dtype=object)
+            pattern = unrank(ranks.start, self.length, self.gurus)
+            for i in range(len(ranks)):
+                out[i] = pattern
+                pattern = next_pattern(pattern, self.length)
+            return out
+
+        index = range(self.size)[key]  # Negative index aur IndexError range sambhal leta hai
+        pattern = unrank(index, self.length, self.gurus)
+        return np.uint64(pattern) if self.length <= MAX_PACKED else pattern
+
+    def __getitem__(self, key):
+        """Packed pattern(s) by colex rank: an int key gives one, a slice gives an array."""
+        return self._packed(key)
+
+    def __iter__(self):
+        for page in self.pages():
+            yield from page
+
+    def page_count(self):
+        return -(-self.size // self.page_size)
+
+    def page(self, number):
+        """Page ``number`` (0-based) as a packed array of up to ``page_size`` patterns."""
+        if not 0 <= number < self.page_count():
+            raise IndexError("Page %r out of range" % (number,))
+        start = number * self.page_size
+        return self._packed(slice(start, start + self.page_size))
+
+    def pages(self, start=0, stop=None):
+        """Yield pages ``start .. stop - 1`` one at a time."""
+        stop = self.page_count() if stop is None else min(stop, self.page_count())
+        for number in range(start, stop):
+            yield self.page(number)
+
+    def index(self, pattern):
+        """Colex rank of ``pattern`` in this cell."""
+        g = _full(self.length) & ~int(pattern)
+        if int(pattern) >> self.length or bin(g).count("1") != self.gurus:
+            raise ValueError("Pattern does not have %d Gurus in %d syllables" % (self.gurus, self.length))
+        return rank(pattern, self.length)
+
+    def text(self, key=slice(None), sep=" "):
+        """G/L strings for the selected ranks, e.g. ``"G L L L L L"``."""
+        return to_text(self._packed(key), self.length, sep=sep)
@@ -0,0 +1,223 @@
+"""
+Project:  Binary Decode / code Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize). All Rights Reserved.
+
+This code is proprietary and confidential. 
+Unauthorized copying, modification, distribution, or use of this file, 
+via any medium, is strictly prohibited.
+"""
+from manim import *
+
+# --- Instanced Cubes ---
+# Imarat / Meru ki har eent ke liye Cube() banana = har baar 6 Squares,
+# rotate, shift aur style setters. Yahan cube ka mesh (6 faces ke points)
+# sirf EK baar banta hai; har eent us prototype ki copy hai jiske points
+# mesh + apne arrays se ek hi broadcast mein likhe jaate hain:
+#   positions (N, 3), bases (N, 3, 3) = har eent ka rotate/scale,
+#   fills (N, 4), strokes (N, 4) rgba
+#
+#   bricks = InstancedCubes(positions, colors=colors, opacities=0.9)
+#   self.play(FadeInInstances(bricks, shift=UP * 5, lag_ratio=0.01))
+#   self.play(bricks.animate.set_positions(new_positions))
+#
+# set_color / set_opacity / set_fill / set_stroke bhi arrays se hi chalte
+# hain. Koi bhi doosra badlav (rotate, scale, ek eent ka animate...) faces
+# par hota hai; har setter pehle _pull() se arrays faces se wapas padhta
+# hai (ParticleSystem jaisa), isliye arrays kabhi purane nahi padte aur
+# set_positions rotate/scale ko nahi mitaata. Cairo har face alag hi draw
+# karta hai, isliye bachat construction aur per-frame style/points likhne
+# mein hai, raster mein nahi.
+
+
+def _broadcast(values, count):
+    # Ek color / number = sab instances ke liye
+    if not isinstance(values, (list, tuple, np.ndarray)):
+        return [values] * count
+    values = list(values)
+    if len(values) != count:
+        raise ValueError("Expected %d per-instance values, got %d" % (count, len(values)))
+    return values
+
+
+def _rgbs(colors, count):
+    # Har alag color ka rgb ek hi baar
+    lookup = {}
+    rgbs = []
+    for c in _broadcast(colors, count):
+        key = str(c)
+        if key not in lookup:
+            lookup[key] = color_to_rgb(c)
+        rgbs.append(lookup[key])
+    return np.array(rgbs, dtype=float).reshape(count, 3)
+
+
+class InstancedCubes(VGroup):
+    def __init__(
+        self,
+        positions,
+        side_length=1.0,
+        colors=WHITE,
+        opacities=1.0,
+        stroke_colors=None,
+        stroke_width=1,
+        stroke_opacity=0.5,
+        gloss=None,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.side_length = side_length
+        self.positions = np.array(positions, dtype=float).reshape(-1, 3)
+        count = len(self.positions)
+        self.bases = np.tile(np.eye(3), (count, 1, 1))
+        self.fills = np.empty((count, 4))
+        self.fills[:, :3] = _rgbs(colors, count)
+        self.fills[:, 3] = opacities
+        # None = har eent ki stroke uske fill color jaisi
+        self.strokes = np.empty((count, 4))
+        self.strokes[:, :3] = self.fills[:, :3] if stroke_colors is None else _rgbs(stroke_colors, count)
+        self.strokes[:, 3] = stroke_opacity
+
+        prototype = Cube(side_length=side_length, fill_opacity=1, stroke_width=stroke_width)
+        if gloss is not None:
+            prototype.set_gloss(gloss)
+        prototype.move_to(ORIGIN)
+        self.sheen = prototype[0].get_sheen_factor()
+        # Ek hi mesh: (6 faces, points, 3), cube ke center ke relative
+        self.mesh = np.array([face.points for face in prototype])
+        # Faces ke points -> basis wapas (least squares), _pull ke liye
+        self._unmesh = np.linalg.pinv(self.mesh.reshape(-1, 3))
+
+        self.add(*[prototype.copy() for _ in range(count)])
+        self._write_points()
+        self._write_style()
+
+    # ---------------------------------------------------------
+    # ARRAYS <-> FACES
+    # ---------------------------------------------------------
+    def _write_points(self):
+        # (N, 6, P, 3) ek hi broadcast mein: bases @ mesh + position
+        points = np.einsum("fpj,nkj->nfpk", self.mesh, self.bases) + self.positions[:, None, None, :]
+        for cube, cube_points in zip(self.submobjects, points):
+            for face, face_points in zip(cube.submobjects, cube_points):
+                face.points = face_points
+        return self
+
+    def _with_sheen(self, rgbas):
+        # Manim ki tarah: gloss ho to doosri, thodi halki row (gradient)
+        if not self.sheen:
+            return rgbas[:, None]
+        light = rgbas.copy()
+        light[:, :3] = np.clip(light[:, :3] + self.sheen, 0, 1)
+        return np.stack([rgbas, light], axis=1)
+
+    def _write_style(self):
+        fills = self._with_sheen(self.fills)
+        strokes = self._with_sheen(self.strokes)
+        for cube, fill, stroke in zip(self.submobjects, fills, strokes):
+            for face in cube.submobjects:
+                face.fill_rgbas = fill.copy()
+                face.stroke_rgbas = stroke.copy()
+        return self
+
+    def _pull(self):
+        # Animation / rotate / scale ne faces badle hon to arrays unse lo
+        shape = self.mesh.shape
+        for i, cube in enumerate(self.submobjects):
+            faces = cube.submobjects
+            if len(faces) != shape[0] or any(face.points.shape != shape[1:] for face in faces):
+                continue
+            points = np.concatenate([face.points for face in faces])
+            center = points.mean(axis=0)
+            self.positions[i] = center
+            self.bases[i] = (self._unmesh @ (points - center)).T
+            self.fills[i] = faces[0].fill_rgbas[0]
+            self.strokes[i] = faces[0].stroke_rgbas[0]
+        return self
+
+    # ---------------------------------------------------------
+    # PER-INSTANCE SETTERS (animate ke saath bhi chalte hain)
+    # ---------------------------------------------------------
+    def set_positions(self, positions):
+        self._pull()
+        self.positions = np.array(positions, dtype=float).reshape(len(self.submobjects), 3)
+        return self._write_points()
+
+    def shift_instances(self, offsets):
+        """Move every instance by its own offset (one row of ``offsets`` each, or one for all)."""
+        self._pull()
+        return self.set_positions(self.positions + np.asarray(offsets, dtype=float))
+
+    def set_instance_colors(self, colors, stroke_colors=None):
+        self._pull()
+        self.fills[:, :3] = _rgbs(colors, len(self.submobjects))
+        if stroke_colors is not None:
+            self.strokes[:, :3] = _rgbs(stroke_colors, len(self.submobjects))
+        return self._write_style()
+
+    def set_instance_opacities(self, opacities):
+        self._pull()
+        self.fills[:, 3] = opacities
+        return self._write_style()
+
+    # set_color / set_opacity inhi do se guzarte hain
+    def set_fill(self, color=None, opacity=None, family=True):
+        if not family or "fills" not in self.__dict__:
+            return super().set_fill(color, opacity, family)
+        self._pull()
+        if color is not None:
+            self.fills[:, :3] = _rgbs(color, len(self.submobjects))
+        if opacity is not None:
+            self.fills[:, 3] = opacity
+        return self._write_style()
+
+    def set_stroke(self, color=None, width=None, opacity=None, background=False, family=True):
+        if background or not family or "strokes" not in self.__dict__:
+            return super().set_stroke(color, width, opacity, background, family)
+        self._pull()
+        if color is not None:
+            self.strokes[:, :3] = _rgbs(color, len(self.submobjects))
+        if opacity is not None:
+            self.strokes[:, 3] = opacity
+        if width is not None:
+            for cube in self.submobjects:
+                for face in cube.submobjects:
+                    face.stroke_width = width
+        return self._write_style()
+
+
+class FadeInInstances(Animation):
+    """LaggedStart of ``FadeIn(cube, shift=shift)`` over every instance, as one array update per frame."""
+
+    def __init__(self, cubes, shift=ORIGIN, lag_ratio=0.0, instance_rate_func=smooth, **kwargs):
+        super().__init__(cubes, introducer=True, **kwargs)
+        self.shift_vector = np.asarray(shift, dtype=float)
+        self.instance_lag = lag_ratio
+        self.instance_rate_func = instance_rate_func
+
+    def begin(self):
+        # Aakhri haalat arrays mein; beech ke frames isi se bante hain
+        cubes = self.mobject._pull()
+        self.end_positions = cubes.positions.copy()
+        self.end_fills = cubes.fills.copy()
+        self.end_strokes = cubes.strokes.copy()
+        super().begin()
+
+    def create_starting_mobject(self):
+        # Shuruaat arrays se banti hai, poore group ki copy ki zaroorat nahi
+        return Mobject()
+
+    def interpolate_mobject(self, alpha):
+        cubes = self.mobject
+        # LaggedStart jaisa: har eent ka apna sub-alpha, phir FadeIn ka rate_func
+        count = len(self.end_positions)
+        index = np.arange(count)
+        full = (count - 1) * self.instance_lag + 1
+        sub = np.clip(self.rate_func(alpha) * full - index * self.instance_lag, 0, 1)
+        a = np.array([self.instance_rate_func(s) for s in sub])
+        cubes.positions = self.end_positions - (1 - a)[:, None] * self.shift_vector
+        cubes.fills = self.end_fills.copy()
+        cubes.fills[:, 3] *= a
+        cubes.strokes = self.end_strokes.copy()
+        cubes.strokes[:, 3] *= a
+        cubes._write_points()
+        cubes._write_style()
@@ -0,0 +1,231 @@
+"""
+Project:  Binary Decode / code Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize). All Rights Reserved.
+
+This code is proprietary and confidential. 
+Unauthorized copying, modification, distribution, or use of this file, 
+via any medium, is strictly prohibited.
+"""
+import numpy as np
+
+# --- L/G Codec: Nashtam, Uddishta, Pratiloma ---
+# Prastaar ki row number r (1 se shuru) aur uska L/G pattern ek hi cheez hai:
+# (r - 1) ko binary mein likho, pehla akshar = bit 0, L = 1 aur G = 0.
+#   22 -> 21 = 0b10101 -> L G L G L
+# Pingala ka halving (Nashtam), ulta doubling (Pratiloma) aur Kedara ki
+# 1, 2, 4, 8... wali table, teeno isi bit-packing ke alag tareeke hain.
+#
+# Packed patterns aur row numbers dono uint64 arrays hain (63 aksharon tak,
+# kyunki aakhri row 2^n ko bhi fit hona hai). Usse lambe patterns par dono
+# taraf Python ints (object arrays) use hote hain.
+
+LAGHU = "L"
+GURU = "G"
+MAX_PACKED = 63
+
+
+def _is_packed(length):
+    return length <= MAX_PACKED
+
+
+def _check_length(length):
+    if length < 1:
+        raise ValueError("Pattern length must be at least 1, got %r" % (length,))
+
+
+# ---------------------------------------------------------
+# BATCH: ROW NUMBER <-> PACKED PATTERN
+# ---------------------------------------------------------
+def nashtam(indices, length):
+    """Row numbers (1-based) to packed L/G patterns of ``length`` syllables."""
+    _check_length(length)
+    if _is_packed(length):
+        idx = np.asarray(indices)
+        if idx.dtype.kind == "i" and np.any(idx < 1):
+            raise ValueError("Row numbers must lie in 1..2^%d" % length)
+        idx = idx.astype(np.uint64)
+        if np.any(idx < 1) or np.any(idx > np.uint64(1 << length)):
+            raise ValueError("Row numbers must lie in 1..2^%d" % length)
+        return idx - np.uint64(1)
+
+    idx = np.asarray(indices, dtype=object)
+    limit = 1 << length
+    bits = np.empty(idx.shape, dtype=object)
+    for pos, val in np.ndenumerate(idx):
+        val = int(val)
+        if val < 1 or val > limit:
+            raise ValueError("Row numbers must lie in 1..2^%d" % length)
+        bits[pos] = val - 1
+    return bits
+
+
+def uddishta(patterns, length):
+    """Packed L/G patterns back to their 1-based row numbers."""
+    _check_length(length)
+    if _is_packed(length):
+        return np.asarray(patterns, dtype=np.uint64) + np.uint64(1)
+    bits = np.asarray(patterns, dtype=object)
+    return bits + 1
+
+
+def unpack(patterns, length):
+    """Packed patterns to a ``(..., length)`` uint8 matrix, 1 = L and 0 = G."""
+    _check_length(length)
+    if _is_packed(length):
+        # Har uint64 ke 8 bytes ko little-endian bits mein khol do
+        bits = np.asarray(patterns, dtype="<u8")
+        flat = np.unpackbits(np.ascontiguousarray(bits).view(np.uint8), bitorder="little")
+        return flat.reshape(bits.shape + (64,))[..., :length]
+
+    bits = np.asarray(patterns, dtype=object)
+    out = np.empty(bits.shape + (length,), dtype=np.uint8)
+    for pos, val in np.ndenumerate(bits):
+        val = int(val)
+        out[pos] = [(val >> i) & 1 for i in range(length)]
+    return out
+
+
+def pack(matrix):
+    """Inverse of :func:`unpack`: last axis holds the syllables, 1 = L."""
+    matrix = np.asarray(matrix, dtype=np.uint8)
+    length = matrix.shape[-1]
+    _check_length(length)
+    if _is_packed(length):
+        padded = np.zeros(matrix.shape[:-1] + (64,), dtype=np.uint8)
+        padded[..., :length] = matrix
+        packed = np.packbits(padded, axis=-1, bitorder="little")
+        return np.ascontiguousarray(packed).view("<u8")[..., 0].astype(np.uint64)
+
+    flat = matrix.reshape(-1, length)
+    out = np.empty(flat.shape[0], dtype=object)
+    for row, syllables in enumerate(flat):
+        out[row] = int("".join("1" if s else "0" for s in syllables[::-1]), 2)
+    return out.reshape(matrix.shape[:-1])
+
+
+# ---------------------------------------------------------
+# TEXT VIEWS: "L G L G L" <-> packed
+# ---------------------------------------------------------
+def to_text(patterns, length, sep=" ", symbols=GURU + LAGHU, mirror=False):
+    """Packed patterns to strings such as ``"L G L G L"`` (vectorized).
+
+    ``symbols`` gives the glyphs for G and L (``"01"`` prints Pingala's
+    binary) and ``mirror`` writes the last syllable first, which turns that
+    binary into the modern number ``r - 1``.
+    """
+    table = np.frombuffer(symbols.encode("ascii"), dtype=np.uint8)
+    syllables = unpack(patterns, length)
+    if mirror:
+        syllables = syllables[..., ::-1]
+    glyphs = table[syllables]
+    if sep:
+        # Har akshar ke baad separator column, aakhri wala kaat do
+        sep_code = np.frombuffer(sep.encode("ascii"), dtype=np.uint8)
+        cols = np.empty(glyphs.shape[:-1] + (length, 1 + len(sep_code)), dtype=np.uint8)
+        cols[..., 0] = glyphs
+        cols[..., 1:] = sep_code
+        glyphs = cols.reshape(glyphs.shape[:-1] + (-1,))[..., : -len(sep_code)]
+    width = glyphs.shape[-1]
+    raw = np.ascontiguousarray(glyphs).view("S%d" % width)[..., 0]
+    return raw.astype("U%d" % width)
+
+
+def from_text(patterns):
+    """One pattern (``"LGLGL"``, ``"L G L G L"`` or a list of chars) or a list of them."""
+    single = isinstance(patterns, str) or (
+        len(patterns) > 0 and all(isinstance(p, str) and len(p) == 1 for p in patterns)
+    )
+    rows = [patterns] if single else list(patterns)
+
+    cleaned = []
+    for row in rows:
+        chars = [c for c in row if not c.isspace()]
+        bad = set(chars) - {LAGHU, GURU}
+        if bad:
+            raise ValueError("Patterns may only contain L and G, got %r" % sorted(bad))
+        cleaned.append(chars)
+
+    length = len(cleaned[0])
+    if any(len(c) != length for c in cleaned):
+        raise ValueError("All patterns in a batch must have the same length")
+    matrix = np.array([[c == LAGHU for c in chars] for chars in cleaned], dtype=np.uint8)
+    packed = pack(matrix)
+    return packed[0] if single else packed
+
+
+# ---------------------------------------------------------
+# TRACES: jo steps scenes animate karti hain
+# ---------------------------------------------------------
+def trace_values(indices, length):
+    """Batch trace: column i is the running number before syllable i.
+
+    Pingala's halving goes left to right through the columns and the
+    Pratiloma doubling walks them right to left; both visit the same values,
+    ``((r - 1) >> i) + 1``, ending at 1 in column ``length``.
+    """
+    bits = nashtam(indices, length)
+    if _is_packed(length):
+        shifts = np.arange(length + 1, dtype=np.uint64)
+        return (bits[..., None] >> shifts) + np.uint64(1)
+
+    out = np.empty(bits.shape + (length + 1,), dtype=object)
+    for pos, val in np.ndenumerate(bits):
+        out[pos] = [(val >> i) + 1 for i in range(length + 1)]
+    return out
+
+
+def nashtam_steps(index, length):
+    """Pingala's halving for one row: ``(value, parity, symbol, next_value)`` per syllable."""
+    values = trace_values([index], length)[0]
+    steps = []
+    for i in range(length):
+        curr = int(values[i])
+        if curr % 2 == 0:
+            steps.append((curr, "EVEN", LAGHU, int(values[i + 1])))
+        else:
+            steps.append((curr, "ODD", GURU, int(values[i + 1])))
+    return steps
+
+
+def pratiloma_steps(pattern, skip_trailing=False):
+    """Reverse walk, right to left: ``(position, symbol, op, before, after)``.
+
+    ``op`` is ``"x2"`` for L and ``"x2-1"`` for G. Trailing Gs leave the
+    value at 1 (2 * 1 - 1 = 1), so with ``skip_trailing`` they are reported
+    as ``"skip"`` instead; the final row number is the same either way.
+    """
+    chars = [c for c in pattern if not c.isspace()]
+    steps = []
+    current = 1
+    first_l_found = not skip_trailing
+    for pos in range(len(chars) - 1, -1, -1):
+        char = chars[pos]
+        if char not in (LAGHU, GURU):
+            raise ValueError("Patterns may only contain L and G, got %r" % (char,))
+        if not first_l_found and char == GURU:
+            steps.append((pos, char, "skip", current, current))
+            continue
+        first_l_found = True
+        new_val = current * 2 if char == LAGHU else current * 2 - 1
+        steps.append((pos, char, "x2" if char == LAGHU else "x2-1", current, new_val))
+        current = new_val
+    return steps
+
+
+def kedara_steps(pattern):
+    """Kedara's table, left to right: ``(place_value, symbol, running_row)``.
+
+    Place values 1, 2, 4, 8... sit above the syllables; the row number is
+    1 plus the place values above the Ls, so ``running_row`` starts at 1.
+    """
+    chars = [c for c in pattern if not c.isspace()]
+    steps = []
+    running = 1
+    for i, char in enumerate(chars):
+        if char not in (LAGHU, GURU):
+            raise ValueError("Patterns may only contain L and G, got %r" % (char,))
+        place = 1 << i
+        if char == LAGHU:
+            running += place
+        steps.append((place, char, running))
+    return steps
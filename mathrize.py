@@ -7,6 +7,7 @@ Unauthorized copying, modification, distribution, or use of this file,
 via any medium, is strictly prohibited.
 """
 from manim import *
+from lg_codec import nashtam_steps
 
 class PingalaCinematicLogic(ThreeDScene):
     def construct(self):
@@ -28,13 +29,10 @@ class PingalaCinematicLogic(ThreeDScene):
         self.play(Write(main_num), run_time=1.5)
         self.wait(0.5)
 
-        # 3. THE STEPS DATA
+        # 3. THE STEPS DATA (Pingala ka halving, shared codec se)
         steps = [
-            ("22", "EVEN", "22 / 2", "L", 11),
-            ("11", "ODD", "(11+1) / 2", "G", 6),
-            ("6", "EVEN", "6 / 2", "L", 3),
-            ("3", "ODD", "(3+1) / 2", "G", 2),
-            ("2", "EVEN", "2 / 2", "L", 1),
+            (str(curr), parity, "%d / 2" % curr if parity == "EVEN" else "(%d+1) / 2" % curr, char, next_val)
+            for curr, parity, char, next_val in nashtam_steps(num_val, 5)
         ]
 
         result_chars = VGroup()
@@ -7,18 +7,17 @@ Unauthorized copying, modification, distribution, or use of this file,
 via any medium, is strictly prohibited.
 """
 from manim import *
-import random
+from lg_codec import kedara_steps
+from starfield import Starfield
+from timeline import Timeline
 
 class ArchitectVsEngineerHighTech(ThreeDScene):
     def construct(self):
         # 1. PREMIUM BLACK BACKGROUND & SPACE THEME
         self.camera.background_color = BLACK
-        stars = VGroup(*[
-            Dot(radius=random.uniform(0.01, 0.03), color=WHITE, fill_opacity=random.uniform(0.1, 0.4)).move_to(
-                [random.uniform(-8, 8), random.uniform(-5, 5), random.uniform(-2, 2)]
-            ) for _ in range(100)
-        ])
-        self.add(stars)
+        # Taare camera background mein bake; drone rotation mein bhi lagbhag free
+        stars = Starfield(100, extent=[8, 5, 2], size_range=(3, 7), opacity_range=(0.1, 0.4))
+        stars.bake(self)
 
         # High-Tech Colors
         color_G = "#FFD700" # Premium Gold
@@ -80,13 +79,15 @@ class ArchitectVsEngineerHighTech(ThreeDScene):
         # ---------------------------------------------------------
         kedar_table = VGroup()
         
-        # Top Row (Powers of 2)
-        powers = ["1", "2", "4", "8", "16", "32", "64", "128"]
+        # Bottom Row (L and G Sequence)
+        sequence = ["L", "L", "G", "L", "L", "G", "G", "G"]
+
+        # Top Row (Powers of 2) - Kedara table ke place values
+        powers = [str(place) for place, _, _ in kedara_steps(sequence)]
         top_row = VGroup(*[get_premium_box(p, WHITE, w=1.0, h=0.6) for p in powers])
         top_row.arrange(RIGHT, buff=0)
 
-        # Bottom Row (L and G Sequence)
-        sequence = ["L", "L", "G", "L", "L", "G", "G", "G"]
+        # Bottom Row boxes
         bot_row = VGroup(*[get_premium_box(c, color_G if c=="G" else color_L, w=1.0, h=0.6) for c in sequence])
         bot_row.arrange(RIGHT, buff=0)
 
@@ -108,17 +109,14 @@ class ArchitectVsEngineerHighTech(ThreeDScene):
         # PART 4: HIGH-TECH BOOT UP EFFECT
         # ---------------------------------------------------------
         # A fast "data-loading" pulse runs through the Powers of 2 row
+        # (ek Timeline, ek play; har box ka frame aur number saath saath)
+        boot = Timeline()
         for box in top_row:
-            self.play(
-                box[0].animate.set_stroke(color_tech, width=5).set_fill(color_tech, opacity=0.2),
-                box[1].animate.set_color(color_tech),
-                run_time=0.06
-            )
-            self.play(
-                box[0].animate.set_stroke(WHITE, width=2).set_fill(BLACK, opacity=0.8),
-                box[1].animate.set_color(WHITE),
-                run_time=0.06
-            )
+            boot.key(box[0], lambda m: m.set_stroke(color_tech, width=5).set_fill(color_tech, opacity=0.2), 0.06, smooth)
+            boot.key(box[1], lambda m: m.set_color(color_tech), 0.06, smooth, parallel=True)
+            boot.key(box[0], lambda m: m.set_stroke(WHITE, width=2).set_fill(BLACK, opacity=0.8), 0.06, smooth)
+            boot.key(box[1], lambda m: m.set_color(WHITE), 0.06, smooth, parallel=True)
+        self.play(boot.compile())
 
         # Final Cinematic Frame Lock
         frame_box = SurroundingRectangle(kedar_table, color=color_G, buff=0.1, stroke_width=4)
@@ -7,6 +7,7 @@ Unauthorized copying, modification, distribution, or use of this file,
 via any medium, is strictly prohibited.
 """
 from manim import *
+from lg_codec import pratiloma_steps
 
 class MathrizeUltaLogic(ThreeDScene):
     def construct(self):
@@ -48,8 +49,8 @@ class MathrizeUltaLogic(ThreeDScene):
         self.wait(1)
 
         # 3. Dynamic Number Tracker (Starts at 1)
-        current_val = 1
-        number_display = Integer(current_val).scale(3)
+        steps = pratiloma_steps(chars)
+        number_display = Integer(steps[0][3]).scale(3)  # Codec ki shuruaati value (1)
         number_display.set_color(YELLOW)
         number_display.next_to(letters, DOWN, buff=2)
         
@@ -62,20 +63,17 @@ class MathrizeUltaLogic(ThreeDScene):
         self.play(Create(scanner))
         self.wait(0.5)
 
-        # 4. The Ulta Logic Execution (Right to Left)
-        for i in range(4, -1, -1):
-            char = chars[i]
+        # 4. The Ulta Logic Execution (Right to Left, shared codec ke steps)
+        for i, char, op, _, new_val in steps:
             target_letter = letters[i]
 
             self.move_camera(phi=65 * DEGREES, theta=(-45 + (4-i)*5) * DEGREES, run_time=1)
             self.play(scanner.animate.move_to(target_letter), run_time=0.8)
             self.play(target_letter.animate.set_color(cyan_color).scale(1.2), run_time=0.3)
 
-            if char == "L":
-                new_val = current_val * 2
+            if op == "x2":
                 op_text = MathTex(r"\times 2").scale(1.5).set_color(GREEN)
-            else: # char == "G"
-                new_val = (current_val * 2) - 1
+            else: # op == "x2-1"
                 op_text = MathTex(r"\times 2 - 1").scale(1.5).set_color(RED)
 
             op_text.next_to(target_letter, UP, buff=0.8)
@@ -94,7 +92,6 @@ class MathrizeUltaLogic(ThreeDScene):
                 run_time=0.4
             )
 
-            current_val = new_val
             self.wait(0.5)
 
         # 5. Final Cinematic Pull-out
@@ -0,0 +1,148 @@
+"""
+Project:  Binary Decode / code Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize). All Rights Reserved.
+
+This code is proprietary and confidential. 
+Unauthorized copying, modification, distribution, or use of this file, 
+via any medium, is strictly prohibited.
+"""
+from lg_codec import LAGHU, GURU
+from meru_engine import meru_value
+
+# --- Matra-Meru (Hemachandra / Fibonacci) ---
+# Matra-vritta mein aksharon ki ginti nahi, beats (matra) ginte hain:
+# Laghu = 1, Guru = 2. "Na Ta To" = L G G = 1 + 2 + 2 = 5 matra.
+# m matra ke kitne patterns?  count(m) = count(m - 1) + count(m - 2) = F(m + 1)
+#   1, 1, 2, 3, 5, 8, 13, ...
+# Matra-Meru ka khaana (m, g) = g Guru wale m-matra patterns = C(m - g, g).
+#
+# Row numbering (Nashtam / Uddishta) Zeckendorf mein hai: jo Guru beat s se
+# shuru hota hai wo F(s + 2) deta hai. Do Guru kabhi aas-paas ke Fibonacci
+# nahi le sakte (har Guru 2 beats khata hai), isliye har pattern ek alag
+# Zeckendorf number hai:
+#   row = count(m) - sum(F(s + 2) har Guru ke liye)
+# Varna Prastaar ki tarah row 1 mein sabse zyada Guru hain:
+#   m = 4:  G G,  L L G,  L G L,  G L L,  L L L L
+
+
+def _fib_pair(n):
+    # Fast doubling: (F(n), F(n + 1)), big ints ke saath O(log n) multiplications
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        a, b = (d, c + d) if bit == "1" else (c, d)
+    return a, b
+
+
+def fibonacci(n):
+    """F(n) with F(0) = 0, F(1) = 1."""
+    if n < 0:
+        raise ValueError("Fibonacci index must be non-negative, got %r" % (n,))
+    return _fib_pair(n)[0]
+
+
+def _check_beats(beats):
+    if beats < 0:
+        raise ValueError("Beat count must be non-negative, got %r" % (beats,))
+
+
+def matra_count(beats):
+    """Number of L/G patterns worth ``beats`` matras, ``F(beats + 1)``."""
+    _check_beats(beats)
+    return _fib_pair(beats)[1]
+
+
+def matra_counts(stop):
+    """``matra_count(m)`` for ``m = 0 .. stop - 1``."""
+    out = []
+    a, b = 0, 1
+    for _ in range(stop):
+        out.append(b)
+        a, b = b, a + b
+    return out
+
+
+def matra_meru_row(beats):
+    """Hemachandra's row: patterns of ``beats`` matras with 0, 1, 2, ... Gurus."""
+    _check_beats(beats)
+    return [meru_value(beats - g, g) for g in range(beats // 2 + 1)]
+
+
+def matra_beats(pattern):
+    """Total matras of an ``"LGG..."`` pattern."""
+    chars = [c for c in pattern if not c.isspace()]
+    bad = set(chars) - {LAGHU, GURU}
+    if bad:
+        raise ValueError("Patterns may only contain L and G, got %r" % sorted(bad))
+    return sum(2 if c == GURU else 1 for c in chars)
+
+
+# ---------------------------------------------------------
+# NASHTAM / UDDISHTA (Zeckendorf)
+# ---------------------------------------------------------
+def matra_uddishta(pattern):
+    """Row number (1-based) of an ``"LGG..."`` pattern within its matra count."""
+    chars = [c for c in pattern if not c.isspace()]
+    beats = matra_beats(chars)
+    # (F(s + 2), F(s + 3)) beat s ke saath aage badhta hai
+    lo, hi = 1, 2
+    z = 0
+    for c in chars:
+        if c == GURU:
+            z += lo
+            lo, hi = hi, lo + hi
+        lo, hi = hi, lo + hi
+    return matra_count(beats) - z
+
+
+def matra_nashtam(row, beats):
+    """The ``"LGG..."`` pattern at ``row`` (1-based) of the ``beats``-matra Prastaar."""
+    total = matra_count(beats)
+    if not 1 <= row <= total:
+        raise ValueError("Row numbers must lie in 1..%d" % total)
+    z = total - row
+
+    # Greedy Zeckendorf, bade Fibonacci se neeche: F(m) tak hi jaana padta hai
+    starts = set()
+    lo, hi = _fib_pair(beats)  # (F(i), F(i + 1)) with i = beats
+    i = beats
+    while z and i >= 2:
+        if lo <= z:
+            z -= lo
+            starts.add(i - 2)
+            # Agla Fibonacci chhod do (Zeckendorf: koi do aas-paas nahi)
+            lo, hi = hi - lo, lo
+            i -= 1
+        lo, hi = hi - lo, lo
+        i -= 1
+
+    pattern = []
+    s = 0
+    while s < beats:
+        if s in starts:
+            pattern.append(GURU)
+            s += 2
+        else:
+            pattern.append(LAGHU)
+            s += 1
+    return "".join(pattern)
+
+
+def matra_prastaar(beats):
+    """Yield every pattern of ``beats`` matras in row order (row 1 first)."""
+    _check_beats(beats)
+    # Varna Prastaar wala niyam: pehla G (left se) L bane, right wala hissa
+    # waisa hi, left mein bache matra se jitne ho sake utne G (odd par pehle L)
+    if beats % 2:
+        pattern = [LAGHU] + [GURU] * (beats // 2)
+    else:
+        pattern = [GURU] * (beats // 2)
+    while True:
+        yield "".join(pattern)
+        if GURU not in pattern:
+            return
+        j = pattern.index(GURU)
+        left = sum(2 if c == GURU else 1 for c in pattern[:j]) + 1
+        fill = ([LAGHU] if left % 2 else []) + [GURU] * (left // 2)
+        pattern = fill + [LAGHU] + pattern[j + 1:]
@@ -7,6 +7,8 @@ Unauthorized copying, modification, distribution, or use of this file,
 via any medium, is strictly prohibited.
 """
 from manim import *
+from meru_engine import meru_rows
+from meru_mod import meru_mod_mobject
 
 class PingalaSciFiBlueprint(Scene):
     def construct(self):
@@ -16,14 +18,7 @@ class PingalaSciFiBlueprint(Scene):
         # Neon Orange/Gold color
         neon_color = "#FFA500"
         
-        triangle_data = [
-            [1],
-            [1, 1],
-            [1, 2, 1],
-            [1, 3, 3, 1],
-            [1, 4, 6, 4, 1],
-            [1, 5, 10, 10, 5, 1]
-        ]
+        triangle_data = list(meru_rows(6))
         
         pyramid = VGroup()
         lines_group = VGroup()
@@ -56,6 +51,10 @@ class PingalaSciFiBlueprint(Scene):
         # Glowing effect
         self.play(pyramid.animate.set_opacity(0.6), run_time=0.5)
         self.play(pyramid.animate.set_opacity(1), run_time=0.5)
+
+        # Zoom out: 1024 rows ek hi texture mein (odd khaana = ek pixel, Sierpinski)
+        raster = meru_mod_mobject(1024, p=2, colors=(neon_color,), height=6.5)
+        self.play(FadeOut(pyramid), FadeOut(lines_group), FadeIn(raster, scale=0.2), run_time=1.5)
             
 
         self.wait(3)
@@ -7,6 +7,11 @@ Unauthorized copying, modification, distribution, or use of this file,
 via any medium, is strictly prohibited.
 """
 from manim import *
+import numpy as np
+from meru_engine import meru_rows
+from multinomial_meru import MeruTetrahedron
+from glyph_cache import cached_text
+from instanced_cubes import InstancedCubes
 
 class MeruPrastaar3D(ThreeDScene):
     def construct(self):
@@ -42,49 +47,38 @@ class MeruPrastaar3D(ThreeDScene):
         cube_size = 0.8
         gap = 0.2 # Cubes ke beech ka gap
 
-        # Logic to calculate numbers
-        pascal_data = []
-        for n in range(rows):
-            row_list = []
-            for k in range(n + 1):
-                # nCk formula calculate karne ki jagah simple math
-                val = 1
-                if k > 0 and k < n:
-                    val = pascal_data[n-1][k-1] + pascal_data[n-1][k]
-                row_list.append(val)
-            pascal_data.append(row_list)
+        # Numbers shared Meru engine se aate hain
+        pascal_data = list(meru_rows(rows))
 
         # --- 5. Creating 3D Objects ---
         all_blocks = VGroup() # Saare blocks ka group
 
-        for n in range(rows):
-            for k in range(n + 1):
-                val = pascal_data[n][k]
-                
-                # Positioning logic (Center alignment)
-                x_pos = (k - n / 2) * (cube_size + gap)
-                y_pos = (rows - n) * (cube_size + gap) - 3 # Thoda peeche shift kiya
-                z_pos = 0 # Starting on the grid
-                
-                # The 3D Cube (Transparent & Glowing)
-                cube = Cube(side_length=cube_size)
-                cube.set_style(
-                    fill_color=MY_ORANGE,
-                    fill_opacity=0.2, # Glass effect (Transparent)
-                    stroke_color=MY_GOLD,
-                    stroke_width=2
-                )
-                
-                # The Number Text
-                text = Text(str(val), color=MY_GOLD, font_size=36)
-                # Text ko khada karna hai (Rotate 90 degrees)
-                text.rotate(90 * DEGREES, axis=RIGHT)
-                
-                # Cube aur Text ko ek saath group kiya
-                block_group = VGroup(cube, text)
-                block_group.move_to([x_pos, y_pos, z_pos])
-                
-                all_blocks.add(block_group)
+        # Positioning logic (Center alignment), z = 0: starting on the grid
+        cells = [(n, k) for n in range(rows) for k in range(n + 1)]
+        positions = [
+            [(k - n / 2) * (cube_size + gap), (rows - n) * (cube_size + gap) - 3, 0] # Thoda peeche shift kiya
+            for n, k in cells
+        ]
+
+        # The 3D Cubes (Transparent & Glowing), ek hi mesh se
+        cubes = InstancedCubes(
+            positions, side_length=cube_size, colors=MY_ORANGE,
+            opacities=0.2, # Glass effect (Transparent)
+            stroke_colors=MY_GOLD, stroke_width=2, stroke_opacity=1
+        )
+
+        for cube, (n, k), pos in zip(cubes, cells, positions):
+            val = pascal_data[n][k]
+            
+            # The Number Text
+            text = cached_text(str(val), color=MY_GOLD, font_size=36)
+            # Text ko khada karna hai (Rotate 90 degrees)
+            text.rotate(90 * DEGREES, axis=RIGHT)
+            text.move_to(pos)
+            
+            # Cube aur Text ko ek saath group kiya
+            block_group = VGroup(cube, text)
+            all_blocks.add(block_group)
 
         # --- 6. The Animation (Emerging from Center) ---
         
@@ -106,3 +100,54 @@ class MeruPrastaar3D(ThreeDScene):
         # Scene ko thodi der chalne do taaki camera ghumta rahe
 
         self.wait(5)
+
+
+class MeruTetrahedron3D(ThreeDScene):
+    def construct(self):
+        # --- 1. Colors & Settings ---
+        MY_GOLD = "#FFD700"   # Gold
+        MY_ORANGE = "#FF8C00" # Orange Glow
+
+        # --- 2. Camera Setup ---
+        self.set_camera_orientation(phi=65 * DEGREES, theta=-45 * DEGREES)
+        self.begin_ambient_camera_rotation(rate=0.15)
+
+        # --- 3. Asli 3D Meru: trinomial tetrahedron ---
+        # Layer n ka khaana (i, j) = n! / (i! j! k!), k = n - i - j
+        layers = 4
+        cube_size = 0.6
+        pitch = cube_size + 0.2
+        tetra = MeruTetrahedron(layers)
+
+        # Triangle lattice ke do direction, har layer apne centroid par centered
+        dir_i = np.array([0.5, np.sqrt(3) / 2, 0])
+        dir_j = np.array([1.0, 0, 0])
+
+        all_layers = VGroup()
+        for n in range(layers):
+            i_idx, j_idx, _, values = tetra.cells(n)
+            positions = (np.outer(i_idx, dir_i) + np.outer(j_idx, dir_j) - n / 3 * (dir_i + dir_j)) * pitch
+            positions[:, 2] = (layers - 1 - n) * pitch # Apex sabse upar
+
+            cubes = InstancedCubes(
+                positions, side_length=cube_size, colors=MY_ORANGE, opacities=0.2,
+                stroke_colors=MY_GOLD, stroke_width=2, stroke_opacity=1
+            )
+            layer_group = VGroup()
+            for cube, val, pos in zip(cubes, values, positions):
+                text = cached_text(str(val), color=MY_GOLD, font_size=28)
+                text.rotate(90 * DEGREES, axis=RIGHT)
+                text.move_to(pos)
+                layer_group.add(VGroup(cube, text))
+            all_layers.add(layer_group)
+
+        all_layers.move_to(ORIGIN)
+
+        # --- 4. Layer by layer, upar se neeche ---
+        for layer_group in all_layers:
+            self.play(
+                LaggedStart(*[GrowFromCenter(b) for b in layer_group], lag_ratio=0.1),
+                run_time=1.5
+            )
+
+        self.wait(5)
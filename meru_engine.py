@@ -0,0 +1,194 @@
+"""
+Project:  Binary Decode / code Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize). All Rights Reserved.
+
+This code is proprietary and confidential. 
+Unauthorized copying, modification, distribution, or use of this file, 
+via any medium, is strictly prohibited.
+"""
+import math
+
+import numpy as np
+
+# --- Meru Prastaar Engine ---
+# Ek hi jagah se saari pyramid scenes apni rows lengi.
+# Rows jo int64 mein fit hoti hain (n <= 66) woh numpy arrays hain,
+# usse badi rows Python ke big-int lists hain (arbitrary precision).
+
+MAX_ARRAY_ROW = 66  # C(66, 33) < 2^63 - 1 < C(67, 33)
+
+
+def _mirror(half, n):
+    # Row symmetric hoti hai: C(n, k) == C(n, n - k)
+    tail = half[::-1] if n % 2 else half[:-1][::-1]
+    return half + tail
+
+
+def meru_row(n):
+    """Row ``n`` of the Meru Prastaar, computed directly without rows 0..n-1."""
+    if n < 0:
+        raise ValueError("Row index must be non-negative, got %r" % (n,))
+
+    # Multiplicative walk: C(n, k + 1) = C(n, k) * (n - k) // (k + 1)
+    half = [1]
+    val = 1
+    for k in range(n // 2):
+        val = val * (n - k) // (k + 1)
+        half.append(val)
+
+    row = _mirror(half, n)
+    if n <= MAX_ARRAY_ROW:
+        return np.array(row, dtype=np.int64)
+    return row
+
+
+def meru_rows(stop, start=0):
+    """Lazily yield rows ``start`` .. ``stop - 1``, one addition pass per row."""
+    if start >= stop:
+        return
+
+    row = meru_row(start)
+    yield row
+
+    for n in range(start + 1, stop):
+        if n <= MAX_ARRAY_ROW:
+            # Vectorized: naya row = [0, *row] + [*row, 0]
+            nxt = np.empty(n + 1, dtype=np.int64)
+            nxt[0] = nxt[-1] = 1
+            np.add(row[:-1], row[1:], out=nxt[1:-1])
+        else:
+            prev = row.tolist() if isinstance(row, np.ndarray) else row
+            nxt = [1]
+            nxt.extend([a + b for a, b in zip(prev, prev[1:])])
+            nxt.append(1)
+        row = nxt
+        yield row
+
+
+def meru_value(n, k):
+    """Single cell C(n, k) as a Python int (0 outside the triangle)."""
+    if k < 0 or k > n:
+        return 0
+    return math.comb(n, k)
+
+
+# --- Reverse Lookup: "yeh number kaunsi row mein hai?" ---
+# Chhote values ke liye ek precomputed dict, bade values ke liye har
+# diagonal k par monotone binary search (C(n, k) n ke saath badhta hai).
+
+INDEX_LIMIT = 2 ** 32
+FLOAT_SEARCH_LIMIT = 10 ** 6
+_LOG_FLOAT_SEARCH_LIMIT = math.log(FLOAT_SEARCH_LIMIT)
+
+_small_index = None
+
+
+def _build_small_index():
+    # Sirf interior cells (2 <= k <= n / 2) index hote hain,
+    # k = 0, 1 aur mirror side lookup ke time add hoti hain.
+    index = {}
+    k = 2
+    while math.comb(2 * k, k) <= INDEX_LIMIT:
+        n = 2 * k
+        val = math.comb(n, k)
+        while val <= INDEX_LIMIT:
+            index.setdefault(val, []).append((n, k))
+            n += 1
+            val = val * n // (n - k)
+        k += 1
+    return index
+
+
+def _iroot(x, k):
+    # Floor of the k-th root of a big int (Newton's method)
+    if x < 2:
+        return x
+    log_r = math.log(x) / k
+    if log_r < 700:
+        # Float se shuruaat, thoda upar taaki Newton neeche ki taraf converge kare
+        r = int(math.exp(log_r) * (1 + 1e-12)) + 1
+    else:
+        r = 1 << ((x.bit_length() + k - 1) // k)
+    while True:
+        nxt = ((k - 1) * r + x // r ** (k - 1)) // k
+        if nxt >= r:
+            return r
+        r = nxt
+
+
+def _log_comb(n, k, lgamma_k):
+    return math.lgamma(n + 1) - lgamma_k - math.lgamma(n - k + 1)
+
+
+def _diagonal_search(value, k, log_value):
+    # Pehle float mein andaza: C(n, k) ~ (n - (k - 1) / 2)^k / k!
+    lgamma_k = math.lgamma(k + 1)
+    log_n = (log_value + lgamma_k) / k
+    if log_n < _LOG_FLOAT_SEARCH_LIMIT:
+        n = math.exp(log_n) + (k - 1) / 2
+        # Chhota n: lgamma itna precise hai ki Newton se seedha sahi n mil jaye,
+        # aur exact big-int check sirf tab jab float mein match dikhe
+        for _ in range(6):
+            n = max(n, 2 * k)
+            step = (_log_comb(n, k, lgamma_k) - log_value) / math.log((n + 0.5) / (n - k + 0.5))
+            n -= step
+            if abs(step) < 0.01:
+                break
+        n0 = int(round(n))
+        for cand in (n0 - 1, n0, n0 + 1):
+            if cand >= 2 * k and abs(_log_comb(cand, k, lgamma_k) - log_value) < 1e-6:
+                if math.comb(cand, k) == value:
+                    return cand
+        return None
+
+    # Bada n: AM-GM se (n - (k - 1) / 2)^k / k! >= C(n, k), aur n >> k par dono
+    # lagbhag barabar hain, isliye n ek do-teen cell ki window mein milta hai
+    root = _iroot(value * math.factorial(k), k)
+    lo = max(root + (k - 1) // 2, 2 * k)
+    hi = lo + 3 + k * k // max(root, 1)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if math.comb(mid, k) < value:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo if math.comb(lo, k) == value else None
+
+
+def meru_find(value, num_rows=None):
+    """Every (n, k) with C(n, k) == value, sorted by row.
+
+    ``num_rows`` limits the answer to rows 0 .. num_rows - 1. The value 1
+    sits at both ends of every row, so it needs ``num_rows``.
+    """
+    value = int(value)
+    if value < 1:
+        return []
+    if value == 1:
+        if num_rows is None:
+            raise ValueError("1 appears in every row, pass num_rows to bound the search")
+        return sorted([(n, 0) for n in range(num_rows)] + [(n, n) for n in range(1, num_rows)])
+
+    global _small_index
+    if value <= INDEX_LIMIT:
+        if _small_index is None:
+            _small_index = _build_small_index()
+        interior = list(_small_index.get(value, []))
+    else:
+        interior = []
+        log_value = math.log(value)
+        k, central = 2, 6  # central = C(2k, k), diagonal ka sabse chhota interior cell
+        while central <= value:
+            n = _diagonal_search(value, k, log_value)
+            if n is not None:
+                interior.append((n, k))
+            central = central * (2 * k + 1) * (2 * k + 2) // ((k + 1) * (k + 1))
+            k += 1
+
+    hits = {(value, 1), (value, value - 1)}
+    for n, k in interior:
+        hits.add((n, k))
+        hits.add((n, n - k))
+    if num_rows is not None:
+        hits = {(n, k) for n, k in hits if n < num_rows}
+    return sorted(hits)
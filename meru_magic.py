@@ -7,6 +7,9 @@ Unauthorized copying, modification, distribution, or use of this file,
 via any medium, is strictly prohibited.
 """
 from manim import *
+from meru_engine import meru_rows
+from glyph_cache import cached_text
+from instanced_cubes import InstancedCubes
 
 class MeruRealMagic(ThreeDScene):
     def construct(self):
@@ -42,39 +45,29 @@ class MeruRealMagic(ThreeDScene):
         cube_size = 1.0
         gap = 0.1
         
-        pascal_data = []
-        for n in range(rows):
-            row_list = []
-            for k in range(n + 1):
-                val = 1
-                if k > 0 and k < n:
-                    val = pascal_data[n-1][k-1] + pascal_data[n-1][k]
-                row_list.append(val)
-            pascal_data.append(row_list)
+        pascal_data = list(meru_rows(rows))
+
+        # Position logic (pehle saari positions, phir saare cubes ek mesh se)
+        cells = [(n, k) for n in range(rows) for k in range(n + 1)]
+        positions = [
+            [(k - n / 2) * (cube_size + gap), (rows - n) * (cube_size + gap) - 3, 0]
+            for n, k in cells
+        ]
+        cubes = InstancedCubes(
+            positions, side_length=cube_size, colors=DEEP_ORANGE, opacities=GLASS_OPACITY,
+            stroke_colors=NEON_GOLD, stroke_width=5, stroke_opacity=1
+        )
 
         all_cubes = VGroup()
         
-        for n in range(rows):
-            for k in range(n + 1):
-                val = pascal_data[n][k]
-                # Position logic
-                x_pos = (k - n / 2) * (cube_size + gap)
-                y_pos = (rows - n) * (cube_size + gap) - 3
-                
-                cube = Cube(side_length=cube_size)
-                cube.set_style(
-                    fill_color=DEEP_ORANGE,
-                    fill_opacity=GLASS_OPACITY,
-                    stroke_color=NEON_GOLD,
-                    stroke_width=5, 
-                )
-                
-                text = Text(str(val), color=WHITE, font_size=40, weight=BOLD)
-                text.rotate(90 * DEGREES, axis=RIGHT)
-                
-                group = VGroup(cube, text)
-                group.move_to([x_pos, y_pos, 0]) 
-                all_cubes.add(group)
+        for cube, (n, k), pos in zip(cubes, cells, positions):
+            val = pascal_data[n][k]
+            text = cached_text(str(val), color=WHITE, font_size=40, weight=BOLD)
+            text.rotate(90 * DEGREES, axis=RIGHT)
+            text.move_to(pos)
+            
+            group = VGroup(cube, text)
+            all_cubes.add(group)
 
         # --- 6. ANIMATION 1: APPEAR (FIXED) ---
         # DrawBorderThenFill use kar rahe hain taaki visible ho
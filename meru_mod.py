@@ -0,0 +1,93 @@
+"""
+Project:  Binary Decode / code Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize). All Rights Reserved.
+
+This code is proprietary and confidential. 
+Unauthorized copying, modification, distribution, or use of this file, 
+via any medium, is strictly prohibited.
+"""
+import math
+
+import numpy as np
+
+# --- Mod-p Meru Raster (Sierpinski) ---
+# Hazaron rows ke liye har khaane ka Text banana namumkin hai, par har
+# khaana ek pixel ho to poori Meru ek hi image hai.
+#   p = 2:  C(n, k) odd  <=>  k & (n - k) == 0   (koi carry nahi)
+#   p > 2:  Lucas: C(n, k) mod p = product of C(n_i, k_i) mod p,
+#           n_i, k_i = base-p digits; har digit ek vectorized lookup hai
+# Sab kuch (rows, columns) numpy arrays par, koi Python loop per cell nahi.
+
+
+def _check_prime(p):
+    if p < 2 or any(p % d == 0 for d in range(2, math.isqrt(p) + 1)):
+        raise ValueError("Modulus must be a prime, got %r" % (p,))
+
+
+def meru_mod_rows(stop, p=2, start=0):
+    """``(stop - start, stop)`` matrix: ``C(n, k) mod p`` at ``[n - start, k]``, -1 where ``k > n``."""
+    _check_prime(p)
+    n = np.arange(start, stop, dtype=np.int64)[:, None]
+    k = np.arange(stop, dtype=np.int64)[None, :]
+    inside = k <= n
+
+    if p == 2:
+        out = ((k & (n - k)) == 0).astype(np.int8)
+    else:
+        # C(a, b) mod p, a, b < p (b > a par 0)
+        small = np.zeros((p, p), dtype=np.int64)
+        for a in range(p):
+            for b in range(a + 1):
+                small[a, b] = math.comb(a, b) % p
+        out = np.ones(np.broadcast_shapes(n.shape, k.shape), dtype=np.int64)
+        nn, kk = n.copy(), k.copy()
+        while True:
+            out = out * small[nn % p, kk % p] % p
+            nn, kk = nn // p, kk // p
+            if not (np.any(nn) or np.any(kk)):
+                break
+        out = out.astype(np.int8)
+    return np.where(inside, out, np.int8(-1))
+
+
+def _rgb(color):
+    # Hex, naam ("ORANGE") ya ManimColor (GOLD) - parsing manim ki hi
+    from manim import color_to_int_rgb
+
+    return [int(c) for c in color_to_int_rgb(color)]
+
+
+def meru_mod_pixels(stop, p=2, colors=("#FFA500",), background=None, start=0):
+    """RGBA raster (rows, 2 * stop, 4) of the centered triangle, 2 pixels per cell.
+
+    ``colors[r - 1]`` paints residue ``r`` (cycled if shorter than ``p - 1``);
+    residue 0 and the area outside the triangle take ``background``
+    (transparent when ``None``).
+    """
+    values = meru_mod_rows(stop, p, start)
+    rows = values.shape[0]
+
+    # Row n centered: pixel column x -> khaana k = (x - (stop - 1 - n)) // 2
+    n = np.arange(start, stop)[:, None]
+    x = np.arange(2 * stop)[None, :]
+    shifted = x - (stop - 1 - n)
+    k = shifted // 2
+    valid = (shifted >= 0) & (k <= n)
+    residues = np.where(valid, values[np.arange(rows)[:, None], np.clip(k, 0, stop - 1)], 0)
+
+    palette = np.zeros((p, 4), dtype=np.uint8)
+    if background is not None:
+        palette[0] = _rgb(background) + [255]
+    for r in range(1, p):
+        palette[r] = _rgb(colors[(r - 1) % len(colors)]) + [255]
+    return palette[np.maximum(residues, 0)]
+
+
+def meru_mod_mobject(stop, p=2, colors=("#FFA500",), background=None, start=0, height=6):
+    """:func:`meru_mod_pixels` as a crisp (nearest-neighbour) manim ``ImageMobject``."""
+    from manim import ImageMobject, RESAMPLING_ALGORITHMS
+
+    image = ImageMobject(meru_mod_pixels(stop, p, colors, background, start))
+    image.set_resampling_algorithm(RESAMPLING_ALGORITHMS["nearest"])
+    image.height = height
+    return image
@@ -7,9 +7,22 @@ Unauthorized copying, modification, distribution, or use of this file,
 via any medium, is strictly prohibited.
 """
 from manim import *
-import math
+from meru_engine import meru_rows
+from guru_patterns import GuruPatterns
+from glyph_cache import cached_text
+from sections import checkpoint
+import render_fingerprint
 
 class MeruSciFiHologram(ThreeDScene):
+    def setup(self):
+        super().setup()
+        # Bada mobject tree: manim ke JSON hash ki jagah tez Merkle fingerprint (sirf is render mein)
+        render_fingerprint.install()
+
+    def tear_down(self):
+        render_fingerprint.uninstall()
+        super().tear_down()
+
     def construct(self):
         # 1. DEEP SPACE BACKGROUND
         self.camera.background_color = "#020202"
@@ -49,7 +62,7 @@ class MeruSciFiHologram(ThreeDScene):
             box_group = VGroup(base_bg, corners)
             
             if not is_empty:
-                txt = Text(str(value), font="monospace", weight=BOLD, color=COLOR_NEON_GOLD).scale(0.5)
+                txt = cached_text(str(value), font="monospace", weight=BOLD, color=COLOR_NEON_GOLD).scale(0.5)
                 box_group.add(txt)
                 
             return box_group
@@ -61,12 +74,11 @@ class MeruSciFiHologram(ThreeDScene):
         mountain_empty = VGroup()
         mountain_filled = VGroup()
         
-        for n in range(num_rows):
+        for n, meru_row in enumerate(meru_rows(num_rows)):
             row_empty = VGroup()
             row_filled = VGroup()
-            for k in range(n + 1):
+            for k, val in enumerate(meru_row):
                 row_empty.add(get_hud_box(is_empty=True, color="#333333"))
-                val = math.comb(n, k)
                 row_filled.add(get_hud_box(is_empty=False, value=val, color=COLOR_NEON_CYAN))
                 
             row_empty.arrange(RIGHT, buff=0.1)
@@ -84,6 +96,7 @@ class MeruSciFiHologram(ThreeDScene):
         # ---------------------------------------------------------
         # ACTION 1: INITIAL SCANNING SHOT (Table 22.1)
         # ---------------------------------------------------------
+        checkpoint(self, "ACTION 1")
         # Dramatic low angle, starting close
         self.set_camera_orientation(phi=75 * DEGREES, theta=-80 * DEGREES, zoom=1.8, focal_point=mountain_empty[3].get_center())
         
@@ -97,6 +110,7 @@ class MeruSciFiHologram(ThreeDScene):
         # ---------------------------------------------------------
         # ACTION 2: POPULATING THE DATA (Table 22.2 & 22.3)
         # ---------------------------------------------------------
+        checkpoint(self, "ACTION 2")
         # Drone pulls up and rotates for a better tactical view
         self.move_camera(phi=60 * DEGREES, theta=-90 * DEGREES, focal_point=mountain_empty.get_center(), zoom=1.2, run_time=2)
         
@@ -122,7 +136,11 @@ class MeruSciFiHologram(ThreeDScene):
         # ---------------------------------------------------------
         # ACTION 3: THE Z-AXIS HOLOGRAPHIC REVEAL (Table 22.4)
         # ---------------------------------------------------------
-        target_box = mountain_filled[6][1] # The '6'
+        checkpoint(self, "ACTION 3")
+        # Koi bhi khaana (n, k) chuno: uski poori list neeche hologram banegi
+        target_n, target_k = 6, 1
+        cell = GuruPatterns(target_n, target_k)
+        target_box = mountain_filled[target_n][target_k] # The '6'
         
         # Extreme close up on the '6'
         self.move_camera(phi=50 * DEGREES, focal_point=target_box.get_center(), zoom=2.5, run_time=1.5)
@@ -130,19 +148,13 @@ class MeruSciFiHologram(ThreeDScene):
         # Lock-on animation (turns Orange)
         self.play(target_box.animate.set_color(COLOR_NEON_ORANGE), run_time=0.5)
         
-        hud = Text("EXTRACTING 6-COMBINATION MATRIX...", font="monospace", color=COLOR_NEON_ORANGE).scale(0.15)
+        hud = Text("EXTRACTING %d-COMBINATION MATRIX..." % len(cell), font="monospace", color=COLOR_NEON_ORANGE).scale(0.15)
         hud.next_to(target_box, DOWN, buff=0.2)
         self.play(Write(hud), run_time=0.8)
 
         # Build Table 22.4 using the sci-fi HUD boxes (Error fixed here)
-        grid_data = [
-            ["G", "L", "L", "L", "L", "L"],
-            ["L", "G", "L", "L", "L", "L"],
-            ["L", "L", "G", "L", "L", "L"],
-            ["L", "L", "L", "G", "L", "L"],
-            ["L", "L", "L", "L", "G", "L"],
-            ["L", "L", "L", "L", "L", "G"]
-        ]
+        # Pehla page hi kaafi hai; bade khaanon ki list lazily page-by-page aati hai
+        grid_data = [list(row) for row in cell.text(slice(0, 8), sep="")]
         
         table_22_4 = VGroup()
         for row in grid_data:
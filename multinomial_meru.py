@@ -0,0 +1,94 @@
+"""
+Project:  Binary Decode / code Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize). All Rights Reserved.
+
+This code is proprietary and confidential. 
+Unauthorized copying, modification, distribution, or use of this file, 
+via any medium, is strictly prohibited.
+"""
+import math
+
+import numpy as np
+
+# --- Multinomial Meru (Pascal Tetrahedron aur aage) ---
+# Meru ki har row ek layer hai: C(n, k) = do hisson mein baantna.
+# Teen hisse (i + j + k = n) lo to layer ek triangle hai aur layers ka dher
+# ek tetrahedron:
+#   T(n, i, j) = n! / (i! j! k!),  k = n - i - j
+#   T(n, i, j) = T(n-1, i-1, j) + T(n-1, i, j-1) + T(n-1, i, j)
+# Layer n ek (n+1) x (n+1) array hai ([i, j], i + j > n wale khaane 0),
+# aur agli layer teen shifted additions se banti hai (vectorized).
+#
+# Values jab tak int64 mein fit hon (parts^n < 2^63) tab tak int64,
+# uske baad Python big ints (object arrays), meru_engine ki tarah.
+
+
+def _fits_int64(n, parts):
+    return n * math.log2(parts) < 63
+
+
+def multinomial_layers(stop, parts=3):
+    """Lazily yield layers ``0 .. stop - 1``; layer n has shape ``(n + 1,) * (parts - 1)``."""
+    if parts < 2:
+        raise ValueError("Need at least 2 parts, got %r" % (parts,))
+    dims = parts - 1
+    layer = np.ones((1,) * dims, dtype=np.int64)
+    for n in range(stop):
+        if n:
+            dtype = np.int64 if _fits_int64(n, parts) else object
+            if dtype is object and layer.dtype != object:
+                layer = layer.astype(object)  # Python ints, aage overflow nahi
+            nxt = np.zeros((n + 1,) * dims, dtype=dtype)
+            inner = (slice(0, n),) * dims
+            # Pichhli layer apni jagah (aakhri hissa badha), aur har axis par ek shift
+            nxt[inner] += layer
+            for axis in range(dims):
+                shifted = list(inner)
+                shifted[axis] = slice(1, n + 1)
+                nxt[tuple(shifted)] += layer
+            layer = nxt
+        yield layer
+
+
+def multinomial(n, counts):
+    """Single coefficient ``n! / (c1! c2! ... (n - sum)!)`` for the leading ``counts``."""
+    rest = n - sum(counts)
+    if rest < 0 or any(c < 0 for c in counts):
+        return 0
+    out = 1
+    for c in counts:
+        out *= math.comb(n, c)
+        n -= c
+    return out
+
+
+def trinomial(n, i, j):
+    """T(n, i, j) = n! / (i! j! (n - i - j)!), 0 outside the tetrahedron."""
+    return multinomial(n, (i, j))
+
+
+class MeruTetrahedron:
+    def __init__(self, layers):
+        self.layers = list(multinomial_layers(layers, parts=3))
+
+    def __len__(self):
+        n = len(self.layers)
+        return n * (n + 1) * (n + 2) // 6
+
+    def __getitem__(self, key):
+        """``tetra[n, i, j]``: the coefficient with ``k = n - i - j``."""
+        n, i, j = key
+        if not 0 <= n < len(self.layers):
+            raise IndexError("Layer %r out of range" % (n,))
+        if i < 0 or j < 0 or i + j > n:
+            raise IndexError("Cell (%r, %r) outside layer %r" % (i, j, n))
+        return int(self.layers[n][i, j])
+
+    def layer(self, n):
+        """Layer ``n`` as an ``(n + 1, n + 1)`` array (0 where ``i + j > n``)."""
+        return self.layers[n]
+
+    def cells(self, n):
+        """Layer ``n`` as flat ``(i, j, k, values)`` arrays, ready for cube placement."""
+        i, j = np.nonzero(np.add.outer(np.arange(n + 1), np.arange(n + 1)) <= n)
+        return i, j, n - i - j, self.layers[n][i, j]
@@ -7,6 +7,7 @@ Unauthorized copying, modification, distribution, or use of this file,
 via any medium, is strictly prohibited.
 """
 from manim import *
+from lg_codec import nashtam_steps
 
 class NashtamGravityVFX(ThreeDScene):
     def construct(self):
@@ -29,13 +30,10 @@ class NashtamGravityVFX(ThreeDScene):
         
         self.play(Write(main_num), run_time=1)
 
-        # 3. MATH DATA
+        # 3. MATH DATA (Pingala ka halving, shared codec se)
         steps = [
-            (22, "EVEN", r"\frac{22}{2}", "L", 11),
-            (11, "ODD", r"\frac{11+1}{2}", "G", 6),
-            (6, "EVEN", r"\frac{6}{2}", "L", 3),
-            (3, "ODD", r"\frac{3+1}{2}", "G", 2),
-            (2, "EVEN", r"\frac{2}{2}", "L", 1),
+            (curr, parity, r"\frac{%d}{2}" % curr if parity == "EVEN" else r"\frac{%d+1}{2}" % curr, char, next_val)
+            for curr, parity, char, next_val in nashtam_steps(num_val, 5)
         ]
 
         result_chars = VGroup()
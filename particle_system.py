@@ -0,0 +1,238 @@
+"""
+Project:  Binary Decode / code Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize). All Rights Reserved.
+
+This code is proprietary and confidential. 
+Unauthorized copying, modification, distribution, or use of this file, 
+via any medium, is strictly prohibited.
+"""
+from manim import *
+
+# --- Particle System ---
+# Har particle ke liye ek Dot (VMobject) = 10k particles par scene ruk jaata
+# hai. Yahan saare particles numpy arrays hain:
+#   positions (N, 3), velocities (N, 3), rgbas (N, 4), sizes (N,)
+# aur draw hote hain point clouds (PMobject) se, jo camera seedha pixel
+# array par likhta hai. Har size-level ka ek PMobject (Cairo mein point
+# cloud ki ek hi thickness hoti hai).
+#
+#   particles = ParticleSystem.from_outline(text, 20000, colors=GOLD)
+#   particles.set_velocities(...); particles.add_force(drag(3.0))
+#   particles.start_simulation()      # har frame vectorized step(dt)
+#
+# .animate bhi chalta hai (set_positions, shift, scale, set_opacity...).
+
+
+# ---------------------------------------------------------
+# EMITTERS: kahan se particles nikalenge
+# ---------------------------------------------------------
+def sample_outline(mobject, count, seed=None):
+    """``count`` points spread along the outline of ``mobject`` (by curve length)."""
+    rng = np.random.default_rng(seed)
+    curves = [
+        np.asarray(vm.get_cubic_bezier_tuples(), dtype=float)
+        for vm in mobject.family_members_with_points()
+        if isinstance(vm, VMobject)
+    ]
+    curves = [c for c in curves if len(c)]
+    if not curves:
+        return np.repeat(mobject.get_center()[None], count, axis=0)
+    curves = np.concatenate(curves)  # (M, 4, 3)
+
+    # Lambai ka andaza: chord aur control polygon ka average
+    chord = np.linalg.norm(curves[:, 3] - curves[:, 0], axis=1)
+    poly = np.linalg.norm(np.diff(curves, axis=1), axis=2).sum(axis=1)
+    weights = (chord + poly) / 2 + 1e-9
+    which = rng.choice(len(curves), size=count, p=weights / weights.sum())
+
+    t = rng.random(count)[:, None]
+    mt = 1 - t
+    c = curves[which]
+    return mt ** 3 * c[:, 0] + 3 * mt ** 2 * t * c[:, 1] + 3 * mt * t ** 2 * c[:, 2] + t ** 3 * c[:, 3]
+
+
+def sample_box(center, extent, count, seed=None):
+    """Uniform points in the box ``center +- extent``."""
+    rng = np.random.default_rng(seed)
+    extent = np.broadcast_to(np.asarray(extent, dtype=float), (3,))
+    return np.asarray(center, dtype=float) + rng.uniform(-1, 1, (count, 3)) * extent
+
+
+# ---------------------------------------------------------
+# FORCES: f(system, dt) -> acceleration (N, 3)
+# ---------------------------------------------------------
+def gravity(g=DOWN * 9.8):
+    return lambda system, dt: np.asarray(g, dtype=float)
+
+
+def drag(k):
+    return lambda system, dt: -k * system.velocities
+
+
+def radial(center, strength):
+    """Push away from ``center`` (negative ``strength`` pulls in)."""
+    center = np.asarray(center, dtype=float)
+
+    def force(system, dt):
+        d = system.positions - center
+        return strength * d / (np.linalg.norm(d, axis=1, keepdims=True) + 1e-6)
+    return force
+
+
+def attract(targets, strength, damping=None):
+    """Spring every particle to its own target point."""
+    targets = np.asarray(targets, dtype=float)
+    damping = 2 * np.sqrt(strength) if damping is None else damping
+    return lambda system, dt: strength * (targets - system.positions) - damping * system.velocities
+
+
+def jitter(amplitude, seed=None):
+    rng = np.random.default_rng(seed)
+    return lambda system, dt: rng.normal(0, amplitude, system.positions.shape)
+
+
+class ParticleSystem(Mobject):
+    def __init__(self, positions, velocities=None, colors=WHITE, opacities=1.0, sizes=2, size_levels=4, **kwargs):
+        super().__init__(**kwargs)
+        self.positions = np.array(positions, dtype=float).reshape(-1, 3)
+        count = len(self.positions)
+        self.velocities = np.zeros((count, 3)) if velocities is None else np.array(velocities, dtype=float).reshape(count, 3)
+        self.rgbas = self._to_rgbas(colors, opacities)
+        self.sizes = np.broadcast_to(np.asarray(sizes, dtype=float), (count,)).copy()
+        self.fade_rates = np.zeros(count)  # Har second kitni opacity ghate (lifetime)
+        self.forces = []
+        self.size_levels = size_levels
+        self.max_step = 1 / 60  # Simulation ka sabse bada step (seconds)
+        self._build_layers()
+
+    @classmethod
+    def from_outline(cls, mobject, count, seed=None, **kwargs):
+        """Particles sitting on the outline of ``mobject`` (text-to-particles)."""
+        return cls(sample_outline(mobject, count, seed), **kwargs)
+
+    @classmethod
+    def in_box(cls, center, extent, count, seed=None, **kwargs):
+        return cls(sample_box(center, extent, count, seed), **kwargs)
+
+    def __len__(self):
+        return len(self.positions)
+
+    # ---------------------------------------------------------
+    # ARRAYS <-> POINT CLOUDS
+    # ---------------------------------------------------------
+    def _to_rgbas(self, colors, opacities):
+        count = len(self.positions)
+        if isinstance(colors, (list, tuple, np.ndarray)):
+            if len(colors) != count:
+                raise ValueError("Expected %d colors, got %d" % (count, len(colors)))
+            # Har alag color ka rgba ek hi baar
+            lookup = {}
+            rgbas = np.array([lookup.setdefault(str(c), color_to_rgba(c)) for c in colors], dtype=float)
+        else:
+            rgbas = np.tile(color_to_rgba(colors), (count, 1)).astype(float)
+        rgbas[:, 3] = np.broadcast_to(np.asarray(opacities, dtype=float), (count,))
+        return rgbas
+
+    def _build_layers(self):
+        # Sizes ko kuch levels mein baanto, har level ek PMobject
+        levels = np.unique(self.sizes)
+        if len(levels) > self.size_levels:
+            edges = np.linspace(self.sizes.min(), self.sizes.max(), self.size_levels + 1)
+            bucket = np.clip(np.searchsorted(edges, self.sizes, side="right") - 1, 0, self.size_levels - 1)
+        else:
+            bucket = np.searchsorted(levels, self.sizes)
+        self._layer_index = [np.flatnonzero(bucket == b) for b in np.unique(bucket)]
+        self.submobjects = []
+        for idx in self._layer_index:
+            self.add(PMobject(stroke_width=float(self.sizes[idx].mean())))
+        self._push()
+
+    def _push(self):
+        for layer, idx in zip(self.submobjects, self._layer_index):
+            layer.points = self.positions[idx].copy()
+            layer.rgbas = self.rgbas[idx].copy()
+        return self
+
+    def _pull(self):
+        # Animation (shift / scale / rotate) ne layers badle hon to arrays unse lo
+        for layer, idx in zip(self.submobjects, self._layer_index):
+            if len(layer.points) == len(idx):
+                self.positions[idx] = layer.points
+                self.rgbas[idx] = layer.rgbas
+        return self
+
+    # ---------------------------------------------------------
+    # SETTERS (animate ke saath bhi)
+    # ---------------------------------------------------------
+    def set_positions(self, positions):
+        self._pull()
+        self.positions = np.array(positions, dtype=float).reshape(len(self), 3)
+        return self._push()
+
+    def set_velocities(self, velocities):
+        self.velocities = np.broadcast_to(np.asarray(velocities, dtype=float), (len(self), 3)).copy()
+        return self
+
+    def set_colors(self, colors, opacities=None):
+        self._pull()
+        self.rgbas = self._to_rgbas(colors, self.rgbas[:, 3] if opacities is None else opacities)
+        return self._push()
+
+    def set_opacity(self, opacity, family=True):
+        self._pull()
+        self.rgbas[:, 3] = opacity
+        return self._push()
+
+    def fade(self, darkness=0.5, family=True):
+        # FadeIn / FadeOut isi se chalte hain
+        self._pull()
+        self.rgbas[:, 3] *= 1 - darkness
+        return self._push()
+
+    def set_lifetimes(self, lifetimes):
+        """Fade each particle out linearly over its own lifetime (seconds)."""
+        self._pull()
+        lifetimes = np.broadcast_to(np.asarray(lifetimes, dtype=float), (len(self),))
+        self.fade_rates = self.rgbas[:, 3] / np.maximum(lifetimes, 1e-6)
+        return self
+
+    # ---------------------------------------------------------
+    # SIMULATION
+    # ---------------------------------------------------------
+    def add_force(self, force):
+        self.forces.append(force)
+        return self
+
+    def clear_forces(self):
+        self.forces = []
+        return self
+
+    def step(self, dt):
+        """Vectorized Euler steps of all forces, velocities and fades (split into ``max_step`` pieces)."""
+        if dt <= 0:
+            return self
+        self._pull()
+        # Skipped play / fast-forward ek hi bada dt deta hai: chhote steps mein todo
+        count = int(np.ceil(dt / self.max_step))
+        dt = dt / count
+        for _ in range(count):
+            if self.forces:
+                accel = np.zeros_like(self.positions)
+                for force in self.forces:
+                    accel += force(self, dt)
+                self.velocities += accel * dt
+            self.positions += self.velocities * dt
+            if np.any(self.fade_rates):
+                self.rgbas[:, 3] = np.maximum(self.rgbas[:, 3] - self.fade_rates * dt, 0)
+        return self._push()
+
+    def _simulate(self, mobject, dt):
+        mobject.step(dt)
+
+    def start_simulation(self):
+        self.add_updater(self._simulate)
+        return self
+
+    def stop_simulation(self):
+        self.remove_updater(self._simulate)
+        return self
@@ -0,0 +1,80 @@
+"""
+Project:  Binary Decode / code Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize). All Rights Reserved.
+
+This code is proprietary and confidential. 
+Unauthorized copying, modification, distribution, or use of this file, 
+via any medium, is strictly prohibited.
+"""
+from manim import *
+
+# --- Path Follow Group ---
+# Snake ka updater har frame har segment par move_to + rotate(angle -
+# get_angle()) chalata tha, aur get_angle har baar points se dobara nikalta.
+# Yahan har segment ke points ek baar (rest pose, apne center ke relative)
+# ek hi buffer mein jama hote hain. Har frame:
+#   x_i = start + i * spacing,  y_i = path(x_i + phase),  angle_i = tilt * atan(slope)
+# sab segments ke liye ek numpy call, phir ek hi broadcast mein saare points
+# ghoom kar apni jagah. Angle absolute hai, pichle frame par nirbhar nahi.
+#
+#   snake = PathFollowGroup(*segments, path=lambda x: 0.8 * np.sin(2 * x))
+#   snake.add_updater(lambda m: m.follow(phase_tracker.get_value()))
+#
+# Rest pose construction ke waqt liya jaata hai; baad mein shift / arrange
+# chalega (sirf position), par segments ke andar ke points mat badlo.
+
+
+def _central_slope(path, h=1e-4):
+    return lambda x: (path(x + h) - path(x - h)) / (2 * h)
+
+
+class PathFollowGroup(VGroup):
+    def __init__(self, *segments, path=np.sin, slope=None, spacing=0.8, start=None, tilt=0.5, **kwargs):
+        super().__init__(*segments, **kwargs)
+        self.path = path
+        self.slope = _central_slope(path) if slope is None else slope
+        self.spacing = spacing
+        # Default: snake screen ke beech mein
+        self.start = -spacing * (len(segments) - 1) / 2 if start is None else start
+        self.tilt = tilt
+        self._capture_rest()
+
+    def _capture_rest(self):
+        # Har leaf (points waala mobject) ke points, uske segment ke center se relative
+        self._leaves = []
+        rest, owner = [], []
+        for i, segment in enumerate(self.submobjects):
+            center = segment.get_center()
+            for leaf in segment.family_members_with_points():
+                self._leaves.append((leaf, len(leaf.points)))
+                rest.append(leaf.points - center)
+                owner.append(np.full(len(leaf.points), i))
+        self._rest = np.concatenate(rest) if rest else np.zeros((0, 3))
+        self._owner = np.concatenate(owner) if owner else np.zeros(0, dtype=int)
+        self._offsets = np.cumsum([0] + [n for _, n in self._leaves])
+
+    def layout(self, phase=0.0):
+        """Centers ``(N, 3)`` and angles ``(N,)`` of all segments at ``phase``."""
+        x = self.start + self.spacing * np.arange(len(self.submobjects))
+        centers = np.zeros((len(x), 3))
+        centers[:, 0] = x
+        centers[:, 1] = self.path(x + phase)
+        angles = np.arctan(self.slope(x + phase)) * self.tilt
+        return centers, angles
+
+    def follow(self, phase):
+        """Place every segment on the path at ``phase`` in one vectorized pass."""
+        centers, angles = self.layout(phase)
+        cos, sin = np.cos(angles)[self._owner], np.sin(angles)[self._owner]
+        rx, ry = self._rest[:, 0], self._rest[:, 1]
+        points = np.empty_like(self._rest)
+        points[:, 0] = cos * rx - sin * ry
+        points[:, 1] = sin * rx + cos * ry
+        points[:, 2] = self._rest[:, 2]
+        points += centers[self._owner]
+
+        for (leaf, count), lo in zip(self._leaves, self._offsets):
+            if len(leaf.points) != count:
+                raise ValueError("Segment points changed after construction (%d -> %d)" % (count, len(leaf.points)))
+            leaf.points = points[lo:lo + count]
+        return self
@@ -0,0 +1,124 @@
+"""
+Project:  Binary Decode / code Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize). All Rights Reserved.
+
+This code is proprietary and confidential. 
+Unauthorized copying, modification, distribution, or use of this file, 
+via any medium, is strictly prohibited.
+"""
+from decimal import Decimal, localcontext
+
+# --- Pingala ka 2^n (Chandahsutra 8.28 - 8.31) ---
+# Neeche utro:  n even ho to aadha karo (wapas aate waqt square),
+#               n odd ho to 1 ghatao   (wapas aate waqt x2).
+# Upar chadho:  1 se shuru karke ulte kram mein square / x2.
+#   n = 12:  12 -> 6 -> 3 -> 2 -> 1 -> 0
+#            1 (x2) 2 (sq) 4 (x2) 8 (sq) 64 (sq) 4096
+# Sirf O(log n) steps. Trace mein exponents aur digit counts hain, values
+# nahi, isliye bahut bade n (2^(10^12)) ka trace bhi turant milta hai.
+
+SQUARE = "square"
+DOUBLE = "x2"
+
+
+def _check_exponent(n):
+    if n < 0:
+        raise ValueError("Exponent must be non-negative, got %r" % (n,))
+
+
+def halving_steps(n):
+    """The way down: ``(value, "EVEN" / "ODD", next_value)`` until 0."""
+    _check_exponent(n)
+    steps = []
+    while n:
+        if n % 2 == 0:
+            steps.append((n, "EVEN", n // 2))
+            n //= 2
+        else:
+            steps.append((n, "ODD", n - 1))
+            n -= 1
+    return steps
+
+
+def climbing_steps(n):
+    """The way back up: ``(op, exponent_before, exponent_after, digits_after)``."""
+    steps = []
+    for value, parity, below in reversed(halving_steps(n)):
+        op = SQUARE if parity == "EVEN" else DOUBLE
+        steps.append((op, below, value, digit_count(value)))
+    return steps
+
+
+def pingala_power(n):
+    """``2^n`` computed by actually climbing the trace (square / x2 on big ints)."""
+    value = 1
+    for op, _, _, _ in climbing_steps(n):
+        value = value * value if op == SQUARE else value * 2
+    return value
+
+
+# ---------------------------------------------------------
+# DIGITS + ABBREVIATED DISPLAY (value banaye bina)
+# ---------------------------------------------------------
+def _log10_2(exponent, extra):
+    # e * log10(2), itni precision ke saath ki integer aur pehle `extra` decimal sahi hon
+    with localcontext() as ctx:
+        ctx.prec = len(str(exponent)) + extra + 20
+        return Decimal(exponent) * Decimal(2).log10()
+
+
+def digit_count(exponent):
+    """Decimal digits of ``2^exponent`` (2^e is never a power of ten)."""
+    _check_exponent(exponent)
+    if exponent < 64:
+        return len(str(1 << exponent))
+    return int(_log10_2(exponent, 0)) + 1
+
+
+def leading_digits(exponent, count):
+    """First ``count`` digits of ``2^exponent``."""
+    _check_exponent(exponent)
+    if exponent < 64:
+        return str(1 << exponent)[:count]
+    with localcontext() as ctx:
+        ctx.prec = len(str(exponent)) + count + 20
+        log = _log10_2(exponent, count)
+        mantissa = Decimal(10) ** (log - int(log))
+        return str(int(mantissa * Decimal(10) ** (count - 1)))
+
+
+def trailing_digits(exponent, count):
+    """Last ``count`` digits of ``2^exponent`` (zero-padded)."""
+    _check_exponent(exponent)
+    digits = min(count, digit_count(exponent))
+    return str(pow(2, exponent, 10 ** digits)).zfill(digits)
+
+
+def abbreviate(exponent, head=6, tail=6, sep="..."):
+    """``2^exponent`` as text, ``"107150...069376"`` once it has more than ``head + tail`` digits."""
+    digits = digit_count(exponent)
+    if digits <= head + tail:
+        return str(1 << exponent)
+    return leading_digits(exponent, head) + sep + trailing_digits(exponent, tail)
+
+
+def exponent_table(lengths, head=6, tail=6):
+    """``(n, digits, display)`` for every meter length in ``lengths``."""
+    return [(n, digit_count(n), abbreviate(n, head, tail)) for n in lengths]
+
+
+# ---------------------------------------------------------
+# MATHTEX STRINGS
+# ---------------------------------------------------------
+def power_tex(n, head=6, tail=6):
+    """``"2^{12} = 4096"``, abbreviated with ``\\ldots`` for big n."""
+    return "2^{%d} = %s" % (n, abbreviate(n, head, tail, sep=r"\ldots "))
+
+
+def climb_tex(n, head=6, tail=6):
+    """The climb as one chain: ``1 \\xrightarrow{\\times 2} 2 \\xrightarrow{x^2} 4 ...``."""
+    parts = ["1"]
+    for op, _, after, _ in climbing_steps(n):
+        arrow = r"\xrightarrow{x^2}" if op == SQUARE else r"\xrightarrow{\times 2}"
+        parts.append(arrow + " " + abbreviate(after, head, tail, sep=r"\ldots "))
+    return " ".join(parts)
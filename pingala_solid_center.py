@@ -7,7 +7,11 @@ Unauthorized copying, modification, distribution, or use of this file,
 via any medium, is strictly prohibited.
 """
 from manim import *
-import random
+from prastaar_doubling import PrastaarDoubling
+from sankhya import sankhya_tex
+from glyph_cache import cached_text
+from starfield import Starfield
+from sections import checkpoint
 
 class PingalaSolidCenter(ThreeDScene):
     def construct(self):
@@ -20,17 +24,12 @@ class PingalaSolidCenter(ThreeDScene):
         HUD_COLOR = "#00FFFF" # Cyan (Sci-Fi Text)
         
         # --- 1. AMBIENT PARTICLES ---
-        stars = VGroup()
-        for _ in range(60):
-            s = Dot(radius=random.uniform(0.02, 0.05), color=GRAY)
-            s.move_to([
-                random.uniform(-7, 7),
-                random.uniform(-5, 5),
-                random.uniform(-5, -2) 
-            ])
-            s.set_opacity(random.uniform(0.2, 0.6))
-            stars.add(s)
-        self.add(stars)
+        stars = Starfield(
+            60, center=[0, 0, -3.5], extent=[7, 5, 1.5],
+            size_range=(5, 12), opacity_range=(0.2, 0.6), colors=GRAY,
+            seed=60 # Har section worker mein wahi taare
+        )
+        stars.bake(self)
 
         # --- HELPER: SOLID BLOCK ---
         def create_block(text, width=1.6, height=0.9):
@@ -44,7 +43,7 @@ class PingalaSolidCenter(ThreeDScene):
             if text == "": color = GRAY
             
             # 3. Glowing Text
-            txt = Text(text, font="Georgia", font_size=36, color=color)
+            txt = cached_text(text, font="Georgia", font_size=36, color=color)
             if text != "":
                 txt.set_glow_factor(0.6)
             
@@ -63,11 +62,12 @@ class PingalaSolidCenter(ThreeDScene):
         # ==========================================
         # STEP 1: n = 1 (Center Stage)
         # ==========================================
+        checkpoint(self, "STEP 1")
         
         # --- HUD (Fixed on Screen) ---
         # Using MathTex for perfect formatting
         hud_n = MathTex("n = 1", color=HUD_COLOR).scale(1.5)
-        hud_eq = MathTex("2^1 = 2", color=HUD_COLOR).scale(1.5)
+        hud_eq = MathTex(sankhya_tex(1), color=HUD_COLOR).scale(1.5)
         
         # Position HUD at corners
         hud_n.to_corner(UL, buff=1.0)
@@ -76,9 +76,9 @@ class PingalaSolidCenter(ThreeDScene):
         self.add_fixed_in_frame_mobjects(hud_n, hud_eq)
 
         # --- TABLE CREATION ---
-        b1_g = create_block("G")
-        b1_l = create_block("L")
-        col1 = VGroup(b1_g, b1_l).arrange(DOWN, buff=0.1)
+        # Builder har symbol ka block ek hi baar banata hai, baaki copies hain
+        builder = PrastaarDoubling(create_block, buff=0.1)
+        col1 = builder.start()
         
         # CENTER IT
         col1.move_to(ORIGIN)
@@ -87,93 +87,53 @@ class PingalaSolidCenter(ThreeDScene):
         self.wait(0.5)
 
         # ==========================================
-        # STEP 2: n = 2 (Copy Paste)
-        # ==========================================
-        
-        # --- UPDATE HUD ---
-        self.play(
-            Transform(hud_n, MathTex("n = 2", color=HUD_COLOR).scale(1.5).to_corner(UL, buff=1.0)),
-            Transform(hud_eq, MathTex("2^2 = 4", color=HUD_COLOR).scale(1.5).to_corner(UR, buff=1.0)),
-        )
-
-        # 1. Shift Original Left to make space (Keeping Center balanced)
-        self.play(col1.animate.shift(LEFT * 1.0 + UP * 0.5))
-
-        # 2. COPY PASTE ANIMATION
-        col1_copy = col1.copy()
-        
-        self.play(
-            col1_copy.animate.next_to(col1, DOWN, buff=0.1),
-            run_time=1.0,
-            rate_func=rate_functions.ease_out_back
-        )
-
-        # 3. FILL NEW COLUMN
-        # Create empty blocks
-        col2 = VGroup(*[create_block("") for _ in range(4)]).arrange(DOWN, buff=0.1)
-        col2.next_to(col1, RIGHT, buff=0.1)
-        col2.align_to(col1, UP)
-        
-        # Fill content
-        g_fill = VGroup(create_block("G"), create_block("G")).arrange(DOWN, buff=0.1).move_to(col2[0:2])
-        l_fill = VGroup(create_block("L"), create_block("L")).arrange(DOWN, buff=0.1).move_to(col2[2:4])
-        
-        self.play(FadeIn(g_fill, shift=UP), FadeIn(l_fill, shift=DOWN))
-        
-        # Re-Center the whole group
-        table_2 = VGroup(col1, col1_copy, g_fill, l_fill)
-        self.play(table_2.animate.move_to(ORIGIN)) # SNAP TO CENTER
-        self.wait(0.5)
-
-        # ==========================================
-        # STEP 3: n = 3 (Expansion)
+        # STEP 2..MAX_N: COPY PASTE + NEW COLUMN
         # ==========================================
-        
-        # --- UPDATE HUD ---
-        self.play(
-            Transform(hud_n, MathTex("n = 3", color=HUD_COLOR).scale(1.5).to_corner(UL, buff=1.0)),
-            Transform(hud_eq, MathTex("2^3 = 8", color=HUD_COLOR).scale(1.5).to_corner(UR, buff=1.0)),
-        )
-
-        # 1. Zoom Out slightly & Move to make space
-        self.move_camera(zoom=0.8, run_time=1.0)
-        
-        # 2. Shift Table Left/Up
-        self.play(table_2.animate.shift(LEFT * 1.5 + UP * 1.0))
-
-        # 3. BIG COPY PASTE
-        table_3_copy = table_2.copy()
-        
-        self.play(
-            table_3_copy.animate.next_to(table_2, DOWN, buff=0.1),
-            run_time=1.2,
-            rate_func=rate_functions.ease_out_back
-        )
-
-        # 4. FILL FINAL COLUMN
-        col3_Gs = VGroup(*[create_block("G") for _ in range(4)]).arrange(DOWN, buff=0.1)
-        col3_Ls = VGroup(*[create_block("L") for _ in range(4)]).arrange(DOWN, buff=0.1)
-        
-        col3 = VGroup(col3_Gs, col3_Ls).arrange(DOWN, buff=0.1)
-        col3.next_to(table_2, RIGHT, buff=0.1)
-        col3.align_to(table_2, UP)
-        
-        self.play(
-            LaggedStart(
-                *[GrowFromCenter(m) for m in col3_Gs],
-                *[GrowFromCenter(m) for m in col3_Ls],
-                lag_ratio=0.05
-            ),
-            run_time=1.5
-        )
-        
-        # Re-Center Final Table
-        full_grid = VGroup(table_2, table_3_copy, col3)
-        self.play(full_grid.animate.move_to(ORIGIN)) # PERFECT CENTER
+        # Table 6.5 unit height mein fit hoti hai: 2^n rows, har row kam se kam
+        # 0.2 unit (text padhne layak) -> n = 5 (32 rows). n = 8 par 256 rows
+        # ~0.025 unit = 1080p par 2-3 pixel, sirf dhaariyaan.
+        MIN_ROW_HEIGHT = 0.2
+        MAX_N = int(np.log2(6.5 / MIN_ROW_HEIGHT))
+
+        for n in range(2, MAX_N + 1):
+            checkpoint(self, "STEP %d" % n)
+            # --- UPDATE HUD ---
+            self.play(
+                Transform(hud_n, MathTex(f"n = {n}", color=HUD_COLOR).scale(1.5).to_corner(UL, buff=1.0)),
+                Transform(hud_eq, MathTex(sankhya_tex(n), color=HUD_COLOR).scale(1.5).to_corner(UR, buff=1.0)),
+            )
+
+            # 1. Shift Table Left/Up to make space (Keeping Center balanced)
+            self.play(builder.rows.animate.shift(LEFT * builder.pitch_x / 2 + UP * builder.pitch_y * len(builder.rows) / 2))
+
+            # 2. COPY PASTE ANIMATION (sirf naye blocks bante hain)
+            copied, new_col = builder.grow()
+            
+            self.play(
+                copied.animate.shift(builder.copy_shift),
+                run_time=1.0,
+                rate_func=rate_functions.ease_out_back
+            )
+
+            # 3. FILL NEW COLUMN (upar G, neeche L)
+            self.play(
+                LaggedStart(
+                    *[GrowFromCenter(m) for m in new_col],
+                    lag_ratio=min(0.05, 2.0 / len(new_col))
+                ),
+                run_time=1.5
+            )
+            builder.attach()  # Ab copy aur naya column table ka hissa
+            
+            # Re-Center (aur bada ho gaya ho to frame mein fit karo)
+            full_grid = builder.rows
+            self.play(full_grid.animate.scale_to_fit_height(min(full_grid.height, 6.5)).move_to(ORIGIN)) # SNAP TO CENTER
+            self.wait(0.5)
 
         # ==========================================
         # GRAND FINALE: 360 CAMERA ROTATION
         # ==========================================
+        checkpoint(self, "GRAND FINALE")
         
         # Glow Effect
         self.play(full_grid.animate.set_stroke(opacity=1).scale(1.1), run_time=1)
@@ -7,6 +7,7 @@ Unauthorized copying, modification, distribution, or use of this file,
 via any medium, is strictly prohibited.
 """
 from manim import *
+from font_resolver import best_font, has_script_font
 import numpy as np
 
 class PinkSoundWave(Scene):
@@ -19,14 +20,12 @@ class PinkSoundWave(Scene):
         PINK_WAVE = "#FF007F" # Hot Pink for Guru
 
         # --- FONT & SIZE SETUP ---
-        hindi_font = "Nirmala UI"
-        try:
-            test = Text("अ", font=hindi_font)
-            font_to_use = hindi_font
+        # Devanagari font na ho to transliteration dikhao
+        font_to_use = best_font("devanagari")
+        if has_script_font("devanagari"):
             laghu_txt_content = "अ, इ, उ"
             guru_txt_content = "आ, ई, ऊ"
-        except:
-            font_to_use = "sans-serif"
+        else:
             laghu_txt_content = "a, i, u"
             guru_txt_content = "aa, ee, oo"
 
@@ -0,0 +1,115 @@
+"""
+Project:  Binary Decode / code Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize). All Rights Reserved.
+
+This code is proprietary and confidential. 
+Unauthorized copying, modification, distribution, or use of this file, 
+via any medium, is strictly prohibited.
+"""
+from manim import *
+from lg_codec import LAGHU, GURU
+
+# --- Prastaar Doubling Builder ---
+# n se n + 1: purani table jaisi hai waisi rehti hai, uski ek copy neeche
+# aati hai aur right mein naya column (upar G, neeche L) judta hai.
+#
+# Har symbol ("G", "L") ka block sirf EK baar make_block se banta hai.
+# Baaki saare blocks us prototype ki copy hain, isliye Text dobara shape
+# nahi hota, aur purani rows apni jagah rehti hain (dobara copy / rebuild
+# nahi). Structural sharing NAHI hai: manim mein ek mobject do jagah nahi
+# dikh sakta, to neeche wali copy ke len(rows) * length blocks naye bante
+# hain. Har doubling ka kaam aur memory table ke saath doguni hoti hai
+# (n -> n + 1 = 2^n * n copies + 2^(n + 1) column blocks).
+
+
+class PrastaarDoubling:
+    def __init__(self, make_block, buff=0.1):
+        self.make_block = make_block
+        self.buff = buff
+        self.length = 0
+        self.rows = VGroup()
+        self.copy_shift = ORIGIN
+        self._prototypes = {}
+        self._pending = None  # grow() ke naye blocks, attach() tak rows se bahar
+
+    def _prototype(self, symbol):
+        if symbol not in self._prototypes:
+            self._prototypes[symbol] = self.make_block(symbol)
+        return self._prototypes[symbol]
+
+    def _scale(self):
+        # Scene ne table ko scale kiya ho to naye blocks bhi usi size ke bane
+        if not self.rows:
+            return 1.0
+        return self.rows[0][0].width / self._prototype(GURU).width
+
+    def _block(self, symbol, scale):
+        return self._prototype(symbol).copy().scale(scale)
+
+    @property
+    def pitch_x(self):
+        return (self._prototype(GURU).width + self.buff) * self._scale()
+
+    @property
+    def pitch_y(self):
+        return (self._prototype(GURU).height + self.buff) * self._scale()
+
+    def start(self):
+        """The n = 1 table: one G row and one L row."""
+        self.length = 1
+        self.rows = VGroup(VGroup(self._block(GURU, 1.0)), VGroup(self._block(LAGHU, 1.0)))
+        self.rows.arrange(DOWN, buff=self.buff)
+        return self.rows
+
+    def grow(self):
+        """Build the next doubling and return ``(copied, column)``.
+
+        ``copied`` holds the new copy blocks sitting exactly on top of the
+        existing rows; shifting it by ``copy_shift`` drops it into place.
+        ``column`` is the new last column, already at its final position.
+        Neither is part of ``rows`` (or on screen) until ``attach()``.
+        """
+        if not self.rows:
+            raise ValueError("Call start() before grow()")
+        if self._pending is not None:
+            raise ValueError("Call attach() before growing again")
+
+        scale = self._scale()
+        half = len(self.rows)
+        step_x = RIGHT * self.pitch_x
+        step_y = DOWN * self.pitch_y
+        top_left = self.rows[0][0].get_center()
+
+        copied = VGroup()
+        copy_rows = []
+        for i, row in enumerate(self.rows):
+            cells = []
+            for j, cell in enumerate(row):
+                # Row i ka j-th akshar: (i >> j) ka bit, L = 1
+                symbol = LAGHU if (i >> j) & 1 else GURU
+                cells.append(self._block(symbol, scale).move_to(cell.get_center()))
+            copied.add(*cells)
+            copy_rows.append(cells)
+
+        column = VGroup(*[
+            self._block(GURU if i < half else LAGHU, scale).move_to(top_left + step_x * self.length + step_y * i)
+            for i in range(2 * half)
+        ])
+
+        self._pending = (copy_rows, column)
+        self.copy_shift = step_y * half
+        return copied, column
+
+    def attach(self):
+        """Add the last ``grow()`` blocks to ``rows`` (after they have landed and appeared)."""
+        if self._pending is None:
+            raise ValueError("Nothing to attach, call grow() first")
+        copy_rows, column = self._pending
+        half = len(self.rows)
+        for i in range(half):
+            self.rows[i].add(column[i])
+        for i, cells in enumerate(copy_rows):
+            self.rows.add(VGroup(*cells, column[half + i]))
+        self._pending = None
+        self.length += 1
+        return self.rows
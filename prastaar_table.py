@@ -0,0 +1,87 @@
+"""
+Project:  Binary Decode / code Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize). All Rights Reserved.
+
+This code is proprietary and confidential. 
+Unauthorized copying, modification, distribution, or use of this file, 
+via any medium, is strictly prohibited.
+"""
+import numpy as np
+
+from lg_codec import MAX_PACKED, to_text, unpack, uddishta
+
+# --- Lazy Prastaar Table ---
+# n aksharon ki poori 2^n Prastaar. Row i (0 se) ka packed pattern khud i
+# hai (lg_codec ki convention), isliye table kuch store nahi karti: jo slice
+# maango wahi ban kar aata hai. Strings sirf tab banti hain jab koi column
+# view maange, aur wo bhi sirf us slice ke liye.
+# Rows int64 / len() mein aani chahiye: 2^63 rows na len() de sakta hai na
+# np.arange, isliye length MAX_PACKED se ek kam tak.
+
+MAX_LENGTH = MAX_PACKED - 1
+
+
+class PrastaarTable:
+    def __init__(self, length, chunk_size=1 << 16):
+        if length < 1:
+            raise ValueError("Prastaar length must be at least 1, got %r" % (length,))
+        if length > MAX_LENGTH:
+            raise ValueError("Prastaar length must be at most %d, got %r" % (MAX_LENGTH, length))
+        self.length = length
+        self.size = 1 << length
+        self.chunk_size = chunk_size
+
+    def __len__(self):
+        return self.size
+
+    def _packed(self, key):
+        if isinstance(key, slice):
+            rows = range(self.size)[key]
+            return np.arange(rows.start, rows.stop, rows.step, dtype=np.int64).astype(np.uint64)
+
+        row = range(self.size)[key]  # Negative index aur IndexError range sambhal leta hai
+        return np.uint64(row)
+
+    def __getitem__(self, key):
+        """Packed pattern(s): an int key gives one row, a slice gives an array."""
+        return self._packed(key)
+
+    def __iter__(self):
+        for chunk in self.chunks():
+            yield from chunk
+
+    def chunks(self, start=0, stop=None):
+        """Yield the rows ``start .. stop - 1`` as packed arrays of ``chunk_size``."""
+        stop = self.size if stop is None else min(stop, self.size)
+        for lo in range(start, stop, self.chunk_size):
+            yield self._packed(slice(lo, min(lo + self.chunk_size, stop)))
+
+    # ---------------------------------------------------------
+    # COLUMN VIEWS (drone_standup wale chaaron columns)
+    # ---------------------------------------------------------
+    def row_numbers(self, key=slice(None)):
+        """Pingala's 1-based row numbers."""
+        return uddishta(self._packed(key), self.length)
+
+    def text(self, key=slice(None), sep=" "):
+        """G/L sequences such as ``"L G G G G"``."""
+        return to_text(self._packed(key), self.length, sep=sep)
+
+    def pingala_binary(self, key=slice(None), sep=" "):
+        """Pingala's binary, L = 1, first syllable first: ``"1 0 0 0 0"``."""
+        return to_text(self._packed(key), self.length, sep=sep, symbols="01")
+
+    def mirror_binary(self, key=slice(None), sep=" "):
+        """The mirror image of Pingala's binary, i.e. modern binary of ``r - 1``."""
+        return to_text(self._packed(key), self.length, sep=sep, symbols="01", mirror=True)
+
+    def bits(self, key=slice(None)):
+        """``(rows, length)`` uint8 matrix, 1 = L."""
+        return unpack(self._packed(key), self.length)
+
+    def syllable_column(self, position, key=slice(None)):
+        """One syllable position down the table (1 = L), without the other columns."""
+        if not 0 <= position < self.length:
+            raise IndexError("Syllable position %r out of range" % (position,))
+        packed = self._packed(key)
+        return ((packed >> np.uint64(position)) & np.uint64(1)).astype(np.uint8)
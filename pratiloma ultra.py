@@ -7,6 +7,7 @@ Unauthorized copying, modification, distribution, or use of this file,
 via any medium, is strictly prohibited.
 """
 from manim import *
+from lg_codec import pratiloma_steps
 
 class MathrizeUltaLogic(ThreeDScene):
     def construct(self):
@@ -48,8 +49,8 @@ class MathrizeUltaLogic(ThreeDScene):
         self.wait(1)
 
         # 3. Dynamic Number Tracker (Starts at 1)
-        current_val = 1
-        number_display = Integer(current_val).scale(3)
+        steps = pratiloma_steps(chars, skip_trailing=True)
+        number_display = Integer(steps[0][3]).scale(3)  # Codec ki shuruaati value (1)
         number_display.set_color(YELLOW)
         number_display.next_to(letters, DOWN, buff=2)
         
@@ -63,10 +64,8 @@ class MathrizeUltaLogic(ThreeDScene):
         self.wait(0.5)
 
         # 4. The Ulta Logic Execution (Right to Left)
-        first_l_found = False # Trailing Gs ko skip karne ke liye flag
-
-        for i in range(7, -1, -1): # Loop from index 7 to 0
-            char = chars[i]
+        # Trailing Gs ko codec "skip" mark karta hai (2 * 1 - 1 = 1, value wahi rehti hai)
+        for i, char, op, _, new_val in steps:
             target_letter = letters[i]
 
             # Camera movement adjusted for 8 letters
@@ -75,7 +74,7 @@ class MathrizeUltaLogic(ThreeDScene):
             self.play(target_letter.animate.set_color(cyan_color).scale(1.2), run_time=0.3)
 
             # Check for skipping trailing Gs
-            if not first_l_found and char == "G":
+            if op == "skip":
                 # Print "Skip" text
                 op_text = Text("Skip", font="sans-serif", weight=BOLD).scale(0.8).set_color(GREY)
                 op_text.next_to(target_letter, UP, buff=0.8)
@@ -90,15 +89,9 @@ class MathrizeUltaLogic(ThreeDScene):
                 self.wait(0.3)
                 continue # Skip the calculation step
                 
-            elif char == "L" and not first_l_found:
-                first_l_found = True # Pehla L mil gaya!
-                new_val = current_val * 2
-                op_text = MathTex(r"\times 2").scale(1.2).set_color(GREEN)
-            elif char == "L":
-                new_val = current_val * 2
+            elif op == "x2":
                 op_text = MathTex(r"\times 2").scale(1.2).set_color(GREEN)
-            else: # char == "G" (after first L)
-                new_val = (current_val * 2) - 1
+            else: # op == "x2-1" (G after first L)
                 op_text = MathTex(r"\times 2 - 1").scale(1.2).set_color(RED)
 
             op_text.next_to(target_letter, UP, buff=0.8)
@@ -117,7 +110,6 @@ class MathrizeUltaLogic(ThreeDScene):
                 run_time=0.4
             )
 
-            current_val = new_val
             self.wait(0.5)
 
         # 5. Final Cinematic Pull-out
@@ -0,0 +1,249 @@
+"""
+Project:  Binary Decode / code Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize). All Rights Reserved.
+
+This code is proprietary and confidential. 
+Unauthorized copying, modification, distribution, or use of this file, 
+via any medium, is strictly prohibited.
+"""
+import argparse
+import ast
+import fnmatch
+import glob
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# --- Batch Render Driver ---
+# Saare episode scenes ek command se, saare cores par:
+#   python render_all.py -q h --workers 8 -o renders
+# Scenes AST se dhoondhe jaate hain (file import nahi hoti, manim bhi nahi
+# chahiye): jo class Scene / ThreeDScene / ... se (seedha ya kisi aur scene
+# class ke through) banti hai. Jis file mein koi scene class nahi (jaise
+# "-pqh meru.py" wala fragment) ya jo parse hi na ho, woh skip.
+# Ek hi class naam do files mein ho (MathrizeUltaLogic) to output naam
+# file ke saath: "pratiloma_ultra__MathrizeUltaLogic".
+# Har scene apne manim process aur apne media/<job> folder mein (Tex/ aur
+# texts/ ke cache par do processes ek saath na likhein). renders/manifest.json
+# mein output, time, status aur source digest. Dobara chalao to jo scene "ok"
+# hai, output maujood hai aur uski file (ya uske local imports) nahi badli,
+# woh skip.
+
+SCENE_BASES = {"Scene", "ThreeDScene", "MovingCameraScene", "ZoomedScene", "SpecialThreeDScene", "VectorScene"}
+MANIFEST = "manifest.json"
+
+
+def slug(text):
+    """File / scene name safe for output and log names."""
+    return re.sub(r"[^0-9A-Za-z]+", "_", text).strip("_") or "scene"
+
+
+def _base_name(node):
+    # ``ThreeDScene`` ya ``manim.ThreeDScene`` dono
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def _parse(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return ast.parse(f.read(), filename=path)
+    except (SyntaxError, UnicodeDecodeError, ValueError):
+        return None
+
+
+def scene_classes(path):
+    """Scene subclasses defined at the top level of ``path``, without importing it."""
+    tree = _parse(path)
+    if tree is None:
+        return []
+    classes = {node.name: node for node in tree.body if isinstance(node, ast.ClassDef)}
+    # File ke andar ek scene doosre se bani ho to bhi (jab tak kuch naya na mile)
+    known = set(SCENE_BASES)
+    changed = True
+    while changed:
+        changed = False
+        for name, node in classes.items():
+            if name not in known and any(_base_name(b) in known for b in node.bases):
+                known.add(name)
+                changed = True
+    return sorted((name for name in classes if name in known), key=lambda n: classes[n].lineno)
+
+
+def local_imports(path, root):
+    """Sibling modules of ``root`` imported by ``path``."""
+    tree = _parse(path)
+    if tree is None:
+        return []
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module.split(".")[0])
+    return sorted(n for n in names if os.path.isfile(os.path.join(root, n + ".py")))
+
+
+def source_digest(path, root):
+    """Hash of ``path`` and every local module it (transitively) imports."""
+    h = hashlib.sha1()
+    seen = set()
+    todo = [os.path.abspath(path)]
+    while todo:
+        current = todo.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        todo.extend(os.path.join(root, name + ".py") for name in local_imports(current, root))
+    for current in sorted(seen):
+        h.update(os.path.basename(current).encode())
+        with open(current, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def discover(root, only=None):
+    """Render jobs for every scene under ``root`` (duplicate class names namespaced by file)."""
+    found = []
+    for path in sorted(glob.glob(os.path.join(root, "*.py"))):
+        for name in scene_classes(path):
+            found.append((path, name))
+
+    counts = {}
+    for _, name in found:
+        counts[name] = counts.get(name, 0) + 1
+
+    jobs = []
+    for path, name in found:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        output = name if counts[name] == 1 else "%s__%s" % (slug(stem), name)
+        job = {"id": "%s:%s" % (stem, name), "file": path, "module": stem, "scene": name, "output": output}
+        if only and not any(fnmatch.fnmatch(job["id"], p) or fnmatch.fnmatch(name, p) for p in only):
+            continue
+        jobs.append(job)
+    return jobs
+
+
+def load_manifest(out_dir):
+    try:
+        with open(os.path.join(out_dir, MANIFEST), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"jobs": {}}
+
+
+def save_manifest(out_dir, manifest):
+    # Pehle temp file, phir rename: beech mein ruk gaya to bhi purana manifest sahi
+    path = os.path.join(out_dir, MANIFEST)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    os.replace(path + ".tmp", path)
+
+
+def find_output(media_dir, module, output):
+    """Newest rendered file ``media/videos/<module>/<quality>/<output>.*`` (or None)."""
+    candidates = glob.glob(os.path.join(glob.escape(media_dir), "videos", glob.escape(module), "*", glob.escape(output) + ".*"))
+    return max(candidates, key=os.path.getmtime) if candidates else None
+
+
+def run_manim(args, log_path, cwd, env=None):
+    """Run one manim CLI process with its output in ``log_path``; returns (returncode, seconds)."""
+    env = dict(os.environ, COLUMNS="1000", **(env or {}))  # Rich lambi lines na tode
+    start = time.perf_counter()
+    with open(log_path, "w", encoding="utf-8") as log:
+        proc = subprocess.run(
+            [sys.executable, "-m", "manim"] + args, cwd=cwd, stdout=log, stderr=subprocess.STDOUT, env=env
+        )
+    return proc.returncode, time.perf_counter() - start
+
+
+def render_job(job, root, out_dir, quality="h", extra_args=()):
+    """Render one discovered scene; returns its manifest record."""
+    # Har job ka apna media folder, jaise sections.py mein har section ka
+    media_dir = os.path.join(out_dir, "media", slug(job["id"]))
+    log_path = os.path.join(out_dir, "logs", slug(job["id"]) + ".log")
+    args = ["render", "-q", quality, "--media_dir", media_dir, "-o", job["output"]]
+    args += list(extra_args) + [os.path.abspath(job["file"]), job["scene"]]
+    returncode, seconds = run_manim(args, log_path, root)
+    output = find_output(media_dir, job["module"], job["output"]) if returncode == 0 else None
+    return {
+        "file": os.path.basename(job["file"]),
+        "scene": job["scene"],
+        "output": output,
+        "status": "ok" if output else "failed",
+        "returncode": returncode,
+        "seconds": round(seconds, 2),
+        "quality": quality,
+        "log": log_path,
+    }
+
+
+def render_all(root, out_dir, workers=None, quality="h", only=None, force=False, extra_args=()):
+    """Render every scene under ``root`` in parallel; returns the manifest."""
+    out_dir = os.path.abspath(out_dir)
+    os.makedirs(os.path.join(out_dir, "logs"), exist_ok=True)
+    manifest = load_manifest(out_dir)
+    records = manifest.setdefault("jobs", {})
+
+    todo = []
+    for job in discover(root, only):
+        job["digest"] = source_digest(job["file"], root)
+        done = records.get(job["id"], {})
+        up_to_date = (
+            done.get("status") == "ok" and done.get("digest") == job["digest"]
+            and done.get("quality") == quality and done.get("output") and os.path.exists(done["output"])
+        )
+        if force or not up_to_date:
+            todo.append(job)
+        else:
+            print("skip  %s (up to date)" % job["id"])
+
+    # Har scene ek alag manim process; threads sirf unka intezaar karte hain
+    workers = workers or os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(render_job, job, root, out_dir, quality, extra_args): job for job in todo}
+        for future in as_completed(futures):
+            job = futures[future]
+            record = future.result()
+            record["digest"] = job["digest"]
+            records[job["id"]] = record
+            save_manifest(out_dir, manifest)
+            print("%-6s %s (%.1fs)" % (record["status"], job["id"], record["seconds"]))
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render every manim scene in the project in parallel.")
+    parser.add_argument("root", nargs="?", default=os.path.dirname(os.path.abspath(__file__)), help="folder with the scene files")
+    parser.add_argument("-o", "--out", default="renders", help="output folder (media, logs, manifest.json)")
+    parser.add_argument("-q", "--quality", default="h", choices="lmhpk", help="manim quality flag")
+    parser.add_argument("--workers", type=int, default=None, help="parallel manim processes (default: all cores)")
+    parser.add_argument("--only", nargs="+", default=None, help="glob on 'file:Scene' ids or scene names")
+    parser.add_argument("--force", action="store_true", help="re-render even if the manifest says up to date")
+    parser.add_argument("--list", action="store_true", help="only print the discovered scenes")
+    args, extra = parser.parse_known_args(argv)
+
+    if args.list:
+        for job in discover(args.root, args.only):
+            print("%-45s -> %s" % (job["id"], job["output"]))
+        return
+
+    manifest = render_all(args.root, args.out, args.workers, args.quality, args.only, args.force, extra)
+    # Sirf is run ke scenes: manifest mein filter se bahar ya hata diye gaye scenes bhi hote hain
+    records = manifest["jobs"]
+    failed = [job["id"] for job in discover(args.root, args.only) if records.get(job["id"], {}).get("status") != "ok"]
+    if failed:
+        print("failed: %s" % ", ".join(sorted(failed)))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,370 @@
+"""
+Project:  Binary Decode / code Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize). All Rights Reserved.
+
+This code is proprietary and confidential. 
+Unauthorized copying, modification, distribution, or use of this file, 
+via any medium, is strictly prohibited.
+"""
+import enum
+import hashlib
+import importlib
+import operator
+import types
+import weakref
+
+import numpy as np
+
+# --- Render Fingerprint ---
+# Manim har play() par camera, animations aur poore mobject tree ko JSON mein
+# badal kar crc32 leta hai (partial movie cache ka naam). numpy arrays list
+# bante hain, har attribute dict mein jaata hai -> 56 HUD boxes / 91 cubes
+# wale scenes mein sirf hashing mein seconds.
+# Yahan wahi jaankari Merkle tareeke se:
+#   mobject digest = H(type, apne attributes, apne arrays ke raw bytes,
+#                      har child ka digest)
+# Arrays seedha blake2b mein (buffer, koi copy / list nahi). Ek call ke andar
+# har mobject / animation / function ek hi baar hash hota hai (shared
+# subtrees, target copies), aur function ke code ka digest hamesha ke liye
+# cached. Points in-place badalte hain (shift wagairah), isliye array bytes
+# har call mein dobara padhe jaate hain -- yahi sahi invalidation hai.
+# Har mobject ke apne attributes ka digest calls ke beech cached rehta hai.
+# Dobara check sasta: attributes ki ids ek tuple mein (C mein compare), aur
+# sirf jo in-place badal sakte hain (arrays, lists, dicts, chhote objects)
+# unka content. Sab wahi = attributes ka digest wahi. Doosre mobjects,
+# animations aur functions (closure ka state) har call mein taaze (mobjects
+# ka apna cache). Unchanged tree par bhi har mobject ke arrays ek baar padhe
+# jaate hain, isliye kharcha mobjects ki ginti ke saath badhta hai -- bas
+# poora attribute dict dobara hash nahi hota.
+#
+# install() manim ke modules patch karta hai, isliye sirf scene ke render
+# ke dauraan (import par nahi -- render_all / sections bhi scene files
+# import karte hain):
+#   def setup(self):
+#       super().setup()
+#       render_fingerprint.install()
+#   def tear_down(self):
+#       render_fingerprint.uninstall()
+#       super().tear_down()
+
+DIGEST_SIZE = 8
+_SMALL_ARRAY = 4096  # bytes; isse chhote arrays state key mein seedhe copy
+MAX_DEPTH = 8  # Mobject / Animation ke bahar ki cheezon mein kitna gehra jaayein
+
+# Manim bhi inhe hash nahi karta (har frame badalte hain ya id hain)
+SKIP_KEYS = frozenset(["original_id", "background", "pixel_array", "pixel_array_to_cairo_context", "submobjects"])
+
+_SCALARS = (type(None), bool, int, float, complex, str, bytes)
+_SCALAR_TYPES = frozenset(_SCALARS)
+
+_code_digests = {}  # id(code) -> (code, digest); code ko pakad ke rakho taaki id dobara na aaye
+
+# Jin modules mein manim ka get_hash_from_play_call naam se pada hai
+_HASH_MODULES = (
+    "manim.utils.hashing",
+    "manim.utils.caching",
+    "manim.renderer.cairo_renderer",
+    "manim.renderer.opengl_renderer",
+)
+_originals = {}  # module naam -> manim ka apna function (uninstall ke liye)
+
+# mobject -> (attribute naam, values, chhote arrays ke naam, unki bytes,
+#            baaki [(naam, content token)], live naam, refs, attributes ka digest)
+_mobject_digests = weakref.WeakKeyDictionary()
+
+
+def _new_hash(tag):
+    h = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    h.update(tag.encode())
+    return h
+
+
+def _qualname(obj):
+    return "%s.%s" % (getattr(obj, "__module__", "?"), getattr(obj, "__qualname__", type(obj).__name__))
+
+
+def _array_digest(value):
+    h = _new_hash("array")
+    h.update(("%s%r" % (value.dtype.str, value.shape)).encode())
+    if value.dtype.hasobject:
+        h.update(repr(value.tolist()).encode())
+    else:
+        h.update(np.ascontiguousarray(value).data)
+    return h.digest()
+
+
+def _is_live(value):
+    # Har call mein taaza hash: mobject / animation (apna cache) aur functions (closure)
+    if isinstance(value, (types.FunctionType, types.MethodType)):
+        return True
+    if isinstance(value, (list, tuple)):
+        return any(_is_live(item) for item in value)
+    if isinstance(value, dict):
+        return any(_is_live(item) for item in value.values())
+    return not isinstance(value, (_SCALARS, np.ndarray)) and (
+        hasattr(value, "submobjects") or hasattr(value, "run_time")
+    )
+
+
+def _is_mutable(value):
+    # Jo id badle bina badal sakta hai
+    if isinstance(value, (np.ndarray, list, tuple, dict, set)):
+        return True
+    return hasattr(value, "__dict__") and not isinstance(value, (type, enum.Enum))
+
+
+def _small_array_token(value):
+    # Chhote arrays (points, rgbas) ki bytes hi token: hash se sasta
+    return (value.shape, value.tobytes())
+
+
+def _state_token(value, refs, depth=0):
+    # Sasta, comparable roop: content badla to token badlega
+    if isinstance(value, _SCALARS):
+        return (type(value), value)
+    if isinstance(value, np.generic):
+        return (type(value), value.item())
+    if isinstance(value, np.ndarray):
+        if value.nbytes <= _SMALL_ARRAY and not value.dtype.hasobject:
+            return (value.dtype.str,) + _small_array_token(value)
+        return _array_digest(value)
+    if depth < MAX_DEPTH and _is_mutable(value):
+        if isinstance(value, (list, tuple)):
+            return (type(value),) + tuple(_state_token(item, refs, depth + 1) for item in value)
+        if isinstance(value, dict):
+            return (dict,) + tuple((k, _state_token(v, refs, depth + 1)) for k, v in value.items())
+        if isinstance(value, set):
+            return (set, frozenset(_state_token(item, refs, depth + 1) for item in value))
+        refs.append(value)  # Zinda rakho, warna id kisi naye object ko mil sakti hai
+        return (type(value), id(value)) + _state_token(value.__dict__, refs, depth + 1)
+    refs.append(value)
+    return (type(value), id(value))
+
+
+def _code_digest(code):
+    cached = _code_digests.get(id(code))
+    if cached is not None and cached[0] is code:
+        return cached[1]
+    h = _new_hash("code")
+    h.update(code.co_code)
+    for const in code.co_consts:
+        h.update(_code_digest(const) if isinstance(const, types.CodeType) else repr(const).encode())
+    h.update(repr(code.co_names).encode())
+    digest = h.digest()
+    _code_digests[id(code)] = (code, digest)
+    return digest
+
+
+class Fingerprinter:
+    """One hashing pass; digests of objects seen in this pass are reused."""
+
+    def __init__(self):
+        self._memo = {}
+        self._keep = []  # Pass ke dauraan objects zinda rahein, ids unique rahein
+
+    def digest(self, value, depth=0):
+        if isinstance(value, _SCALARS):
+            return repr(value).encode()
+        if isinstance(value, np.generic):
+            return repr(value.item()).encode()
+
+        key = id(value)
+        if key in self._memo:
+            return self._memo[key]
+        self._memo[key] = b"<cycle>"
+        self._keep.append(value)
+        digest = self._digest_object(value, depth)
+        self._memo[key] = digest
+        return digest
+
+    def _digest_object(self, value, depth):
+        if isinstance(value, np.ndarray):
+            return _array_digest(value)
+
+        if isinstance(value, (list, tuple)):
+            h = _new_hash(type(value).__name__)
+            for item in value:
+                h.update(self.digest(item, depth + 1))
+            return h.digest()
+
+        if isinstance(value, (set, frozenset)):
+            h = _new_hash("set")
+            for item in sorted(self.digest(item, depth + 1) for item in value):
+                h.update(item)
+            return h.digest()
+
+        if isinstance(value, dict):
+            return self._digest_items("dict", value.items(), depth)
+
+        if isinstance(value, types.FunctionType):
+            h = _new_hash("function")
+            h.update(_code_digest(value.__code__))
+            h.update(self.digest(value.__defaults__, depth + 1))
+            # Closure ke values bhi (loop ke lambda alag rang pakadte hain)
+            for cell in value.__closure__ or ():
+                try:
+                    h.update(self.digest(cell.cell_contents, depth + 1))
+                except ValueError:
+                    h.update(b"<empty>")
+            # Aur jo globals woh padhta hai (module level ke lambda)
+            for name in value.__code__.co_names:
+                if name in value.__globals__:
+                    h.update(name.encode())
+                    h.update(self.digest(value.__globals__[name], depth + 1))
+            return h.digest()
+
+        if isinstance(value, types.MethodType):
+            # self ka content uske apne mobject / animation mein hash hota hai
+            h = _new_hash("method")
+            h.update(self.digest(value.__func__, depth))
+            h.update(_qualname(type(value.__self__)).encode())
+            return h.digest()
+
+        if isinstance(value, (type, types.ModuleType, types.BuiltinFunctionType)):
+            return _qualname(value).encode()
+
+        attrs = getattr(value, "__dict__", None)
+        if attrs is None:
+            return ("%s:%r" % (_qualname(type(value)), value)).encode()
+        if hasattr(value, "submobjects"):
+            return self._digest_mobject(value, attrs)
+
+        # Animation: koi depth limit nahi (Merkle tree)
+        tree_node = hasattr(value, "run_time")
+        if not tree_node and depth > MAX_DEPTH:
+            return _qualname(type(value)).encode()
+        h = _new_hash(_qualname(type(value)))
+        h.update(self._digest_attrs("attrs", attrs.items(), 0 if tree_node else depth + 1, skip=SKIP_KEYS))
+        for sub in getattr(value, "submobjects", None) or ():
+            h.update(self.digest(sub, 0))
+        return h.digest()
+
+    def _digest_mobject(self, value, attrs):
+        names = tuple(attrs)
+        values = tuple(attrs.values())
+        try:
+            cached = _mobject_digests.get(value)
+        except TypeError:  # Unhashable mobject: cache nahi
+            cached = None
+        # Wahi attributes, wahi objects (ids), aur in-place badalne wale ka content bhi wahi?
+        hit = (
+            cached is not None and cached[0] == names
+            and len(cached[1]) == len(values) and all(map(operator.is_, cached[1], values))
+            and tuple(_small_array_token(attrs[name]) for name in cached[2]) == cached[3]
+            and all(_state_token(attrs[name], []) == token for name, token in cached[4])
+        )
+        if hit:
+            live_names, own = cached[5], cached[7]
+        else:
+            live_names, plain, arrays, others, refs = [], [], [], [], []
+            for name, item in attrs.items():
+                if name in SKIP_KEYS:
+                    continue
+                kind = type(item)
+                if kind in _SCALAR_TYPES:  # Zyadatar attributes: seedha
+                    plain.append((name, item))
+                elif kind is np.ndarray and item.nbytes <= _SMALL_ARRAY and not item.dtype.hasobject:
+                    plain.append((name, item))
+                    arrays.append(name)
+                elif _is_live(item):
+                    live_names.append(name)
+                else:
+                    plain.append((name, item))
+                    if _is_mutable(item):
+                        others.append((name, _state_token(item, refs)))
+            own = self._digest_attrs("attrs", plain, 0)
+            # Sab tuples: GC inhe baar baar scan na kare
+            entry = (
+                names, values, tuple(arrays), tuple(_small_array_token(attrs[name]) for name in arrays),
+                tuple(others), tuple(live_names), tuple(refs), own,
+            )
+            try:
+                _mobject_digests[value] = entry
+            except TypeError:
+                pass
+
+        h = _new_hash(_qualname(type(value)))
+        h.update(own)
+        if live_names:
+            h.update(self._digest_attrs("live", [(name, attrs[name]) for name in live_names], 0))
+        for sub in value.submobjects or ():
+            h.update(self.digest(sub, 0))
+        return h.digest()
+
+    def _digest_items(self, tag, items, depth, skip=()):
+        h = _new_hash(tag)
+        for name, item in sorted(items, key=lambda kv: repr(kv[0])):
+            if name in skip:
+                continue
+            h.update(repr(name).encode())
+            h.update(self.digest(item, depth + 1))
+        return h.digest()
+
+    def _digest_attrs(self, tag, items, depth, skip=()):
+        # Attribute naam hamesha str: repr wali sorting ki zaroorat nahi
+        h = _new_hash(tag)
+        for name, item in sorted(items, key=operator.itemgetter(0)):
+            if name in skip:
+                continue
+            h.update(name.encode())
+            h.update(self.digest(item, depth + 1))
+        return h.digest()
+
+    def hexdigest(self, values):
+        h = _new_hash("list")
+        for value in values:
+            h.update(self.digest(value))
+        return h.hexdigest()
+
+
+def fingerprint(*values):
+    """Hex content digest of mobjects / animations / anything, in one pass."""
+    return Fingerprinter().hexdigest(values)
+
+
+def get_hash_from_play_call(
+    scene_object,
+    camera_object,
+    animations_list,
+    current_mobjects_list,
+    *,
+    backend="cairo",
+    encoder_fingerprint="",
+    renderer_state=(),
+):
+    """Drop-in for manim's play-call hash: ``renderer_camera_animations_mobjects``.
+
+    Newer manim passes ``backend``, ``encoder_fingerprint`` and ``renderer_state``
+    as keywords; they go into the key so that a segment from another renderer
+    or encoder is never reused.
+    """
+    # Saare ek hi pass mein: animations ke target aur scene ke mobjects share hote hain
+    fp = Fingerprinter()
+    # Scene khud nahi (updaters ke closures mein hota hai; manim bhi ise skip karta hai)
+    fp._memo[id(scene_object)] = b"<scene>"
+    fp._keep.append(scene_object)
+    return "%s_%s_%s_%s" % (
+        fp.hexdigest([backend, encoder_fingerprint, renderer_state]),
+        fp.hexdigest([camera_object]),
+        fp.hexdigest(sorted(animations_list, key=str)),
+        fp.hexdigest(current_mobjects_list),
+    )
+
+
+def install():
+    """Use these fingerprints for manim's partial-movie cache names until ``uninstall()``."""
+    for name in _HASH_MODULES:
+        try:
+            module = importlib.import_module(name)
+        except ImportError:
+            continue
+        if hasattr(module, "get_hash_from_play_call") and name not in _originals:
+            _originals[name] = module.get_hash_from_play_call
+            module.get_hash_from_play_call = get_hash_from_play_call
+
+
+def uninstall():
+    """Give manim its own play-call hash back."""
+    for name, original in _originals.items():
+        importlib.import_module(name).get_hash_from_play_call = original
+    _originals.clear()
@@ -0,0 +1,161 @@
+"""
+Project:  Binary Decode / code Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize). All Rights Reserved.
+
+This code is proprietary and confidential. 
+Unauthorized copying, modification, distribution, or use of this file, 
+via any medium, is strictly prohibited.
+"""
+from manim import *
+
+# --- Ring Trail ---
+# TracedPath(dissipating_time=None) har frame ek naya point jodta hai, head
+# ruk jaaye tab bhi, aur har frame poora badhta hua path dobara stroke hota
+# hai. Lambi crawl = har frame pichle se mehenga.
+# RingTrail ke points ek fixed-size ring buffer mein:
+#   - head hila hi nahi (min_distance se kam) -> kuch nahi badla, rebuild nahi
+#   - seedhi line mein chal raha hai -> naya point nahi, aakhri point aage khisko
+#   - buffer bhara -> sabse purana point nikal jaata hai
+#   - fade_time diya -> purane points array par hi expire, aur sabse purana
+#     segment theek fade ki seema par kaata jaata hai (poora point ek saath
+#     gaayab nahi, warna seedhi run par poonchh 0 se poori lambai tak
+#     jhapakti). Baaki ki opacity umar ke hisaab se (stroke gradient)
+# Isliye per-frame kharcha aur memory dono capacity tak hi.
+
+
+class RingTrail(VMobject):
+    def __init__(
+        self,
+        traced_point_func,
+        capacity=512,
+        min_distance=0.01,
+        tolerance=1e-3,
+        fade_time=None,
+        fade_stops=8,
+        stroke_width=2,
+        stroke_color=WHITE,
+        stroke_opacity=1.0,
+        **kwargs
+    ):
+        super().__init__(
+            stroke_width=stroke_width, stroke_color=stroke_color, stroke_opacity=stroke_opacity,
+            fill_opacity=0, **kwargs
+        )
+        if capacity < 2:
+            raise ValueError("RingTrail needs a capacity of at least 2, got %r" % (capacity,))
+        self.traced_point_func = traced_point_func
+        self.capacity = capacity
+        self.min_distance = min_distance
+        self.tolerance = tolerance  # Collinear maanne ke liye sin(angle) ki hadd
+        self.fade_time = fade_time
+        self.fade_stops = fade_stops
+        self.trail_opacity = stroke_opacity
+        self.time = 0.0
+
+        self._ring = np.zeros((capacity, 3))
+        self._stamps = np.zeros(capacity)
+        self._start = 0
+        self._size = 0
+        self.add_updater(self._update_trail)
+
+    def __len__(self):
+        return self._size
+
+    # ---------------------------------------------------------
+    # RING BUFFER
+    # ---------------------------------------------------------
+    def _slot(self, k):
+        # k-th sabse purana point
+        return (self._start + k) % self.capacity
+
+    def _ordered(self):
+        return (self._start + np.arange(self._size)) % self.capacity
+
+    def _append(self, point):
+        if self._size == self.capacity:
+            self._start = (self._start + 1) % self.capacity
+            self._size -= 1
+        slot = self._slot(self._size)
+        self._ring[slot] = point
+        self._stamps[slot] = self.time
+        self._size += 1
+
+    def _push(self, point):
+        """Add ``point`` (or slide the last one along a straight run); False if nothing changed."""
+        if self._size:
+            last = self._slot(self._size - 1)
+            step = point - self._ring[last]
+            if np.linalg.norm(step) < self.min_distance:
+                return False
+            if self._size >= 2:
+                run = self._ring[last] - self._ring[self._slot(self._size - 2)]
+                lengths = np.linalg.norm(run) * np.linalg.norm(step)
+                if np.dot(run, step) > 0 and np.linalg.norm(np.cross(run, step)) <= self.tolerance * lengths:
+                    self._ring[last] = point
+                    self._stamps[last] = self.time
+                    return True
+        self._append(point)
+        return True
+
+    def _expire(self):
+        """Drop points older than ``fade_time`` and cut the oldest segment at the fade boundary."""
+        slots = self._ordered()
+        ages = self.time - self._stamps[slots]
+        alive = np.flatnonzero(ages <= self.fade_time)
+        if not len(alive):
+            changed = self._size > 0
+            self._size = 0
+            return changed
+        first = alive[0]
+        if first == 0:
+            return False
+        # Aakhri mara hua point zinda padosi ki taraf, jahan umar theek fade_time ho
+        # (slide wale point ka stamp naya hai, run ka anchor purana: beech mein linear)
+        old, new = slots[first - 1], slots[first]
+        cutoff = self.time - self.fade_time
+        t = (cutoff - self._stamps[old]) / (self._stamps[new] - self._stamps[old])
+        self._ring[old] += t * (self._ring[new] - self._ring[old])
+        self._stamps[old] = cutoff
+        self._start = old
+        self._size -= first - 1
+        return True
+
+    # ---------------------------------------------------------
+    # BUFFER -> STROKE
+    # ---------------------------------------------------------
+    def _rebuild(self):
+        slots = self._ordered()
+        if len(slots) < 2:
+            self.reset_points()
+            return self
+        points = self._ring[slots]
+        self.set_points_as_corners(points)
+        if self.fade_time is not None:
+            ages = self.time - self._stamps[slots]
+            alphas = self.trail_opacity * np.clip(1 - ages / self.fade_time, 0, 1)
+            stops = alphas[np.linspace(0, len(alphas) - 1, self.fade_stops).astype(int)]
+            # Gradient purane (pehla stop) se naye ki taraf
+            direction = points[-1] - points[0]
+            if np.linalg.norm(direction) > 0:
+                self.set_sheen_direction(normalize(direction), family=False)
+            self.set_stroke(opacity=list(stops), family=False)
+        return self
+
+    def advance(self, dt):
+        """Sample the traced point once and refresh the stroke if anything changed."""
+        self.time += dt
+        changed = self._push(np.asarray(self.traced_point_func(), dtype=float))
+        if self.fade_time is not None:
+            changed = self._expire() or changed or self._size > 0
+        if changed:
+            self._rebuild()
+        return self
+
+    def _update_trail(self, mob, dt):
+        mob.advance(dt)
+
+    def clear_trail(self):
+        self._start = 0
+        self._size = 0
+        self.reset_points()
+        return self
@@ -0,0 +1,181 @@
+"""
+Project:  Binary Decode / code Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize). All Rights Reserved.
+
+This code is proprietary and confidential. 
+Unauthorized copying, modification, distribution, or use of this file, 
+via any medium, is strictly prohibited.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+from matra_meru import matra_count
+from meru_engine import MAX_ARRAY_ROW, meru_row, meru_rows, meru_value
+
+# --- Sankhya / Lagakriya Query Engine ---
+# Pingala ke ginti wale pratyaya, ek jagah se:
+#   total(n)            n aksharon ke kul patterns        = 2^n        (Sankhya)
+#   exactly(n, k)       theek k Guru wale                 = C(n, k)    (Lagakriya)
+#   at_most(n, k)       k ya kam Guru wale                = C(n, 0) + ... + C(n, k)
+#   with_beats(b, n)    kul b matra wale (n aksharon mein, ya koi bhi length)
+#   in_range(n, a, b)   row a se row b tak (1 se, dono shamil), chahe to k Guru wale hi
+# Jawab memoized hain, aur *_batch functions numpy arrays of (n, k) lete hain.
+# Scenes ke HUD / captions bhi yahin se bante hain (sankhya_tex, lagakriya_tex).
+
+
+def _check_length(length):
+    if length < 0:
+        raise ValueError("Pattern length must be non-negative, got %r" % (length,))
+
+
+@lru_cache(maxsize=None)
+def total(length):
+    """All L/G patterns of ``length`` syllables, ``2^length``."""
+    _check_length(length)
+    return 1 << length
+
+
+@lru_cache(maxsize=4096)
+def exactly(length, gurus):
+    """Patterns of ``length`` syllables with exactly ``gurus`` Gurus."""
+    _check_length(length)
+    return meru_value(length, gurus)
+
+
+@lru_cache(maxsize=256)
+def _cumulative_row(length):
+    # Row ka running sum, ek baar ban gaya to har at_most O(1)
+    row = meru_row(length)
+    if isinstance(row, np.ndarray):
+        return tuple(int(v) for v in np.cumsum(row))
+    out = []
+    acc = 0
+    for v in row:
+        acc += v
+        out.append(acc)
+    return tuple(out)
+
+
+def at_most(length, gurus):
+    """Patterns of ``length`` syllables with at most ``gurus`` Gurus."""
+    _check_length(length)
+    if gurus < 0:
+        return 0
+    if gurus >= length:
+        return total(length)
+    return _cumulative_row(length)[gurus]
+
+
+def at_least(length, gurus):
+    """Patterns of ``length`` syllables with at least ``gurus`` Gurus."""
+    return total(length) - at_most(length, gurus - 1)
+
+
+@lru_cache(maxsize=4096)
+def with_beats(beats, length=None):
+    """Patterns worth ``beats`` matras (L = 1, G = 2), optionally of a fixed ``length``."""
+    if length is None:
+        return matra_count(beats)
+    # n akshar aur b matra: Guru ginti = b - n
+    return exactly(length, beats - length)
+
+
+def _count_below(limit, length, gurus):
+    # Kitne x < limit (x = row - 1) ke n bits mein theek k zero (Guru) bits hain
+    if limit >= 1 << length:
+        return exactly(length, gurus)
+    count = 0
+    zeros = 0
+    for pos in range(length - 1, -1, -1):
+        if (limit >> pos) & 1:
+            # Yahan 0 (Guru) rakho to neeche ke pos bits azaad
+            count += meru_value(pos, gurus - zeros - 1)
+        else:
+            zeros += 1
+            if zeros > gurus:
+                break
+    return count
+
+
+def in_range(length, start, stop, gurus=None):
+    """Rows ``start .. stop`` (1-based, inclusive), only those with ``gurus`` Gurus if given."""
+    _check_length(length)
+    start = max(start, 1)
+    stop = min(stop, total(length))
+    if start > stop:
+        return 0
+    if gurus is None:
+        return stop - start + 1
+    return _count_below(stop, length, gurus) - _count_below(start - 1, length, gurus)
+
+
+# ---------------------------------------------------------
+# BATCH: numpy arrays of (n, k)
+# ---------------------------------------------------------
+@lru_cache(maxsize=8)
+def _pascal(stop):
+    # (stop, stop + 1) table, table[n, k] = C(n, k); bahar wale khaane 0
+    big = stop - 1 > MAX_ARRAY_ROW
+    table = np.zeros((stop, stop + 1), dtype=object if big else np.int64)
+    for n, row in enumerate(meru_rows(stop)):
+        table[n, :n + 1] = row
+    table.setflags(write=False)
+    return table
+
+
+@lru_cache(maxsize=8)
+def _pascal_cumulative(stop):
+    table = np.cumsum(_pascal(stop), axis=1)
+    table.setflags(write=False)
+    return table
+
+
+def _batch_args(lengths, gurus):
+    n, k = np.broadcast_arrays(np.asarray(lengths, dtype=np.int64), np.asarray(gurus, dtype=np.int64))
+    if np.any(n < 0):
+        raise ValueError("Pattern lengths must be non-negative")
+    return n, k, (int(n.max()) + 1 if n.size else 1)
+
+
+def exactly_batch(lengths, gurus):
+    """Vectorized :func:`exactly` (int64 up to n = 66, Python ints beyond)."""
+    n, k, stop = _batch_args(lengths, gurus)
+    table = _pascal(stop)
+    inside = (k >= 0) & (k <= n)
+    out = table[n, np.clip(k, 0, stop)]
+    return np.where(inside, out, 0).astype(table.dtype)
+
+
+def at_most_batch(lengths, gurus):
+    """Vectorized :func:`at_most`."""
+    n, k, stop = _batch_args(lengths, gurus)
+    table = _pascal_cumulative(stop)
+    out = table[n, np.clip(k, 0, stop)]
+    return np.where(k < 0, 0, out).astype(table.dtype)
+
+
+def total_batch(lengths):
+    """Vectorized :func:`total` (int64 up to n = 62, Python ints beyond)."""
+    n = np.asarray(lengths, dtype=np.int64)
+    if np.any(n < 0):
+        raise ValueError("Pattern lengths must be non-negative")
+    if n.size and n.max() > 62:
+        out = np.empty(n.shape, dtype=object)
+        for pos, val in np.ndenumerate(n):
+            out[pos] = 1 << int(val)
+        return out
+    return np.left_shift(1, n)
+
+
+# ---------------------------------------------------------
+# HUD / CAPTION STRINGS
+# ---------------------------------------------------------
+def sankhya_tex(length):
+    """``"2^{8} = 256"`` for MathTex."""
+    return "2^{%d} = %d" % (length, total(length))
+
+
+def lagakriya_tex(length, gurus):
+    """``"\\binom{6}{1} = 6"`` for MathTex."""
+    return r"\binom{%d}{%d} = %d" % (length, gurus, exactly(length, gurus))
@@ -8,6 +8,9 @@ via any medium, is strictly prohibited.
 """
 from manim import *
 import numpy as np
+from akshara import laghu_guru
+from vritta_index import GANAS, gana_split, meter_name
+from pingala_power import abbreviate, climb_tex
 
 class Scene2_2_Ultimate_Snake(ThreeDScene):
     def construct(self):
@@ -20,7 +23,11 @@ class Scene2_2_Ultimate_Snake(ThreeDScene):
         # Camera starting position (Normal 2D)
         self.set_camera_orientation(phi=0 * DEGREES, theta=-90 * DEGREES)
 
-        lgg_pattern = Tex(r"L \quad -- \quad G \quad -- \quad G", font_size=60, color=BLUE_B)
+        # Shloka ki line se L/G pattern, aur usse meter ka naam + pehla gana
+        _, weights = laghu_guru("न तातो न माता न बन्धुर्न दाता", last_guru=True)
+        first_gana = GANAS[gana_split(weights).split()[0]]
+
+        lgg_pattern = Tex(r" \quad -- \quad ".join(first_gana), font_size=60, color=BLUE_B)
         lgg_pattern.to_edge(UP, buff=1.5) 
         
         self.play(Write(lgg_pattern))
@@ -28,7 +35,7 @@ class Scene2_2_Ultimate_Snake(ThreeDScene):
 
         # --- TEXT SIZE FIX ---
         # Heading size ko 20% chota kar diya (scale 0.8) taaki elegant lage
-        title = Text("Bhujangaprayatam", color=GOLD, font_size=40).scale(0.8)
+        title = Text(meter_name(weights), color=GOLD, font_size=40).scale(0.8)
         title.next_to(lgg_pattern, DOWN, buff=0.3)
         
         self.play(FadeIn(title, shift=UP*0.2))
@@ -118,21 +125,23 @@ class Scene2_2_Ultimate_Snake(ThreeDScene):
         self.play(living_snake.animate.shift(UP * 1.5).scale(0.8))
 
         # High Quality Slots
-        slots = VGroup(*[Square(side_length=0.7, color=WHITE, stroke_width=2) for _ in range(12)])
+        # Har akshar ka ek slot, aur unse bane kul patterns
+        n_slots = len(weights)
+        slots = VGroup(*[Square(side_length=0.7, color=WHITE, stroke_width=2) for _ in range(n_slots)])
         slots.arrange(RIGHT, buff=0.15)
         slots.move_to(DOWN * 0.5)
         
         # Numbers
-        slot_nums = VGroup(*[Text(str(i+1), font_size=16, font="Arial", color=GRAY_B) for i in range(12)])
+        slot_nums = VGroup(*[Text(str(i+1), font_size=16, font="Arial", color=GRAY_B) for i in range(n_slots)])
         for i, sl in enumerate(slots):
             slot_nums[i].next_to(sl, DOWN, buff=0.1)
 
         self.play(FadeIn(slots, shift=UP), FadeIn(slot_nums), run_time=1.5)
 
         # The Equation
-        eq_part1 = MathTex(r"2^{12}", font_size=80).next_to(slots, DOWN, buff=1)
+        eq_part1 = MathTex(r"2^{%d}" % n_slots, font_size=80).next_to(slots, DOWN, buff=1)
         eq_part2 = MathTex(r"=", font_size=80).next_to(eq_part1, RIGHT)
-        eq_part3 = MathTex(r"4096", font_size=90, color=GOLD).next_to(eq_part2, RIGHT)
+        eq_part3 = MathTex(abbreviate(n_slots, sep=r"\ldots "), font_size=90, color=GOLD).next_to(eq_part2, RIGHT)
 
         self.play(Write(eq_part1))
         self.play(Write(eq_part2))
@@ -141,8 +150,12 @@ class Scene2_2_Ultimate_Snake(ThreeDScene):
         self.play(TransformFromCopy(slots, eq_part3), run_time=1.5)
         self.play(Indicate(eq_part3, scale_factor=1.2, color=YELLOW))
 
+        # Pingala ka tareeka: aadha / ek kam karte hue neeche, phir square / x2 se upar
+        climb = MathTex(climb_tex(n_slots), font_size=36, color=BLUE_B).next_to(eq_part2, DOWN, buff=0.6)
+        self.play(Write(climb), run_time=2)
+
         self.wait(2)
         
         # Final Fade
 
-        self.play(FadeOut(Group(living_snake, slots, slot_nums, eq_part1, eq_part2, eq_part3, title)))
+        self.play(FadeOut(Group(living_snake, slots, slot_nums, eq_part1, eq_part2, eq_part3, climb, title)))
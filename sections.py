@@ -0,0 +1,163 @@
+"""
+Project:  Binary Decode / code Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize). All Rights Reserved.
+
+This code is proprietary and confidential. 
+Unauthorized copying, modification, distribution, or use of this file, 
+via any medium, is strictly prohibited.
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+from render_all import find_output, run_manim, save_manifest, slug
+
+# --- Section-Parallel Rendering ---
+# Ek lamba scene (ACTION 1/2/3, PART 1-4) ek hi core par shuru se ant tak
+# render hota tha. Scene apne hisson par checkpoint lagata hai:
+#   from sections import checkpoint
+#   checkpoint(self, "PART 2")
+# Normal render mein checkpoint kuch nahi karta. Driver:
+#   python sections.py bhavani_fixed.py BhavaniDivineFixed --workers 4
+#   1. ek dry pass (sab animations skip, koi frame nahi) -> har checkpoint
+#      par kitne play ho chuke the
+#   2. har section alag manim process mein: "-n start,end" se pehle ke plays
+#      bina rasterize kiye fast-forward (state wahi banti hai), phir sirf
+#      apne frames
+#   3. ffmpeg concat "-c copy" se jod do: koi re-encode nahi, lossless
+# Dhyan: fast-forward mein har skipped play ek hi bade dt mein update hota
+# hai, aur har worker construct() shuru se chalata hai -- isliye randomness
+# seeded ho, aur frame-by-frame trails (TracedPath / RingTrail) kisi section
+# ke beech mein shuru ho kar agle section tak na chalein.
+
+SECTIONS_ENV = "MATHRIZE_SECTIONS_FILE"
+_SKIP_ALL = 10 ** 9  # Dry pass: itne plays tak sab skip
+
+
+def checkpoint(scene, name):
+    """Mark the start of a render section (does nothing outside a section pass)."""
+    path = os.environ.get(SECTIONS_ENV)
+    if not path:
+        return
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"name": name, "play": scene.renderer.num_plays}, ensure_ascii=False) + "\n")
+
+
+def section_ranges(checkpoints):
+    """``(name, first_play, last_play)`` per section; the last one runs to the end (None)."""
+    marks = []
+    for mark in checkpoints:
+        # Do checkpoint bina play ke beech = khali section, pehla naam rakho
+        if marks and marks[-1]["play"] == mark["play"]:
+            continue
+        marks.append(mark)
+    if not marks or marks[0]["play"] > 0:
+        marks.insert(0, {"name": "start", "play": 0})
+    return [
+        (mark["name"], mark["play"], marks[i + 1]["play"] - 1 if i + 1 < len(marks) else None)
+        for i, mark in enumerate(marks)
+    ]
+
+
+def record_checkpoints(path, scene, work_dir, root):
+    """Run ``scene`` once with every animation skipped and return its checkpoints."""
+    marks_path = os.path.join(work_dir, "checkpoints.jsonl")
+    if os.path.exists(marks_path):
+        os.remove(marks_path)
+    args = ["render", "--dry_run", "-n", str(_SKIP_ALL), os.path.abspath(path), scene]
+    log_path = os.path.join(work_dir, "checkpoints.log")
+    returncode, _ = run_manim(args, log_path, root, {SECTIONS_ENV: marks_path})
+    if not os.path.exists(marks_path):
+        # Koi checkpoint nahi mila: scene hi fail hua, ya usne checkpoint lagaye hi nahi
+        if returncode != 0:
+            raise ValueError("Checkpoint pass failed for %s, see %s" % (scene, log_path))
+        return []
+    with open(marks_path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def join_videos(parts, output):
+    """Concatenate same-codec videos without re-encoding."""
+    if shutil.which("ffmpeg") is None:
+        raise FileNotFoundError("ffmpeg is needed to join the rendered sections")
+    list_path = output + ".txt"
+    with open(list_path, "w", encoding="utf-8") as f:
+        for part in parts:
+            f.write("file '%s'\n" % os.path.abspath(part).replace("'", "'\\''"))
+    subprocess.run(
+        ["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0", "-i", list_path,
+         "-c", "copy", "-movflags", "+faststart", output],
+        check=True,
+    )
+    os.remove(list_path)
+    return output
+
+
+def _render_section(index, section, path, scene, work_dir, root, quality, extra_args):
+    name, first, last = section
+    # Har section ka apna media folder: manim ke partial files scene naam se bante hain
+    sec_dir = os.path.join(work_dir, "sec%02d" % index)
+    os.makedirs(sec_dir, exist_ok=True)
+    media_dir = os.path.join(sec_dir, "media")
+    output = "%s__sec%02d" % (scene, index)
+    span = "%d" % first if last is None else "%d,%d" % (first, last)
+    args = ["render", "-q", quality, "--media_dir", media_dir, "-o", output, "-n", span]
+    args += list(extra_args) + [os.path.abspath(path), scene]
+    returncode, seconds = run_manim(args, os.path.join(sec_dir, "render.log"), root)
+    module = os.path.splitext(os.path.basename(path))[0]
+    return {
+        "name": name,
+        "plays": [first, last],
+        "output": find_output(media_dir, module, output) if returncode == 0 else None,
+        "returncode": returncode,
+        "seconds": round(seconds, 2),
+    }
+
+
+def render_sections(path, scene, out_dir, workers=None, quality="h", output=None, extra_args=()):
+    """Render ``scene`` section by section in parallel and join the parts into one video."""
+    root = os.path.dirname(os.path.abspath(path))
+    out_dir = os.path.abspath(out_dir)
+    output = output or scene
+    work_dir = os.path.join(out_dir, "sections", slug(output))
+    os.makedirs(work_dir, exist_ok=True)
+
+    sections = section_ranges(record_checkpoints(path, scene, work_dir, root))
+    workers = workers or os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=min(workers, len(sections))) as pool:
+        results = list(pool.map(
+            lambda item: _render_section(item[0], item[1], path, scene, work_dir, root, quality, extra_args),
+            enumerate(sections),
+        ))
+
+    report = {"file": os.path.basename(path), "scene": scene, "quality": quality, "sections": results, "output": None}
+    failed = [r["name"] for r in results if not r["output"]]
+    if not failed:
+        report["output"] = join_videos([r["output"] for r in results], os.path.join(out_dir, output + ".mp4"))
+    save_manifest(work_dir, report)
+    if failed:
+        raise ValueError("Sections failed for %s: %s (logs in %s)" % (scene, ", ".join(failed), work_dir))
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render one long scene in parallel sections and join them.")
+    parser.add_argument("file", help="scene file")
+    parser.add_argument("scene", help="scene class name")
+    parser.add_argument("-o", "--out", default="renders", help="output folder")
+    parser.add_argument("-q", "--quality", default="h", choices="lmhpk", help="manim quality flag")
+    parser.add_argument("--workers", type=int, default=None, help="parallel manim processes (default: all cores)")
+    parser.add_argument("--output", default=None, help="name of the joined video (default: scene name)")
+    args, extra = parser.parse_known_args(argv)
+
+    report = render_sections(args.file, args.scene, args.out, args.workers, args.quality, args.output, extra)
+    for r in report["sections"]:
+        print("%-30s plays %s..%s  %.1fs" % (r["name"], r["plays"][0], "end" if r["plays"][1] is None else r["plays"][1], r["seconds"]))
+    print("joined -> %s" % report["output"])
+
+
+if __name__ == "__main__":
+    main()
@@ -7,8 +7,11 @@ Unauthorized copying, modification, distribution, or use of this file,
 via any medium, is strictly prohibited.
 """
 from manim import *
+from font_resolver import best_font, has_script_font
 import numpy as np
-import random  # <--- Yeh zaruri hai particles ke liye
+from akshara import laghu_guru
+from particle_system import ParticleSystem
+from path_follow import PathFollowGroup
 
 class SnakeRhythmFinal(Scene):
     def construct(self):
@@ -21,24 +24,16 @@ class SnakeRhythmFinal(Scene):
         SNAKE_GLOW = "#FF8C00" # Orange Wave Line
 
         # --- DATA SETUP 📝 ---
-        # 12 Syllables of Bhavani Ashtakam
-        syllables = [
-            "न", "ता", "तो",   # Set 1 (L G G)
-            "न", "मा", "ता",   # Set 2 (L G G)
-            "न", "ब", "न्धु",  # Set 3 (L G G)
-            "र्न", "दा", "ता"  # Set 4 (L G G)
-        ]
+        # 12 Syllables of Bhavani Ashtakam (seedha shloka ki line se)
+        syllables, weights = laghu_guru("न तातो न माता न बन्धुर्न दाता", last_guru=True)
         
-        # Rhythm Markers
-        markers = ["|", "S", "S"] * 4 
+        # Rhythm Markers (Laghu = |, Guru = S)
+        markers = ["|" if w == "L" else "S" for w in weights]
 
         # --- FONT SETUP 🅰️ ---
-        hindi_font = "Nirmala UI"
-        try:
-            test = Text("अ", font=hindi_font)
-            font_to_use = hindi_font
-        except:
-            font_to_use = "sans-serif"
+        # Devanagari font na ho to transliterated syllables
+        font_to_use = best_font("devanagari")
+        if not has_script_font("devanagari"):
             syllables = ["Na", "Taa", "To", "Na", "Maa", "Taa", "Na", "Ban", "Dhu", "Na", "Daa", "Taa"]
 
         # ==========================================
@@ -55,7 +50,7 @@ class SnakeRhythmFinal(Scene):
 
         demo_group.arrange(RIGHT, buff=0.8)
         
-        math_label = Text("L   -   G   -   G", font_size=36, color=ORANGE_MARK)
+        math_label = Text("   -   ".join(weights[:3]), font_size=36, color=ORANGE_MARK)
         math_label.next_to(demo_group, DOWN, buff=0.5)
 
         # Animate Entry
@@ -72,7 +67,7 @@ class SnakeRhythmFinal(Scene):
 
         self.play(FadeOut(demo_group), FadeOut(math_label))
 
-        snake_body = VGroup()
+        segments = []
         for i in range(12):
             s_text = Text(syllables[i], font=font_to_use, font_size=48, color=GOLD_TEXT)
             m_text = Text(markers[i], font="Verdana", font_size=30, color=ORANGE_MARK)
@@ -80,9 +75,15 @@ class SnakeRhythmFinal(Scene):
             n_text = Text(str(i+1), font_size=20, color=GRAY)
             n_text.next_to(s_text, DOWN, buff=0.2)
 
-            segment = VGroup(s_text, m_text, n_text)
-            snake_body.add(segment)
+            segments.append(VGroup(s_text, m_text, n_text))
 
+        # Sine path aur slope: saare segments ek hi numpy call mein
+        snake_body = PathFollowGroup(
+            *segments,
+            path=lambda x: 0.8 * np.sin(2 * x),
+            slope=lambda x: np.cos(2 * x),
+            spacing=0.8, start=-4.5, tilt=0.5
+        )
         snake_body.arrange(RIGHT, buff=0.6)
         snake_body.move_to(ORIGIN)
 
@@ -109,17 +110,7 @@ class SnakeRhythmFinal(Scene):
 
         # 3. Updater Function
         def update_snake(mob):
-            phase = phase_tracker.get_value()
-            for i, segment in enumerate(mob):
-                x_pos = (i * 0.8) - 4.5
-                y_pos = 0.8 * np.sin(2 * (x_pos + phase))
-                
-                segment.move_to([x_pos, y_pos, 0])
-                
-                # Rotation logic
-                slope = np.cos(2 * (x_pos + phase))
-                angle = np.arctan(slope) * 0.5 
-                segment.rotate(angle - segment.get_angle())
+            mob.follow(phase_tracker.get_value())
 
         self.play(Create(snake_path), run_time=1)
         snake_body.add_updater(update_snake)
@@ -132,12 +123,10 @@ class SnakeRhythmFinal(Scene):
         )
 
         # 5. Particles (Ab ye chalega!)
-        particles = VGroup()
-        for _ in range(25):
-            p = Dot(color=ORANGE_MARK, radius=0.05)
-            p.move_to([random.uniform(-5, 5), random.uniform(-1, 1), 0])
-            particles.add(p)
-            
+        # Pehle jaise 25 dust dots; size = Dot(radius=0.05) ka diameter, pixel mein
+        dot_size = 0.1 * config.pixel_width / config.frame_width
+        particles = ParticleSystem.in_box(ORIGIN, [5, 1, 0], 25, colors=ORANGE_MARK, sizes=dot_size, seed=5)
+
         self.play(FadeIn(particles))
         
         # 6. Continue
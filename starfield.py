@@ -0,0 +1,92 @@
+"""
+Project:  Binary Decode / code Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize). All Rights Reserved.
+
+This code is proprietary and confidential. 
+Unauthorized copying, modification, distribution, or use of this file, 
+via any medium, is strictly prohibited.
+"""
+from manim import *
+from particle_system import ParticleSystem, sample_box
+
+# --- Starfield ---
+# Background ke taare (50-100 Dots) har frame project + rasterize hote the,
+# ambient camera rotation ke poore time bhi. Do tareeke:
+#   1. self.add(Starfield(...))      -> ek point cloud, parallax ke saath,
+#                                       har frame ek hi numpy draw
+#   2. Starfield(...).bake(self)     -> taare camera ke background mein
+#                                       likh diye; dobara sirf tab jab camera
+#                                       ek "band" (default 1 degree) se zyada
+#                                       ghoome. Baaki frames mein kharcha zero.
+#                                       Check camera.reset() mein hota hai (har
+#                                       frame wahin se shuru), scene mein koi
+#                                       updater mobject nahi, to manim ka static
+#                                       frame cache chalta rehta hai.
+# Bake ke baad camera.background_color badla to taare agle pose change par
+# hi wapas aayenge, isliye background color pehle set karo.
+
+
+def _pose_key(camera, band):
+    # Camera ki position / angles, band ke hisaab se quantize
+    pose = [camera.frame_width, *np.asarray(camera.frame_center, dtype=float)]
+    if hasattr(camera, "get_phi"):
+        pose += [camera.get_phi(), camera.get_theta(), camera.get_gamma(), camera.get_zoom()]
+    return tuple(np.floor(np.array(pose, dtype=float) / band).astype(int))
+
+
+class Starfield(ParticleSystem):
+    def __init__(
+        self,
+        count,
+        center=ORIGIN,
+        extent=(7, 4, 0),
+        size_range=(2, 5),
+        opacity_range=(0.2, 0.6),
+        colors=WHITE,
+        seed=None,
+        **kwargs
+    ):
+        rng = np.random.default_rng(seed)
+        super().__init__(
+            sample_box(center, extent, count, rng),
+            colors=colors,
+            opacities=rng.uniform(*opacity_range, count),
+            sizes=rng.uniform(*size_range, count),
+            **kwargs
+        )
+        self.band = None
+        self._baked_pose = None
+
+    def _draw_background(self, camera):
+        # Saaf background (color / image) par saare taare ek saath.
+        # Rotation matrix abhi ke pose se: camera use capture_mobjects mein hi
+        # naya karta hai, warna set_camera_orientation ke baad purana phi=0 lagta
+        if hasattr(camera, "reset_rotation_matrix"):
+            camera.reset_rotation_matrix()
+        camera.init_background()
+        background = camera.background.copy()
+        camera.display_multiple_point_cloud_mobjects(self.submobjects, background)
+        camera.background = background
+
+    def _rebake(self, camera):
+        key = _pose_key(camera, self.band)
+        if key != self._baked_pose:
+            self._baked_pose = key
+            self._draw_background(camera)
+
+    def bake(self, scene, band=1 * DEGREES):
+        """Draw the field into the camera background, redrawing only when the camera moves a band."""
+        camera = scene.camera
+        self.band = band
+        self._baked_pose = None
+        self._rebake(camera)
+        # Renderer har frame (aur static frame) camera.reset() se background par
+        # shuru karta hai; pose wahin check, updaters ke baad hi aata hai
+        reset = camera.reset
+
+        def reset_with_stars():
+            self._rebake(camera)
+            return reset()
+
+        camera.reset = reset_with_stars
+        return self
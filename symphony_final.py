@@ -8,9 +8,20 @@ via any medium, is strictly prohibited.
 """
 from manim import *
 import numpy as np
-import random
+from instanced_cubes import InstancedCubes, FadeInInstances
+from particle_system import ParticleSystem
+import render_fingerprint
 
 class SymphonyArchitectureFixed(ThreeDScene):
+    def setup(self):
+        super().setup()
+        # Bada mobject tree: manim ke JSON hash ki jagah tez Merkle fingerprint (sirf is render mein)
+        render_fingerprint.install()
+
+    def tear_down(self):
+        render_fingerprint.uninstall()
+        super().tear_down()
+
     def construct(self):
         # --- SETUP ---
         self.camera.background_color = "#050505"
@@ -86,42 +97,36 @@ class SymphonyArchitectureFixed(ThreeDScene):
         # Move Camera back
         self.move_camera(phi=75 * DEGREES, theta=45 * DEGREES, zoom=0.5, run_time=3)
 
-        # Generate Structure
-        imarat_bricks = VGroup()
+        # Generate Structure (eent ka mesh ek hi baar, har eent sirf position + color)
         layers = 6 
+        positions = []
+        colors = []
 
         for y in range(layers):
             width = layers - y
             for x in range(width):
                 for z in range(width):
                     if (x + y + z) % 2 == 0:
-                        color = BLUE_NEON
+                        colors.append(BLUE_NEON)
                     else:
-                        color = PINK_NEON
-                    
-                    b = Cube(side_length=1.0)
-                    b.set_color(color).set_opacity(0.9).set_gloss(0.5)
-                    b.set_stroke(color, width=1, opacity=0.5)
+                        colors.append(PINK_NEON)
                     
                     offset = (layers - width) * 0.5
                     pos_x = (x + offset) * 1.05 - (layers * 0.5)
                     pos_y = y * 1.05 - 2 
                     pos_z = (z + offset) * 1.05 - (layers * 0.5)
-                    
-                    b.move_to([pos_x, pos_y, pos_z])
-                    imarat_bricks.add(b)
+                    positions.append([pos_x, pos_y, pos_z])
+
+        imarat_bricks = InstancedCubes(
+            positions, side_length=1.0, colors=colors, opacities=0.9,
+            stroke_width=1, stroke_opacity=0.5, gloss=0.5
+        )
 
         self.remove(brick_blue, brick_pink)
         
-        # Animation: Construction
+        # Animation: Construction (91 FadeIn ki LaggedStart, par ek hi array update per frame)
         self.play(
-            LaggedStart(
-                *[
-                    FadeIn(b, shift=UP*5) 
-                    for b in imarat_bricks
-                ],
-                lag_ratio=0.01
-            ),
+            FadeInInstances(imarat_bricks, shift=UP*5, lag_ratio=0.01),
             run_time=4,
             rate_func=smooth # Safe function
         )
@@ -130,17 +135,13 @@ class SymphonyArchitectureFixed(ThreeDScene):
         # PART 4: CINEMATIC CLIMAX
         # ==========================================
 
-        # Floating particles
-        particles = VGroup()
-        for _ in range(30):
-            p = Dot(radius=0.05, color=GOLD_ACCENT)
-            p.move_to([
-                random.uniform(-4, 4),
-                random.uniform(-2, 5),
-                random.uniform(-4, 4)
-            ])
-            particles.add(p)
-            
+        # Floating particles (pehle jaise 30, apni jagah sthir)
+        # Size = Dot(radius=0.05) ka diameter, pixel mein
+        dot_size = 0.1 * config.pixel_width / config.frame_width
+        particles = ParticleSystem.in_box(
+            [0, 1.5, 0], [4, 3.5, 4], 30, colors=GOLD_ACCENT, sizes=dot_size, seed=3
+        )
+
         self.play(
             FadeIn(particles, shift=UP),
             run_time=2
@@ -0,0 +1,75 @@
+"""
+Project:  Binary Decode / code Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize). All Rights Reserved.
+
+This code is proprietary and confidential. 
+Unauthorized copying, modification, distribution, or use of this file, 
+via any medium, is strictly prohibited.
+"""
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from ring_trail import RingTrail
+
+# --- RingTrail fade_time ---
+# Head 3 unit/s ki seedhi line par, fade_time 0.5 -> poonchh hamesha ~1.5 unit.
+# Pehle slide + poore point ka expire poonchh ko 1.5 se 0 tak jhapkata tha.
+
+DT = 1 / 60
+
+
+def _run(speed, fade_time, seconds, direction=(1, 0, 0)):
+    head = {"t": 0.0}
+    direction = np.asarray(direction, dtype=float)
+    trail = RingTrail(lambda: head["t"] * speed * direction, fade_time=fade_time)
+    lengths = []
+    for _ in range(int(round(seconds / DT))):
+        head["t"] += DT
+        trail.advance(DT)
+        points = trail._ring[trail._ordered()]
+        lengths.append(np.linalg.norm(np.diff(points, axis=0), axis=1).sum() if len(points) > 1 else 0.0)
+    return trail, np.array(lengths)
+
+
+def test_fade_tail_length_is_steady_on_straight_run():
+    trail, lengths = _run(speed=3.0, fade_time=0.5, seconds=3.0)
+    steady = lengths[int(0.6 / DT):]
+    assert np.allclose(steady, 1.5, atol=3.0 * DT)
+    # Seedhi run: slide chalu, buffer mein sirf poonchh aur head
+    assert len(trail) == 2
+
+
+def test_fade_tail_length_is_steady_on_curve():
+    head = {"t": 0.0}
+    trail = RingTrail(lambda: np.array([np.cos(head["t"]), np.sin(head["t"]), 0.0]) * 2, fade_time=0.5)
+    lengths = []
+    for _ in range(int(round(3.0 / DT))):
+        head["t"] += DT
+        trail.advance(DT)
+        points = trail._ring[trail._ordered()]
+        lengths.append(np.linalg.norm(np.diff(points, axis=0), axis=1).sum())
+    # Speed 2 unit/s -> arc ~1.0
+    assert np.allclose(lengths[int(0.6 / DT):], 1.0, atol=0.02)
+
+
+def test_fade_tail_ages_stay_inside_fade_time():
+    trail, _ = _run(speed=3.0, fade_time=0.5, seconds=2.0)
+    ages = trail.time - trail._stamps[trail._ordered()]
+    assert ages.max() == pytest.approx(0.5)
+    assert ages.min() >= 0
+
+
+def test_stopped_head_fades_out_completely():
+    head = {"x": 0.0}
+    trail = RingTrail(lambda: np.array([head["x"], 0.0, 0.0]), fade_time=0.5)
+    for _ in range(60):
+        head["x"] += 3.0 * DT
+        trail.advance(DT)
+    assert len(trail) >= 2
+    for _ in range(int(round(0.6 / DT))):
+        trail.advance(DT)
+    # Poonchh head tak simat gayi; bacha sirf head ka akela point (koi stroke nahi)
+    assert len(trail) < 2
+    assert len(trail.points) == 0
@@ -0,0 +1,86 @@
+"""
+Project:  Binary Decode / code Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize). All Rights Reserved.
+
+This code is proprietary and confidential. 
+Unauthorized copying, modification, distribution, or use of this file, 
+via any medium, is strictly prohibited.
+"""
+from collections import namedtuple
+
+from manim import *
+
+# --- Timeline ---
+# 0.06 / 0.08 second ke 16-36 alag self.play() = har ek ka apna partial movie
+# file, hash, scene bookkeeping aur encoder start. Do second ki flicker
+# 20 second ke camera move se zyada der mein render hoti thi.
+# Timeline un chhote badlavon (color, opacity, stroke...) ko "keys" ki tarah
+# record karta hai aur ek hi animation bana deta hai -> ek play, ek file:
+#   scan = Timeline()
+#   scan.key(box, lambda m: m.set_opacity(1), 0.08)
+#   scan.key(box, lambda m: m.set_opacity(0), 0.08)
+#   scan.key(label, lambda m: m.set_color(RED), 0.08, parallel=True)
+#   self.play(scan.compile())
+# Har key ka change usi waqt (record karte hue) pichli key ke target ki copy
+# par lagta hai, isliye loop ke variables ki chinta nahi.
+
+_Key = namedtuple("_Key", "start end rate_func source target source_family target_family")
+
+
+class _KeyTrack(Animation):
+    # Ek mobject ki saari keys; waqt ke hisaab se sahi key ke beech interpolate
+    def __init__(self, mobject, keys, run_time):
+        super().__init__(mobject, run_time=run_time, rate_func=linear)
+        self.keys = keys
+        self.starts = np.array([key.start for key in keys])
+        self.family = mobject.family_members_with_points()
+
+    def interpolate_mobject(self, alpha):
+        t = alpha * self.run_time
+        key = self.keys[max(np.searchsorted(self.starts, t, side="right") - 1, 0)]
+        span = max(key.end - key.start, 1e-9)
+        a = key.rate_func(float(np.clip((t - key.start) / span, 0, 1)))
+        for mob, source, target in zip(self.family, key.source_family, key.target_family):
+            mob.interpolate(source, target, a)
+
+
+class Timeline:
+    def __init__(self):
+        self.tracks = {}  # id(mobject) -> (mobject, keys)
+        self.cursor = 0.0
+        self._last_start = 0.0
+
+    @property
+    def duration(self):
+        return self.cursor
+
+    def key(self, mobject, change, duration, rate_func=linear, parallel=False):
+        """Record ``change(mobject)`` over ``duration`` seconds, after the previous key (or with it)."""
+        start = self._last_start if parallel else self.cursor
+        mob, keys = self.tracks.setdefault(id(mobject), (mobject, []))
+        if keys and start < keys[-1].end - 1e-9:
+            raise ValueError("Overlapping keys for %r at t=%.3f" % (mobject, start))
+        source = keys[-1].target if keys else mobject.copy()
+        target = source.copy()
+        change(target)
+        keys.append(_Key(
+            start, start + duration, rate_func, source, target,
+            source.family_members_with_points(), target.family_members_with_points(),
+        ))
+        self._last_start = start
+        self.cursor = max(self.cursor, start + duration)
+        return self
+
+    def wait(self, duration):
+        self._last_start = self.cursor
+        self.cursor += duration
+        return self
+
+    def compile(self):
+        """One animation that plays every recorded key (one ``self.play``, one partial file)."""
+        if not self.tracks:
+            raise ValueError("Timeline has no keys")
+        return AnimationGroup(*[
+            _KeyTrack(mobject, keys, self.duration)
+            for mobject, keys in self.tracks.values()
+        ])
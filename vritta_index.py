@@ -0,0 +1,160 @@
+"""
+Project:  Binary Decode / code Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize). All Rights Reserved.
+
+This code is proprietary and confidential. 
+Unauthorized copying, modification, distribution, or use of this file, 
+via any medium, is strictly prohibited.
+"""
+import numpy as np
+
+from lg_codec import LAGHU, GURU, from_text, unpack
+
+# --- Vritta (Meter) Index ---
+# Packed L/G pattern (lg_codec convention: L = 1, pehla akshar = bit 0)
+# ko teen-teen aksharon ke gana mein todna, aur jaane-maane vrittas se
+# milana. Ek 3-bit code = ek gana, isliye gana table sirf 8 entries ki hai:
+#   ya-maa-taa-raa-ja-bhaa-na-sa-la-gaa
+
+GANAS = {
+    "ya": "LGG",
+    "ma": "GGG",
+    "ta": "GGL",
+    "ra": "GLG",
+    "ja": "LGL",
+    "bha": "GLL",
+    "na": "LLL",
+    "sa": "LLG",
+}
+# Gana ke baad bache akshar
+LA = "la"
+GA = "ga"
+
+# 3-bit code -> gana naam (bit 0 = gana ka pehla akshar)
+GANA_TABLE = [None] * 8
+for _name, _pattern in GANAS.items():
+    GANA_TABLE[int(from_text(_pattern))] = _name
+
+# Samavritta: har pada ka gana formula
+METERS = {
+    "Vidyunmala": "ma ma ga ga",
+    "Pramanika": "ja ra la ga",
+    "Samanika": "ra ja ga la",
+    "Indravajra": "ta ta ja ga ga",
+    "Upendravajra": "ja ta ja ga ga",
+    "Rathoddhata": "ra na ra la ga",
+    "Svagata": "ra na bha ga ga",
+    "Shalini": "ma ta ta ga ga",
+    "Bhujangaprayatam": "ya ya ya ya",
+    "Totakam": "sa sa sa sa",
+    "Sragvini": "ra ra ra ra",
+    "Drutavilambitam": "na bha bha ra",
+    "Vamshastham": "ja ta ja ra",
+    "Mattamayuram": "ma ta ya sa ga",
+    "Praharshini": "ma na ja ra ga",
+    "Rucira": "ja bha sa ja ga",
+    "Vasantatilaka": "ta bha ja ja ga ga",
+    "Malini": "na na ma ya ya",
+    "Panchachamaram": "ja ra ja ra ja ga",
+    "Mandakranta": "ma bha na ta ta ga ga",
+    "Shikharini": "ya ma na sa bha la ga",
+    "Prithvi": "ja sa ja sa ya la ga",
+    "Harini": "na sa ma ra sa la ga",
+    "Shardulavikriditam": "ma sa ja sa ta ta ga",
+    "Sragdhara": "ma ra bha na ya ya ya",
+}
+
+# Anushtubh (shloka) ka pada fixed nahi hai: 8 akshar, 5th Laghu, 6th Guru.
+# (length, mask, value): (bits & mask) == value
+RULES = {
+    "Anushtubh": (8, 0b110000, 0b010000),
+}
+
+
+def formula_to_pattern(formula):
+    """``"ya ya ya ya"`` -> ``"LGGLGGLGGLGG"``."""
+    out = []
+    for part in formula.split():
+        if part == LA:
+            out.append(LAGHU)
+        elif part == GA:
+            out.append(GURU)
+        elif part in GANAS:
+            out.append(GANAS[part])
+        else:
+            raise ValueError("Unknown gana %r" % (part,))
+    return "".join(out)
+
+
+# ---------------------------------------------------------
+# COMPILED LOOKUP: (length << 32) | bits, sorted, searchsorted se dhoondo
+# ---------------------------------------------------------
+METER_NAMES = list(METERS) + list(RULES)
+
+_exact_keys = []
+for _meter_id, _name in enumerate(METERS):
+    _pattern = formula_to_pattern(METERS[_name])
+    _exact_keys.append(((len(_pattern) << 32) | int(from_text(_pattern)), _meter_id))
+_exact_keys.sort()
+_KEYS = np.array([k for k, _ in _exact_keys], dtype=np.uint64)
+_KEY_IDS = np.array([i for _, i in _exact_keys], dtype=np.int16)
+
+
+def _lookup(bits, lengths):
+    keys = (lengths.astype(np.uint64) << np.uint64(32)) | bits
+    pos = np.searchsorted(_KEYS, keys)
+    pos = np.minimum(pos, len(_KEYS) - 1)
+    return np.where(_KEYS[pos] == keys, _KEY_IDS[pos], -1).astype(np.int16)
+
+
+def identify(patterns, lengths, last_anceps=True):
+    """Meter id per line (index into ``METER_NAMES``), ``-1`` when unknown.
+
+    ``patterns`` are packed L/G lines (uint64) and ``lengths`` their
+    syllable counts, either one int for all or one per line. With
+    ``last_anceps`` a Laghu in the last syllable may stand for a Guru, the
+    pada-end rule.
+    """
+    bits = np.asarray(patterns, dtype=np.uint64)
+    lengths = np.broadcast_to(np.asarray(lengths, dtype=np.int64), bits.shape)
+    if np.any(lengths > 32):
+        raise ValueError("identify() handles lines of up to 32 syllables")
+
+    ids = _lookup(bits, lengths)
+    if last_anceps:
+        last = np.uint64(1) << (np.maximum(lengths, 1) - 1).astype(np.uint64)
+        retry = (ids < 0) & ((bits & last) != 0)
+        if np.any(retry):
+            ids[retry] = _lookup(bits[retry] & ~last[retry], lengths[retry])
+
+    for rule_id, (length, mask, value) in enumerate(RULES.values(), start=len(METERS)):
+        hit = (ids < 0) & (lengths == length) & ((bits & np.uint64(mask)) == np.uint64(value))
+        ids[hit] = rule_id
+    return ids
+
+
+def gana_codes(patterns, length):
+    """``(..., length // 3)`` matrix of 3-bit gana codes (index into ``GANA_TABLE``)."""
+    bits = np.asarray(patterns, dtype=np.uint64)
+    shifts = np.arange(0, 3 * (length // 3), 3, dtype=np.uint64)
+    return ((bits[..., None] >> shifts) & np.uint64(7)).astype(np.uint8)
+
+
+def gana_split(pattern):
+    """One pattern (``"LGGLGG..."`` text) to its gana formula, e.g. ``"ya ya ya ya"``."""
+    chars = [c for c in pattern if not c.isspace()]
+    length = len(chars)
+    bits = from_text(chars)
+    parts = [GANA_TABLE[c] for c in gana_codes(bits, length)]
+    for s in unpack(bits, length)[3 * (length // 3):]:
+        parts.append(LA if s else GA)
+    return " ".join(parts)
+
+
+def meter_name(pattern, last_anceps=True):
+    """Name of the meter for one ``"LGG..."`` line, or ``None``."""
+    chars = [c for c in pattern if not c.isspace()]
+    if not chars or len(chars) > 32:
+        return None
+    meter_id = int(identify([from_text(chars)], len(chars), last_anceps)[0])
+    return METER_NAMES[meter_id] if meter_id >= 0 else None